@@ -0,0 +1,320 @@
+"""Benchmarks of signal generation, depot simulation and plotting on synthetic data.
+
+Every generator of signal_list(), simulated_depot() under every unit strategy and the
+three plot functions are timed on synthetic hourly bars from synthetic_prices() for
+each requested number of bars. For every benchmark the best time of several
+repetitions, the throughput in bars per second and the peak memory allocated during
+one run are recorded. The results are written as JSON to bld/benchmarks/<commit>.json,
+so the results of two commits can be compared on the same machine:
+
+    python benchmarks/benchmark_pipeline.py --bars 1000 100000 1000000
+    python benchmarks/benchmark_pipeline.py --compare bld/benchmarks/<old commit>.json
+
+"""
+
+import argparse
+import json
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from tradingstrattester.analysis.depot_results import write_depot_balances
+from tradingstrattester.analysis.plotting_functions import (
+    plot_asset_strategy,
+    plot_indicators,
+    plot_units_and_cash,
+)
+from tradingstrattester.analysis.signaling_functions import signal_list
+from tradingstrattester.analysis.simulated_depot import simulated_depot
+from tradingstrattester.config import (
+    _ID,
+    BLD,
+    INITIAL_DEPOT_CASH,
+    PLOT_MAX_POINTS,
+    START_STOCK_PRCT,
+    STRATEGIES,
+    TAC,
+    VOL_WINDOW,
+)
+from tradingstrattester.data_management.price_store import (
+    price_store_path,
+    write_prices,
+)
+from tradingstrattester.data_management.synthetic_data import synthetic_prices
+
+BENCHMARK_DIR = BLD / "benchmarks"
+
+GENERATORS = ["_random_gen", "_crossover_gen", "_RSI_gen", "_BB_gen", "_MACD_gen"]
+UNIT_STRATS = {
+    "fixed_trade_units": 1,
+    "percentage_to_value_trades": 0.05,
+    "volatility_unit_trades": 0.5,
+}
+
+
+def run_benchmarks(n_bars_list, repeat=3, seed=0):
+    """Run all benchmarks for every number of bars.
+
+    The synthetic data of each number of bars is written to the price store as the
+    asset f"60m_BENCH{n_bars}.pkl", as simulated_depot() reads the closing prices from
+    it, and removed afterwards.
+
+    Args:
+    - n_bars_list (list): Numbers of bars of the synthetic data, e.g. [1_000, 100_000, 1_000_000].
+    - repeat (int, optional): Number of timed repetitions of each benchmark. Default is 3.
+    - seed (int, optional): Seed of the synthetic data. Default is 0.
+
+    Returns:
+    - list: One dictionary per benchmark and number of bars with the keys 'benchmark', 'params', 'n_bars', 'seconds', 'bars_per_sec' and 'peak_memory_mb'.
+
+    """
+    records = []
+    for n_bars in n_bars_list:
+        data = synthetic_prices(n_bars, "60m", seed=seed)
+        id = f"60m_BENCH{n_bars}.pkl"
+        write_prices(data, id)
+        try:
+            records.extend(_benchmark_asset(data, id, repeat))
+        finally:
+            shutil.rmtree(price_store_path(id), ignore_errors=True)
+    return records
+
+
+def compare_benchmarks(old, new, threshold=0.1):
+    """Compare the throughput of two benchmark results.
+
+    Args:
+    - old (dict): Benchmark results of the reference commit, as written by main().
+    - new (dict): Benchmark results of the compared commit.
+    - threshold (float, optional): Relative loss of throughput which counts as a regression. Default is 0.1.
+
+    Returns:
+    - pandas.DataFrame: One row per benchmark of both results with the throughputs, their relative change and whether it is a regression.
+
+    """
+    keys = ["benchmark", "params", "n_bars"]
+    out = pd.DataFrame(old["results"]).merge(
+        pd.DataFrame(new["results"]),
+        on=keys,
+        suffixes=("_old", "_new"),
+    )[[*keys, "bars_per_sec_old", "bars_per_sec_new"]]
+    out["change"] = out.bars_per_sec_new / out.bars_per_sec_old - 1
+    out["regression"] = out.change < -threshold
+    return out
+
+
+def main(argv=None):
+    """Run the benchmarks from the command line and write or compare the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--bars",
+        type=int,
+        nargs="+",
+        default=[1_000, 100_000, 1_000_000],
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        default=None,
+        help="Results of a previous commit to compare the throughput with.",
+    )
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    commit = _git_commit()
+    results = {
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "results": run_benchmarks(args.bars, args.repeat, args.seed),
+    }
+
+    output = args.output or BENCHMARK_DIR / f"{commit or 'results'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as file:
+        json.dump(results, file, indent=2)
+
+    print(pd.DataFrame(results["results"]).to_string(index=False))
+    print(f"\nResults written to {output}")
+
+    if args.compare is not None:
+        with open(args.compare) as file:
+            comparison = compare_benchmarks(json.load(file), results, args.threshold)
+        print(f"\nComparison with {args.compare}:")
+        print(comparison.to_string(index=False))
+        if comparison.regression.any():
+            return 1
+    return 0
+
+
+def _benchmark_asset(data, id, repeat):
+    """Run all benchmarks on the data of one asset.
+
+    Args:
+    - data (pandas.DataFrame): The synthetic data of the asset.
+    - id (str): The identifier of the asset in the price store.
+    - repeat (int): Number of timed repetitions of each benchmark.
+
+    Returns:
+    - list: The records of all benchmarks, see run_benchmarks().
+
+    """
+    n_bars = len(data)
+    records = []
+
+    for generator in GENERATORS:
+        records.append(
+            _measure(
+                "signal_list",
+                {"generator": generator},
+                n_bars,
+                repeat,
+                lambda generator=generator: signal_list(data, generator, as_array=True),
+            ),
+        )
+
+    signal_dict = {
+        strategy: {f"signal_{id}": signal_list(data, strategy, as_array=True)}
+        for strategy in STRATEGIES
+    }
+    for unit_strat, unit_var in UNIT_STRATS.items():
+        records.append(
+            _measure(
+                "simulated_depot",
+                {"unit_strat": unit_strat},
+                n_bars,
+                repeat,
+                lambda unit_strat=unit_strat, unit_var=unit_var: simulated_depot(
+                    signal_dict,
+                    STRATEGIES[0],
+                    [id],
+                    INITIAL_DEPOT_CASH,
+                    START_STOCK_PRCT,
+                    unit_strat,
+                    unit_var,
+                    TAC,
+                    vol_window=VOL_WINDOW,
+                ),
+            ),
+        )
+
+    # The plot functions only accept configured IDs, so the depots are stored under one
+    plot_id = _ID[0]
+    with tempfile.TemporaryDirectory() as tmp:
+        depends_on = []
+        for strategy in STRATEGIES:
+            depot = simulated_depot(
+                signal_dict,
+                strategy,
+                [id],
+                INITIAL_DEPOT_CASH,
+                START_STOCK_PRCT,
+                "percentage_to_value_trades",
+                0.05,
+                TAC,
+            )
+            depends_on.append(
+                write_depot_balances(
+                    depot.balances[id.split(".")[0]],
+                    strategy,
+                    plot_id,
+                    root=Path(tmp),
+                ),
+            )
+
+        # Figures are created and serialized like by the plotting task
+        plots = {
+            "plot_asset_strategy": lambda: plot_asset_strategy(
+                data,
+                plot_id,
+                INITIAL_DEPOT_CASH,
+                depends_on,
+                max_points=PLOT_MAX_POINTS,
+            ).to_json(),
+            "plot_indicators": lambda: plot_indicators(
+                data,
+                plot_id,
+                INITIAL_DEPOT_CASH,
+                depends_on,
+            ).to_json(),
+            "plot_units_and_cash": lambda: plot_units_and_cash(
+                data,
+                plot_id,
+                depends_on,
+                max_points=PLOT_MAX_POINTS,
+            ).to_json(),
+        }
+        for name, plot in plots.items():
+            records.append(_measure(name, {}, n_bars, repeat, plot))
+
+    return records
+
+
+def _measure(benchmark, params, n_bars, repeat, func):
+    """Time func and measure its peak memory.
+
+    The first call is traced with tracemalloc, which records the peak of the memory
+    allocated by Python and numpy, and also warms up caches and compiled kernels. The
+    following repeat calls are timed without tracing.
+
+    Args:
+    - benchmark (str): Name of the benchmarked function.
+    - params (dict): Parameters of the benchmark.
+    - n_bars (int): Number of bars of the data.
+    - repeat (int): Number of timed repetitions.
+    - func (callable): The benchmark, called without arguments.
+
+    Returns:
+    - dict: The record of the benchmark, see run_benchmarks().
+
+    """
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        seconds.append(time.perf_counter() - start)
+
+    return {
+        "benchmark": benchmark,
+        "params": json.dumps(params, sort_keys=True),
+        "n_bars": n_bars,
+        "seconds": min(seconds),
+        "bars_per_sec": n_bars / min(seconds),
+        "peak_memory_mb": peak / 2**20,
+    }
+
+
+def _git_commit():
+    """Short hash of the checked out commit or None outside of a git repository."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).parent,
+            text=True,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""Functions for storing and loading the simulated depots of the strategies."""
+
+import os
+import tempfile
+
+import numpy as np
+from tradingstrattester.analysis.simulated_depot import DepotResult
+from tradingstrattester.config import BLD
+from tradingstrattester.profiling import count, profiled
+
+DEPOT_STORE = BLD / "python" / "analysis" / "depots"
+
+
+def write_depot(depot, strategy, root=DEPOT_STORE):
+    """Write the simulated depot of a strategy as one file per asset.
+
+    Args:
+    - depot (DepotResult): The simulated depot from simulated_depot().
+    - strategy (str): The name of the trading strategy, e.g. "_RSI_gen".
+    - root (pathlib.Path, optional): Root directory of the depot store. Default is bld/python/analysis/depots.
+
+    Returns:
+    - list: Paths to the written files of all assets.
+
+    """
+    return [
+        write_depot_balances(balances, strategy, f"{name}.pkl", root)
+        for name, balances in depot.balances.items()
+    ]
+
+
+def write_depot_balances(balances, strategy, id, root=DEPOT_STORE):
+    """Write the balances of one asset under one strategy to the depot store.
+
+    The (3, n) array of cash, unit and value balances is stored as a memory-mappable
+    .npy file at depot_path(strategy, id, root), which is replaced atomically, so
+    readers never see a partially written file.
+
+    Args:
+    - balances (numpy.ndarray): The (3, n) array of cash, unit and value balances, e.g. depot.balances["60m_DB"].
+    - strategy (str): The name of the trading strategy, e.g. "_RSI_gen".
+    - id (str): The identifier for the asset including the ending "[...].pkl", e.g. "60m_DB.pkl".
+    - root (pathlib.Path, optional): Root directory of the depot store. Default is bld/python/analysis/depots.
+
+    Returns:
+    - pathlib.Path: Path to the written file.
+
+    """
+    _handle_errors_balances(balances)
+    path = depot_path(strategy, id, root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent,
+        suffix=".tmp",
+        delete=False,
+    ) as file:
+        np.save(file, np.asarray(balances, dtype=np.float64))
+    os.replace(file.name, path)
+    return path
+
+
+def read_depot_balances(strategy, id, root=DEPOT_STORE):
+    """Read the balances of one asset under one strategy from the depot store.
+
+    Only the file of the requested asset is opened, and it is memory-mapped instead of
+    read, so the time and memory needed do not grow with the number of assets.
+
+    Args:
+    - strategy (str): The name of the trading strategy, e.g. "_RSI_gen".
+    - id (str): The identifier for the asset including the ending "[...].pkl", e.g. "60m_DB.pkl".
+    - root (pathlib.Path, optional): Root directory of the depot store. Default is bld/python/analysis/depots.
+
+    Returns:
+    - dict: Read-only views on the balances of the asset with the keys 'cash_dict', 'unit_dict' and 'value_dict'.
+
+    """
+    path = depot_path(strategy, id, root)
+    if not path.exists():
+        msg = f"No simulated depot stored for strategy '{strategy}' and '{id}' in {path}. Please write the depot with write_depot() first."
+        raise FileNotFoundError(msg)
+    return _read_balances(path)
+
+
+def depot_path(strategy, id, root=DEPOT_STORE):
+    """Path of the balances of one asset under one strategy in the depot store.
+
+    Args:
+    - strategy (str): The name of the trading strategy, e.g. "_RSI_gen".
+    - id (str): The identifier for the asset including the ending "[...].pkl", e.g. "60m_DB.pkl".
+    - root (pathlib.Path, optional): Root directory of the depot store. Default is bld/python/analysis/depots.
+
+    Returns:
+    - pathlib.Path: The path root/strategy/[asset name].npy, e.g. root/_RSI_gen/60m_DB.npy.
+
+    """
+    return root / strategy / f"{id.split('.')[0]}.npy"
+
+
+def load_depot_balances(path, name):
+    """Load the cash, unit and value balances of one asset from its file in the depot
+    store, e.g. a dependency of a pytask task.
+
+    Args:
+    - path (pathlib.Path): Path to the stored balances of the asset from depot_path(), e.g. bld/python/analysis/depots/_RSI_gen/60m_DB.npy.
+    - name (str): The asset name, e.g. "60m_DB".
+
+    Returns:
+    - dict: Read-only views on the balances of the asset with the keys 'cash_dict', 'unit_dict' and 'value_dict'.
+
+    Raises:
+    - ValueError: If path is not the file of the asset in the depot store.
+
+    """
+    if path.suffix != ".npy" or path.stem != name:
+        msg = f"The depot file {path} does not hold the balances of '{name}'."
+        raise ValueError(msg)
+    return _read_balances(path)
+
+
+@profiled("plotting")
+def _read_balances(path):
+    """Memory-map the balances of one asset written by write_depot_balances().
+
+    Args:
+    - path (pathlib.Path): Path to the .npy file.
+
+    Returns:
+    - dict: Read-only views on the rows of the (3, n) array.
+
+    """
+    balances = np.load(path, mmap_mode="r")
+    count("plotting", "_read_balances", bytes_read=balances.nbytes)
+    return dict(zip(DepotResult.COLUMNS, balances, strict=True))
+
+
+def _handle_errors_balances(balances):
+    """Handle type and value errors for write_depot_balances().
+
+    Raises:
+    - TypeError: If balances is not a numpy array.
+    - ValueError: If balances does not have one row per balance.
+
+    """
+    if not isinstance(balances, np.ndarray):
+        msg = f"'balances' has to be of type numpy.ndarray and not {type(balances)}."
+        raise TypeError(msg)
+    if balances.ndim != 2 or len(balances) != len(DepotResult.COLUMNS):
+        msg = f"'balances' has to be of shape (3, n) for the rows {DepotResult.COLUMNS} and not {balances.shape}."
+        raise ValueError(msg)
@@ -0,0 +1,127 @@
+"""Functions for reducing the number of points of plotted series."""
+
+import numpy as np
+import pandas as pd
+
+
+def downsample_line(index, values, max_points):
+    """Downsample a line to at most max_points points with Largest-Triangle-Three-
+    Buckets (LTTB).
+
+    LTTB keeps the first and the last point and splits the points in between into
+    equally sized buckets. From every bucket it keeps the point which spans the
+    largest triangle with the point kept from the previous bucket and the average of
+    the next bucket, so the shape of the line, including its peaks, is preserved.
+    Additionally, the global minimum and maximum are always kept. The points are
+    treated as equally spaced, i.e. gaps in the index like nights and weekends do not
+    affect the selection.
+
+    Args:
+    - index (pandas.Index): The x values of the line, e.g. data.index.
+    - values (numpy.ndarray or pandas.Series): The y values of the line, which have to be finite.
+    - max_points (int or None): Maximum number of kept points (at least 4). If None or not smaller than the number of points, the line is returned unchanged.
+
+    Returns:
+    - tuple: The index and values of the kept points.
+
+    """
+    _handle_errors_max_points(max_points)
+    values = np.asarray(values, dtype=np.float64)
+    if max_points is None or len(values) <= max_points:
+        return index, values
+
+    # Two points are reserved for the global extremes
+    kept = np.union1d(
+        _lttb_indices(values, max_points - 2),
+        [np.argmin(values), np.argmax(values)],
+    )
+    return index[kept], values[kept]
+
+
+def downsample_ohlc(data, max_points):
+    """Downsample OHLC bars to at most max_points bars by re-aggregating consecutive
+    bars.
+
+    The bars are split into max_points bins of (almost) equal numbers of bars. Each bin
+    becomes one bar with the first open, the highest high, the lowest low, the last
+    close and the summed volume of its bars, labelled with the time of its first bar.
+    Like resample_prices(), the extremes of the prices are therefore kept exactly.
+
+    Args:
+    - data (pandas.DataFrame): A DataFrame containing the financial data from data_download().
+    - max_points (int or None): Maximum number of bars (at least 4). If None or not smaller than the number of bars, the data is returned unchanged.
+
+    Returns:
+    - pandas.DataFrame: The re-aggregated bars with the columns Open, High, Low, Close and, if data has it, Volume.
+
+    """
+    _handle_errors_max_points(max_points)
+    if max_points is None or len(data) <= max_points:
+        return data
+
+    starts = np.linspace(0, len(data), max_points, endpoint=False).astype(np.int64)
+    ends = np.append(starts[1:], len(data))
+    out = {
+        "Open": data.Open.to_numpy()[starts],
+        "High": np.fmax.reduceat(data.High.to_numpy(), starts),
+        "Low": np.fmin.reduceat(data.Low.to_numpy(), starts),
+        "Close": data.Close.to_numpy()[ends - 1],
+    }
+    if "Volume" in data.columns:
+        out["Volume"] = np.add.reduceat(data.Volume.to_numpy(), starts)
+
+    return pd.DataFrame(out, index=data.index[starts])
+
+
+def _lttb_indices(values, n_out):
+    """Indices of the points kept by Largest-Triangle-Three-Buckets.
+
+    Args:
+    - values (numpy.ndarray): The y values of the line with more than n_out points.
+    - n_out (int): Number of kept points (at least 2).
+
+    Returns:
+    - numpy.ndarray: The sorted indices of the kept points, including the first and the last point.
+
+    """
+    n = len(values)
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+
+    # Bucket i holds the points edges[i] to edges[i + 1] - 1 between the first and last
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    x = np.arange(n, dtype=np.float64)
+    previous = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        next_x = x[end:next_end].mean()
+        next_y = values[end:next_end].mean()
+
+        # Twice the area of the triangles of every candidate in the bucket
+        area = np.abs(
+            (x[previous] - next_x) * (values[start:end] - values[previous])
+            - (x[previous] - x[start:end]) * (next_y - values[previous]),
+        )
+        previous = start + int(np.argmax(area))
+        kept[i + 1] = previous
+
+    return kept
+
+
+def _handle_errors_max_points(max_points):
+    """Handle type and value errors for the maximum number of points.
+
+    Raises:
+    - TypeError: If max_points is neither None nor an integer.
+    - ValueError: If max_points is smaller than 4.
+
+    """
+    if max_points is None:
+        return
+    if not isinstance(max_points, int) or isinstance(max_points, bool):
+        msg = f"'max_points' has to be None or of type int and not {type(max_points)}."
+        raise TypeError(msg)
+    if max_points < 4:
+        msg = f"'max_points' has to be at least 4 and not {max_points}."
+        raise ValueError(msg)
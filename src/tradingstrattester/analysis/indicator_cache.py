@@ -0,0 +1,117 @@
+"""Class for memoizing indicators across signal generators and sweeps."""
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+
+class IndicatorCache:
+    """Least recently used in-memory cache of indicators.
+
+    Indicators are keyed by (asset ID, indicator, parameters, data fingerprint). The
+    fingerprint is a hash of the closing prices, so one cache can be shared between
+    assets and an indicator is recomputed when the data of an asset changes. If the
+    cache holds more than maxsize indicators, the least recently used one is evicted.
+
+    The cache only lives as long as the process, e.g. for the generator parameters of
+    a parameter sweep. The pipeline memoizes whole signal lists across runs in a
+    ResultCache instead, see task_signaling.py.
+
+    The signal generators do not use the cache directly, but a view on the data of one
+    asset from bind(), which can be passed as indicators to signal_list().
+
+    Args:
+    - maxsize (int, optional): Maximum number of indicators kept in memory. Default is 64.
+
+    """
+
+    def __init__(self, maxsize=64):
+        _handle_errors_indicator_cache(maxsize)
+        self.maxsize = maxsize
+        self._memory = OrderedDict()
+
+    def bind(self, data, id=None):
+        """View on the cache for the indicators of one asset.
+
+        Args:
+        - data (pandas.DataFrame): A DataFrame containing the financial data from data_download().
+        - id (str, optional): The identifier for the asset, e.g. "60m_DB.pkl". Default is None.
+
+        Returns:
+        - _BoundIndicatorCache: A mapping from (indicator, *parameters) keys to indicators, which can be passed as indicators to signal_list().
+
+        """
+        return _BoundIndicatorCache(self, id, _fingerprint(data.Close))
+
+    def __len__(self):
+        return len(self._memory)
+
+    def __contains__(self, key):
+        return key in self._memory
+
+    def __getitem__(self, key):
+        self._memory.move_to_end(key)
+        return self._memory[key]
+
+    def __setitem__(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+
+class _BoundIndicatorCache:
+    """View on an IndicatorCache for the data of one asset.
+
+    Keys like ("rsi", 14) are extended to the full key of the cache by the asset ID
+    and the fingerprint of its data.
+
+    """
+
+    def __init__(self, cache, id, fingerprint):
+        self.cache = cache
+        self.id = id
+        self.fingerprint = fingerprint
+
+    def _key(self, key):
+        return (self.id, *key, self.fingerprint)
+
+    def __contains__(self, key):
+        return self._key(key) in self.cache
+
+    def __getitem__(self, key):
+        return self.cache[self._key(key)]
+
+    def __setitem__(self, key, value):
+        self.cache[self._key(key)] = value
+
+
+def _fingerprint(close_prices):
+    """Hash of closing prices, which identifies the data indicators are computed on.
+
+    Args:
+    - close_prices (pandas.Series): Closing prices.
+
+    Returns:
+    - str: Hexadecimal digest of the values of close_prices.
+
+    """
+    values = np.ascontiguousarray(close_prices.to_numpy(dtype=np.float64))
+    return hashlib.blake2b(values.tobytes(), digest_size=16).hexdigest()
+
+
+def _handle_errors_indicator_cache(maxsize):
+    """Handle type and value errors for IndicatorCache.
+
+    Raises:
+    - TypeError: If maxsize is not an integer.
+    - ValueError: If maxsize is smaller than 1.
+
+    """
+    if not isinstance(maxsize, int) or isinstance(maxsize, bool):
+        msg = f"'maxsize' has to be of type int and not {type(maxsize)}."
+        raise TypeError(msg)
+    if maxsize < 1:
+        msg = f"'maxsize' has to be at least 1 and not {maxsize}."
+        raise ValueError(msg)
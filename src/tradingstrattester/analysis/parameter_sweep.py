@@ -0,0 +1,171 @@
+"""Functions for evaluating grids of signal generator and depot parameters."""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+from tradingstrattester.analysis.indicator_cache import IndicatorCache
+from tradingstrattester.analysis.signaling_functions import (
+    _handle_errors_signal_list,
+    signal_list,
+)
+from tradingstrattester.analysis.simulated_depot import (
+    __handle_errors_in_sim_depot_config_vars,
+    _handle_errors_vol_window,
+    _initialize_variables,
+    _rolling_std,
+    _simulate_kernel,
+)
+
+
+def parameter_sweep(
+    data_dict,
+    generator,
+    param_grid,
+    depot_grid,
+    initial_depot_cash,
+    start_stock_prct,
+    vol_window=50,
+    indicator_cache=None,
+):
+    """Simulates the depot of every asset for every combination of generator and depot
+    parameters.
+
+    Indicators like the RSI, rolling means and standard deviations or EMAs are computed
+    once per asset and parameter value and reused by all grid points sharing them, or
+    taken from indicator_cache if it already holds them. The depots are simulated with
+    the simulation kernel of simulated_depot().
+
+    Args:
+    - data_dict (dict): A dictionary mapping asset IDs (e.g. "60m_DB.pkl") to DataFrames from data_download().
+    - generator (str): The name of the signal generator, e.g. "_RSI_gen".
+    - param_grid (dict): Maps parameter names of the generator to lists of values, e.g. {"period": [10, 14], "rsi_threshold_low": [20, 30]}. Parameters which are not in the grid keep their defaults.
+    - depot_grid (dict): Maps 'unit_strat', 'unit_var' and 'tac' to lists of values.
+    - initial_depot_cash (float): The initial depot cash value defined in the config.py file.
+    - start_stock_prct (float): The percentage indicating the portion of the initial depot value to be invested in stocks.
+    - vol_window (int, optional): Number of past closing prices used for the volatility in 'volatility_unit_trades'. Default is 50.
+    - indicator_cache (IndicatorCache, optional): Cache of the indicators, which can be shared with other sweeps or signal_list() calls. If None, a new in-memory cache is used. Default is None.
+
+    Returns:
+    - pd.DataFrame: A tidy table with one row per asset and parameter combination, containing the asset name, the generator, all grid parameters and the final depot value ('final_value').
+
+    """
+    _handle_errors_parameter_sweep(data_dict, generator, param_grid, depot_grid)
+    _handle_errors_vol_window(vol_window)
+
+    generator_params = _grid_combinations(param_grid)
+    depot_params = _grid_combinations(depot_grid)
+    for depot in depot_params:
+        __handle_errors_in_sim_depot_config_vars(
+            initial_depot_cash,
+            start_stock_prct,
+            depot["unit_strat"],
+            depot["unit_var"],
+            depot["tac"],
+        )
+
+    if indicator_cache is None:
+        indicator_cache = IndicatorCache()
+
+    records = []
+    for id, data in data_dict.items():
+        _handle_errors_signal_list(data, generator)
+
+        indicators = indicator_cache.bind(data, id)
+        rolling_std = None
+        if "volatility_unit_trades" in depot_grid["unit_strat"]:
+            rolling_std = _rolling_std(
+                data.Close.to_numpy(dtype=np.float64),
+                vol_window,
+            )
+
+        # One set of balances per asset which is overwritten by every grid point
+        cash, units, value = np.zeros((3, len(data)), dtype=np.float64)
+
+        for params in generator_params:
+            signal = signal_list(
+                data,
+                generator,
+                as_array=True,
+                indicators=indicators,
+                **params,
+            )
+            for depot in depot_params:
+                _initialize_variables(
+                    data,
+                    initial_depot_cash,
+                    start_stock_prct,
+                    units,
+                    cash,
+                    value,
+                )
+                _simulate_kernel(
+                    signal,
+                    data,
+                    depot["unit_strat"],
+                    depot["unit_var"],
+                    depot["tac"],
+                    units,
+                    cash,
+                    value,
+                    vol_window,
+                    rolling_std,
+                )
+                records.append(
+                    {
+                        "id": id.split(".")[0],
+                        "generator": generator,
+                        **params,
+                        **depot,
+                        "final_value": value[-1],
+                    },
+                )
+
+    return pd.DataFrame.from_records(records)
+
+
+def _grid_combinations(grid):
+    """Expand a parameter grid into all of its combinations.
+
+    Args:
+    - grid (dict): Maps parameter names to lists of values.
+
+    Returns:
+    - list: A list of dictionaries, one for each combination of parameter values.
+
+    """
+    return [dict(zip(grid, values)) for values in itertools.product(*grid.values())]
+
+
+def _handle_errors_parameter_sweep(data_dict, generator, param_grid, depot_grid):
+    """Handle type and value errors for parameter_sweep.
+
+    Raises:
+    - TypeError: If data_dict, param_grid or depot_grid are not dictionaries or grid values are not lists.
+    - ValueError: If data_dict is empty or depot_grid misses 'unit_strat', 'unit_var' or 'tac'.
+
+    """
+    if not isinstance(data_dict, dict):
+        msg = f"'data_dict' has to be of type dict and not {type(data_dict)}."
+        raise TypeError(msg)
+    if not data_dict:
+        msg = "'data_dict' is empty. Please specify at least one asset in data_dict."
+        raise ValueError(msg)
+
+    if not isinstance(generator, str):
+        msg = f"'generator' has to be of type str and not {type(generator)}."
+        raise TypeError(msg)
+
+    for name, grid in [("param_grid", param_grid), ("depot_grid", depot_grid)]:
+        if not isinstance(grid, dict):
+            msg = f"'{name}' has to be of type dict and not {type(grid)}."
+            raise TypeError(msg)
+        for key, values in grid.items():
+            if not isinstance(values, list):
+                msg = f"Values of '{key}' in '{name}' have to be of type list and not {type(values)}."
+                raise TypeError(msg)
+
+    for key in ["unit_strat", "unit_var", "tac"]:
+        if key not in depot_grid:
+            msg = f"'depot_grid' is missing '{key}'. Please specify a list of values for '{key}'."
+            raise ValueError(msg)
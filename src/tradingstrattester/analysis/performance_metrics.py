@@ -0,0 +1,209 @@
+"""Functions for evaluating the performance of the simulated depots."""
+
+import numpy as np
+import pandas as pd
+from tradingstrattester.data_management.price_store import PRICE_STORE, read_price_view
+
+METRICS = [
+    "total_return",
+    "annualized_return",
+    "annualized_volatility",
+    "sharpe_ratio",
+    "sortino_ratio",
+    "max_drawdown",
+    "max_drawdown_bars",
+    "max_drawdown_years",
+    "turnover",
+    "trade_count",
+    "hit_rate",
+    "exposure",
+]
+
+# Bars per year of the frequencies for an exchange with 252 trading days of 6.5 hours,
+# where yfinance starts a last, shorter 60m bar at 15:30
+PERIODS_PER_YEAR = {
+    "1m": 252 * 390,
+    "2m": 252 * 195,
+    "5m": 252 * 78,
+    "15m": 252 * 26,
+    "30m": 252 * 13,
+    "60m": 252 * 7,
+    "1d": 252,
+    "5d": 252 / 5,
+    "1wk": 52,
+    "1mo": 12,
+    "3mo": 4,
+}
+
+
+def depot_metrics(depots, periods_per_year=None, risk_free_rate=0.0):
+    """Compute performance metrics of the simulated depots of all strategies and
+    assets at once.
+
+    The balances of all strategies and assets are stacked into one matrix per balance
+    (padded with NaN after the end of shorter assets), so every metric is computed
+    for all depots by a few array operations. Returns are the relative changes of the
+    depot value between consecutive bars. Annualized metrics use the number of bars
+    per year of the frequency of each asset.
+
+    Args:
+    - depots (dict): The simulated depot from simulated_depot() of each strategy, i.e. a mapping from strategy to a mapping with 'cash_dict', 'unit_dict' and 'value_dict', which contain the balances of each asset, e.g. {"_RSI_gen": simulated_depot(...)}.
+    - periods_per_year (dict, optional): Bars per year of each asset, e.g. {"60m_EURUSD=X": 6000}, see bars_per_year(). Assets which are missing are annualized with PERIODS_PER_YEAR of their frequency, which assumes the trading hours of a stock exchange. Default is None.
+    - risk_free_rate (float, optional): Annual risk free rate subtracted from the returns in the Sharpe and Sortino ratios. Default is 0.0.
+
+    Returns:
+    - pandas.DataFrame: One row per strategy and asset (MultiIndex 'strategy', 'asset') and one column per metric in METRICS:
+        - total_return: Relative change of the depot value from the first to the last bar.
+        - annualized_return: Geometric mean return per year.
+        - annualized_volatility: Standard deviation of the returns per year.
+        - sharpe_ratio, sortino_ratio: Annualized mean excess return per standard deviation and per downside deviation of the excess returns.
+        - max_drawdown: Largest relative loss of the depot value from a previous peak.
+        - max_drawdown_bars, max_drawdown_years: Longest time the depot value stayed below a previous peak, in bars and in years.
+        - turnover: Traded value per year relative to the mean depot value, where the traded value of a bar is the change of the cash balance.
+        - trade_count: Number of bars at which the units held changed.
+        - hit_rate: Share of positive returns among the returns of bars which started with units held.
+        - exposure: Mean share of the depot value invested in the asset.
+
+    """
+    _handle_errors_depot_metrics(depots, periods_per_year, risk_free_rate)
+    keys = [
+        (strategy, asset)
+        for strategy, depot in depots.items()
+        for asset in depot["value_dict"]
+    ]
+    index = pd.MultiIndex.from_tuples(keys, names=["strategy", "asset"])
+    if not keys:
+        return pd.DataFrame(columns=METRICS, index=index, dtype=np.float64)
+
+    cash, units, value = (
+        _stack([depots[strategy][column][asset] for strategy, asset in keys])
+        for column in ["cash_dict", "unit_dict", "value_dict"]
+    )
+    periods_per_year = periods_per_year or {}
+    years = np.array(
+        [
+            periods_per_year.get(asset, PERIODS_PER_YEAR.get(asset.split("_")[0]))
+            for _, asset in keys
+        ],
+        dtype=np.float64,
+    )
+    bars = np.sum(~np.isnan(value), axis=0)
+    last = value[np.maximum(bars - 1, 0), np.arange(len(keys))]
+    valid = ~np.isnan(value[1:])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = value[1:] / value[:-1] - 1
+        n_returns = valid.sum(axis=0)
+        excess = returns - ((1 + risk_free_rate) ** (1 / years) - 1)
+
+        total_return = last / value[0] - 1
+        annualized_return = (1 + total_return) ** (years / n_returns) - 1
+        volatility = np.nanstd(returns, axis=0, ddof=1)
+        downside = np.sqrt(
+            np.nansum(np.minimum(excess, 0) ** 2, axis=0) / n_returns,
+        )
+        sharpe_ratio = np.nanmean(excess, axis=0) / volatility * np.sqrt(years)
+        sortino_ratio = np.nanmean(excess, axis=0) / downside * np.sqrt(years)
+
+        peak = np.fmax.accumulate(value, axis=0)
+        max_drawdown = np.nanmax(1 - value / peak, axis=0)
+        drawdown_bars = _longest_run(value < peak).astype(np.float64)
+
+        traded = np.nansum(np.abs(np.diff(cash, axis=0)), axis=0)
+        turnover = traded / np.nanmean(value, axis=0) * years / n_returns
+        trade_count = np.sum((np.diff(units, axis=0) != 0) & valid, axis=0)
+
+        held = (units[:-1] != 0) & valid
+        hit_rate = np.sum((returns > 0) & held, axis=0) / held.sum(axis=0)
+        exposure = np.nanmean((value - cash) / value, axis=0)
+
+    return pd.DataFrame(
+        {
+            "total_return": total_return,
+            "annualized_return": annualized_return,
+            "annualized_volatility": volatility * np.sqrt(years),
+            "sharpe_ratio": sharpe_ratio,
+            "sortino_ratio": sortino_ratio,
+            "max_drawdown": max_drawdown,
+            "max_drawdown_bars": drawdown_bars,
+            "max_drawdown_years": drawdown_bars / years,
+            "turnover": turnover,
+            "trade_count": trade_count,
+            "hit_rate": hit_rate,
+            "exposure": exposure,
+        },
+        index=index,
+    )
+
+
+def bars_per_year(id, root=PRICE_STORE):
+    """Estimate the bars per year of an asset from the time steps of its stored data.
+
+    In contrast to PERIODS_PER_YEAR, this accounts for the trading hours of the asset,
+    e.g. 60m bars of currencies, which are traded around the clock.
+
+    Args:
+    - id (str): The identifier for the asset including the ending "[...].pkl", e.g. "60m_DB.pkl".
+    - root (pathlib.Path, optional): Root directory of the price store. Default is bld/python/data.
+
+    Returns:
+    - float: Number of bars divided by the years between the first and the last bar, or PERIODS_PER_YEAR of the frequency of the asset if it has less than two bars.
+
+    """
+    index = read_price_view(id, columns=[], root=root).index
+    years = (index[-1] - index[0]) / pd.Timedelta(days=365.25) if len(index) else 0
+    if years <= 0:
+        return float(PERIODS_PER_YEAR[id.split("_")[0]])
+    return (len(index) - 1) / years
+
+
+def _stack(balances):
+    """Stack balances of different lengths as the columns of one NaN padded matrix."""
+    out = np.full((max(len(balance) for balance in balances), len(balances)), np.nan)
+    for j, balance in enumerate(balances):
+        out[: len(balance), j] = balance
+    return out
+
+
+def _longest_run(mask):
+    """Length of the longest run of True values in every column of mask."""
+    steps = np.arange(1, len(mask) + 1)[:, None]
+    # Last step before the current run of every column, which is a False value
+    last_false = np.maximum.accumulate(np.where(mask, 0, steps), axis=0)
+    return np.max(steps - last_false, axis=0, initial=0)
+
+
+def _handle_errors_depot_metrics(depots, periods_per_year, risk_free_rate):
+    """Handle type and value errors for depot_metrics().
+
+    Raises:
+    - TypeError: If depots or periods_per_year is not a dictionary or risk_free_rate is not a number.
+    - ValueError: If the frequency of an asset without periods_per_year is unknown or the balances of an asset have different lengths.
+
+    """
+    if not isinstance(depots, dict):
+        msg = f"'depots' has to be of type dict and not {type(depots)}."
+        raise TypeError(msg)
+    if periods_per_year is not None and not isinstance(periods_per_year, dict):
+        msg = f"'periods_per_year' has to be None or of type dict and not {type(periods_per_year)}."
+        raise TypeError(msg)
+    if not isinstance(risk_free_rate, int | float) or isinstance(risk_free_rate, bool):
+        msg = f"'risk_free_rate' has to be of type int or float and not {type(risk_free_rate)}."
+        raise TypeError(msg)
+
+    for strategy, depot in depots.items():
+        for asset in depot["value_dict"]:
+            if asset.split("_")[0] not in PERIODS_PER_YEAR and asset not in (
+                periods_per_year or {}
+            ):
+                msg = f"The frequency of '{asset}' is unknown. Please pass the bars per year of '{asset}' in periods_per_year."
+                raise ValueError(msg)
+            lengths = {
+                len(depot[column][asset])
+                for column in ["cash_dict", "unit_dict", "value_dict"]
+            }
+            if len(lengths) > 1:
+                msg = (
+                    f"The balances of '{asset}' of '{strategy}' have different lengths."
+                )
+                raise ValueError(msg)
@@ -2,16 +2,23 @@
 
 import math
 import pathlib
-import pickle
 
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from tradingstrattester.analysis.depot_results import load_depot_balances
+from tradingstrattester.analysis.downsampling import (
+    _handle_errors_max_points,
+    downsample_line,
+    downsample_ohlc,
+)
 from tradingstrattester.config import _ID, STRATEGIES
+from tradingstrattester.profiling import count, profiled
 
 
-def plot_asset_strategy(data, id, initial_depot_cash, depends_on):
+@profiled("plotting")
+def plot_asset_strategy(data, id, initial_depot_cash, depends_on, max_points=None):
     """Plot depot value for different strategies and asset price in the form of
     candlesticks.
 
@@ -20,6 +27,7 @@ def plot_asset_strategy(data, id, initial_depot_cash, depends_on):
         id (str): The identifier for the asset including the ending "[...].pkl", e.g. "60m_DB.pkl".
         initial_depot_cash (float): The initial depot cash value defined in the config.py file.
         depends_on (list): A list of file paths to the simulated depots for each strategy.
+        max_points (int, optional): Maximum number of points per trace, e.g. PLOT_MAX_POINTS from the config.py file. Longer depot values are downsampled with downsample_line() and the candlesticks with downsample_ohlc(). If None, all bars are plotted. Default is None.
 
     Returns:
         fig (go.Figure): The Plotly figure object containing annotated asset price candlesticks and simulated depot values for each strategy.
@@ -31,19 +39,21 @@ def plot_asset_strategy(data, id, initial_depot_cash, depends_on):
         initial_depot_cash=initial_depot_cash,
         depends_on=depends_on,
     )
+    _handle_errors_max_points(max_points)
+    count("plotting", "plot_asset_strategy", bars=len(data))
 
     fig = make_subplots(specs=[[{"secondary_y": True}]])
 
-    _add_strategy_traces(fig, data, id, depends_on)
+    _add_strategy_traces(fig, data, id, depends_on, max_points)
     _add_initial_depot_annotation(fig, initial_depot_cash)
-    _add_asset_candlesticks(fig, data, id)
+    _add_asset_candlesticks(fig, downsample_ohlc(data, max_points), id)
 
     _add_figure_layout_asset_strategy(fig, id)
 
     return fig
 
 
-def _add_strategy_traces(fig, data, id, depends_on):
+def _add_strategy_traces(fig, data, id, depends_on, max_points=None):
     """Add strategy traces to the plot.
 
     Parameters:
@@ -51,18 +61,22 @@ def _add_strategy_traces(fig, data, id, depends_on):
         data (pd.DataFrame): The DataFrame containing asset opening, high, low, and closing data from the data_download() function.
         id (str): The identifier for the asset including the ending "[...].pkl", e.g. "60m_DB.pkl".
         depends_on (list): A list of file paths to the simulated depots for each strategy.
+        max_points (int, optional): Maximum number of points per trace. If None, all points are plotted. Default is None.
 
     """
     depot_out = {}
     indicator = -1
     for strategy in STRATEGIES:
         indicator += 1
-        with open(depends_on[indicator], "rb") as file:
-            depot_out[strategy] = pickle.load(file)
+        depot_out[strategy] = load_depot_balances(
+            depends_on[indicator],
+            id.split(".")[0],
+        )
 
+        x, y = _downsampled_balance(data, depot_out[strategy]["value_dict"], max_points)
         fig.add_scatter(
-            x=data.index,
-            y=depot_out[strategy]["value_dict"][id.split(".")[0]],
+            x=x,
+            y=y,
             mode="lines",
             name=strategy,
             line={"width": 1.5},
@@ -132,30 +146,34 @@ def _add_figure_layout_asset_strategy(fig, id):
     fig.update_yaxes(title_text="<b>Asset price</b>", secondary_y=False)
 
 
-def plot_units_and_cash(data, id, depends_on):
+@profiled("plotting")
+def plot_units_and_cash(data, id, depends_on, max_points=None):
     """Plot units count and cash value for each different strategies.
 
     Parameters:
         data (pd.DataFrame): The DataFrame containing asset opening, high, low, and closing data from the data_download() function.
         id (str): The identifier for the asset including the ending "[...].pkl", e.g. "60m_DB.pkl".
         depends_on (list): A list of file paths to the simulated depots for each strategy.
+        max_points (int, optional): Maximum number of points per trace, e.g. PLOT_MAX_POINTS from the config.py file. Longer traces are downsampled with downsample_line(). If None, all bars are plotted. Default is None.
 
     Returns:
         fig (go.Figure): The Plotly figure object containing units count and cash value.
 
     """
     _handle_errors_in_plot_functions(data=data, id=id, depends_on=depends_on)
+    _handle_errors_max_points(max_points)
+    count("plotting", "plot_units_and_cash", bars=len(data))
 
     fig = make_subplots(specs=[[{"secondary_y": True}]])
 
-    _add_unit_and_cash_traces(fig, data, id, depends_on)
+    _add_unit_and_cash_traces(fig, data, id, depends_on, max_points)
 
     _add_figure_layout_unit_and_cash(fig, id)
 
     return fig
 
 
-def _add_unit_and_cash_traces(fig, data, id, depends_on):
+def _add_unit_and_cash_traces(fig, data, id, depends_on, max_points=None):
     """Add units and cash traces to the plot.
 
     Parameters:
@@ -163,23 +181,27 @@ def _add_unit_and_cash_traces(fig, data, id, depends_on):
         data (pd.DataFrame): The DataFrame containing asset opening, high, low, and closing data from the data_download() function.
         id (str): The identifier for the asset including the ending "[...].pkl", e.g. "60m_DB.pkl".
         depends_on (list): A list of file paths to the simulated depots for each strategy.
+        max_points (int, optional): Maximum number of points per trace. If None, all points are plotted. Default is None.
 
     """
     depot_out = {}
     indicator = -1
     for strategy in STRATEGIES:
         indicator += 1
-        with open(depends_on[indicator], "rb") as file:
-            depot_out[strategy] = pickle.load(file)
+        depot_out[strategy] = load_depot_balances(
+            depends_on[indicator],
+            id.split(".")[0],
+        )
 
         color = px.colors.qualitative.Plotly[
             indicator % len(px.colors.qualitative.Plotly)
         ]
 
         # Cash trace
+        x, y = _downsampled_balance(data, depot_out[strategy]["cash_dict"], max_points)
         fig.add_scatter(
-            x=data.index,
-            y=depot_out[strategy]["cash_dict"][id.split(".")[0]],
+            x=x,
+            y=y,
             mode="lines",
             name=f"Cash{strategy}",
             line={"width": 1, "color": color},
@@ -187,9 +209,10 @@ def _add_unit_and_cash_traces(fig, data, id, depends_on):
         )
 
         # Unit trace
+        x, y = _downsampled_balance(data, depot_out[strategy]["unit_dict"], max_points)
         fig.add_scatter(
-            x=data.index,
-            y=depot_out[strategy]["unit_dict"][id.split(".")[0]],
+            x=x,
+            y=y,
             mode="lines",
             name=f"Unit{strategy}",
             line={"shape": "linear", "dash": "dot", "width": 1.5, "color": color},
@@ -197,6 +220,21 @@ def _add_unit_and_cash_traces(fig, data, id, depends_on):
         )
 
 
+def _downsampled_balance(data, balance, max_points):
+    """Downsample the balance of a depot to its plotted points.
+
+    Parameters:
+        data (pd.DataFrame): The DataFrame containing the financial data of the asset, whose index are the time steps of the balance.
+        balance (np.ndarray): Cash, units or value of the depot for each time step.
+        max_points (int or None): Maximum number of points. If None, all points are returned.
+
+    Returns:
+        tuple: The time steps and values of the plotted points.
+
+    """
+    return downsample_line(data.index[: len(balance)], balance, max_points)
+
+
 def _add_figure_layout_unit_and_cash(fig, id):
     """Add layout to the asset strategy figure.
 
@@ -215,6 +253,7 @@ def _add_figure_layout_unit_and_cash(fig, id):
     fig.update_yaxes(title_text="<b>Units count</b>", secondary_y=False)
 
 
+@profiled("plotting")
 def plot_indicators(data, id, initial_depot_cash, depends_on):
     """Plot indicators for different strategies and no strategy (i.e. investing all the
     cash at the beginning of the investing period).
@@ -235,6 +274,7 @@ def plot_indicators(data, id, initial_depot_cash, depends_on):
         initial_depot_cash=initial_depot_cash,
         depends_on=depends_on,
     )
+    count("plotting", "plot_indicators", bars=len(data))
     fig = go.Figure()
 
     start_units = math.floor(initial_depot_cash / data.Close.iloc[1])
@@ -317,13 +357,15 @@ def _add_strategy_indicators(fig, id, depends_on, initial_depot_cash):
     indicator = -1
     for index, strategy in enumerate(STRATEGIES, start=1):
         indicator += 1
-        with open(depends_on[indicator], "rb") as file:
-            depot_out[strategy] = pickle.load(file)
+        depot_out[strategy] = load_depot_balances(
+            depends_on[indicator],
+            id.split(".")[0],
+        )
 
         fig.add_trace(
             go.Indicator(
                 mode="number+gauge+delta",
-                value=depot_out[strategy]["value_dict"][id.split(".")[0]][-1],
+                value=depot_out[strategy]["value_dict"][-1],
                 delta={"reference": initial_depot_cash},
                 domain={
                     "x": [0.15, 1],
@@ -336,13 +378,13 @@ def _add_strategy_indicators(fig, id, depends_on, initial_depot_cash):
                         "range": [
                             math.ceil(
                                 min(
-                                    depot_out[strategy]["value_dict"][id.split(".")[0]],
+                                    depot_out[strategy]["value_dict"],
                                 )
                                 * 0.95,
                             ),
                             math.ceil(
                                 max(
-                                    depot_out[strategy]["value_dict"][id.split(".")[0]],
+                                    depot_out[strategy]["value_dict"],
                                 )
                                 * 1.05,
                             ),
@@ -357,7 +399,7 @@ def _add_strategy_indicators(fig, id, depends_on, initial_depot_cash):
                         {
                             "range": [
                                 min(
-                                    depot_out[strategy]["value_dict"][id.split(".")[0]],
+                                    depot_out[strategy]["value_dict"],
                                 ),
                                 initial_depot_cash,
                             ],
@@ -367,7 +409,7 @@ def _add_strategy_indicators(fig, id, depends_on, initial_depot_cash):
                             "range": [
                                 initial_depot_cash,
                                 max(
-                                    depot_out[strategy]["value_dict"][id.split(".")[0]],
+                                    depot_out[strategy]["value_dict"],
                                 ),
                             ],
                             "color": "lightgreen",
@@ -507,7 +549,7 @@ def _handle_depends_on_errors(depends_on):
     """Helper function to handle errors related to depends_on parameter.
 
     Raises:
-        TypeError: If depends_on is not a list or if its elements are not instances of pathlib.WindowsPath.
+        TypeError: If depends_on is not a list or if its elements are not instances of pathlib.Path.
 
     """
     if not isinstance(depends_on, list):
@@ -515,8 +557,8 @@ def _handle_depends_on_errors(depends_on):
         raise TypeError(msg)
 
     for item in depends_on:
-        if not isinstance(item, pathlib.WindowsPath):
-            msg = f"Each element in 'depends_on' must be an instance of pathlib.WindowsPath and not {type(depends_on[item])}."
+        if not isinstance(item, pathlib.Path):
+            msg = f"Each element in 'depends_on' must be an instance of pathlib.Path and not {type(item)}."
             raise TypeError(
                 msg,
             )
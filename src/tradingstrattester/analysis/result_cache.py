@@ -0,0 +1,216 @@
+"""Class for reusing signal lists and depot results computed on the same inputs."""
+
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from tradingstrattester.config import BLD, RESULT_CACHE_SIZE
+
+RESULT_CACHE = BLD / "python" / "results"
+
+
+class ResultCache:
+    """Content-addressed on-disk cache of results with least recently used eviction.
+
+    Results are stored under keys from result_key(), i.e. hashes of everything a
+    result is computed from: the price data and signals, the parameters, e.g. the
+    signal generator or the depot configuration, and the source code of the computing
+    function. Results computed before are therefore found again after the inputs were
+    changed and changed back, e.g. when switching between values of UNIT_VAR.
+
+    Every result is pickled to its own file in directory, so the cache is shared
+    between processes, e.g. pytask tasks. Reading a result marks it as recently used.
+    If the files exceed max_bytes after a result was added, the least recently used
+    results are evicted until they fit again.
+
+    Args:
+    - directory (pathlib.Path, optional): Directory of the cached results. Default is bld/python/results.
+    - max_bytes (int, optional): Maximum size of all cached results in bytes. Default is RESULT_CACHE_SIZE from the config.py file.
+
+    """
+
+    def __init__(self, directory=RESULT_CACHE, max_bytes=RESULT_CACHE_SIZE):
+        _handle_errors_result_cache(max_bytes)
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def memoize(self, key, func, *args, **kwargs):
+        """Cached result of key, or the result of func(*args, **kwargs) added as key.
+
+        Args:
+        - key (str): The key of the result from result_key().
+        - func (callable): Function computing the result if it is not cached.
+        - *args, **kwargs: Arguments passed to func.
+
+        Returns:
+        - object: The cached or computed result.
+
+        """
+        try:
+            return self[key]
+        except KeyError:
+            result = func(*args, **kwargs)
+            self[key] = result
+            return result
+
+    def nbytes(self):
+        """Size of all cached results in bytes."""
+        return sum(size for _, size, _ in self._entries())
+
+    def __len__(self):
+        return len(self._entries())
+
+    def __contains__(self, key):
+        return self._path(key).exists()
+
+    def __getitem__(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                value = pickle.load(file)
+            os.utime(path)
+        except FileNotFoundError:
+            # Not cached or evicted by another process in the meantime
+            raise KeyError(key) from None
+        return value
+
+    def __setitem__(self, key, value):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Written to a temporary file first, so readers never see a partial file
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory,
+            suffix=".tmp",
+            delete=False,
+        ) as file:
+            pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(file.name, self._path(key))
+        self._evict()
+
+    def __delitem__(self, key):
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            raise KeyError(key) from None
+
+    def clear(self):
+        """Remove all cached results."""
+        for path, _, _ in self._entries():
+            path.unlink(missing_ok=True)
+
+    def _evict(self):
+        """Remove the least recently used results until all results fit max_bytes."""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def _entries(self):
+        """Path, size and time of last use of every cached result."""
+        entries = []
+        for path in self.directory.glob("*.pkl"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime_ns))
+        return entries
+
+    def _path(self, key):
+        """Path of the pickled result of key."""
+        return self.directory / f"{key}.pkl"
+
+
+def result_key(func, *inputs, **params):
+    """Key of the result of func computed from inputs with params.
+
+    Args:
+    - func (callable): Function computing the result, e.g. simulated_depot. Its name and the source code of its module are part of the key, so results are recomputed after the code changed.
+    - *inputs: Data the result is computed from, e.g. price data as pandas.DataFrame or signals as numpy.ndarray.
+    - **params: Further parameters of the result, e.g. strategy="_RSI_gen" or tac=0.0005.
+
+    Returns:
+    - str: Hexadecimal digest identifying the result.
+
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{func.__module__}.{func.__qualname__}".encode())
+    digest.update(_source_fingerprint(func.__module__).encode())
+    for value in inputs:
+        digest.update(fingerprint(value).encode())
+    digest.update(fingerprint(params).encode())
+    return digest.hexdigest()
+
+
+def fingerprint(value):
+    """Hash of price data, signals or parameters.
+
+    Args:
+    - value (pandas.DataFrame, pandas.Series, numpy.ndarray, list or dict): The value to hash. Lists and dictionaries may contain any values with a deterministic repr(), e.g. strings and numbers.
+
+    Returns:
+    - str: Hexadecimal digest of value.
+
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(value, pd.Series | pd.DataFrame):
+        frame = value.to_frame() if isinstance(value, pd.Series) else value
+        index = frame.index
+        digest.update(repr([str(col) for col in frame.columns]).encode())
+        if isinstance(index, pd.DatetimeIndex):
+            digest.update(f"{index.tz}{index.unit}".encode())
+            digest.update(_array_bytes(index.asi8))
+        else:
+            digest.update(_array_bytes(index.to_numpy()))
+        for col in frame.columns:
+            digest.update(_array_bytes(frame[col].to_numpy()))
+    elif isinstance(value, np.ndarray):
+        digest.update(_array_bytes(value))
+    elif isinstance(value, dict):
+        digest.update(repr(sorted(value.items())).encode())
+    else:
+        digest.update(repr(value).encode())
+    return digest.hexdigest()
+
+
+def _array_bytes(values):
+    """Bytes of the dtype, shape and values of an array."""
+    if values.dtype == object:
+        return repr(values.tolist()).encode()
+    values = np.ascontiguousarray(values)
+    return f"{values.dtype.str}{values.shape}".encode() + values.tobytes()
+
+
+@functools.cache
+def _source_fingerprint(module):
+    """Hash of the source code of a module, which is empty if it is not available."""
+    try:
+        source = inspect.getsource(sys.modules[module])
+    except (KeyError, OSError, TypeError):
+        source = ""
+    return hashlib.blake2b(source.encode(), digest_size=16).hexdigest()
+
+
+def _handle_errors_result_cache(max_bytes):
+    """Handle type and value errors for ResultCache.
+
+    Raises:
+    - TypeError: If max_bytes is not an integer.
+    - ValueError: If max_bytes is negative.
+
+    """
+    if not isinstance(max_bytes, int) or isinstance(max_bytes, bool):
+        msg = f"'max_bytes' has to be of type int and not {type(max_bytes)}."
+        raise TypeError(msg)
+    if max_bytes < 0:
+        msg = f"'max_bytes' has to be at least 0 and not {max_bytes}."
+        raise ValueError(msg)
@@ -1,43 +1,63 @@
 """Functions for indicating when to buy, sell or do nothing."""
 import numpy as np
 import pandas as pd
+from tradingstrattester.profiling import count, profiled
 
 
-def signal_list(data, generator):
+@profiled("signaling")
+def signal_list(
+    data,
+    generator,
+    as_array=False,
+    random_mode="compat",
+    indicators=None,
+    **generator_kwargs,
+):
     """Generates a signal list based on the asset data from data_download() using a
     specified signal generator.
 
     Parameters:
     - data (pandas.DataFrame): A DataFrame containing the financial data from data_download().
     - generator (str): The name of the signal generator function to use.
+    - as_array (bool, optional): If True, the signals are returned as a compact np.int8 array instead of a list. Default is False.
+    - random_mode (str, optional): Sampling mode of "_random_gen", either "compat" or "batched". See _random_signal_gen(). Default is "compat".
+    - indicators (dict or mapping, optional): Storage for memoizing indicators (RSI, rolling mean and standard deviation, EMAs) of data between calls with different generator parameters. Either a dict, which may only be passed for the same data, or a view on an IndicatorCache from IndicatorCache.bind(data, id). Default is None.
+    - **generator_kwargs: Parameters passed to the signal generator, e.g. period=10 for "_RSI_gen" or window=30 for "_BB_gen".
 
     Returns:
-    - list: A list of signals generated (either 0,1, or 2) based on the specified signal generator:
+    - list or numpy.ndarray: Signals generated (either 0,1, or 2) based on the specified signal generator:
         - 1 for a bearish pattern, i.e. sell
         - 2 for a bullish pattern, i.e. buy
         - 0 for no clear pattern, i.e. do nothing
 
     """
     _handle_errors_signal_list(data, generator)
-
-    signal = []
+    count("signaling", "signal_list", bars=len(data))
 
     if generator == "_random_gen":
-        signal = _random_signal_gen(data)
+        signal = _random_signal_array(
+            data,
+            random_mode=random_mode,
+            **generator_kwargs,
+        )
 
     if generator == "_crossover_gen":
-        signal = _crossover_signal_gen(data)
+        signal = _crossover_signal_array(data, **generator_kwargs)
 
     if generator == "_RSI_gen":
-        signal = _rsi_signal_gen(data)
+        signal = _rsi_signal_array(data, indicators=indicators, **generator_kwargs)
 
     if generator == "_BB_gen":
-        signal = _bollinger_bands_signal_gen(data)
+        signal = _bollinger_bands_signal_array(
+            data,
+            indicators=indicators,
+            **generator_kwargs,
+        )
 
     if generator == "_MACD_gen":
-        signal = _macd_signal_gen(data)
+        signal = _macd_signal_array(data, indicators=indicators, **generator_kwargs)
 
-    return signal
+    return signal if as_array is True else signal.tolist()
 
 
 # Signal generator functions
@@ -47,6 +67,8 @@ def _random_signal_gen(
     prob_one=0.15,
     prob_two=0.15,
     reproducible_rng_signal=True,
+    random_mode="compat",
+    seed=0,
 ):
     """Generates a random signal with specified probabilities using a random number
     generator.
@@ -56,6 +78,8 @@ def _random_signal_gen(
     - prob_one (float): Probability of generating 1.
     - prob_two (float): Probability of generating 2.
     - reproducible_rng_signal(True or False): Boolean signaling if the outcome is reproducible. If True, the outcome is reproducible.
+    - random_mode (str, optional): Either "compat" or "batched". "compat" reproduces the signals of a random number generator seeded with the index of each time step. "batched" draws the whole series at once from a single generator seeded with seed. Default is "compat".
+    - seed (int, optional): Seed of the generator in "batched" mode. Default is 0.
 
     Returns:
     - int: An integer representing the randomly generated signal:
@@ -64,18 +88,15 @@ def _random_signal_gen(
            - 0 for no clear pattern, i.e. do nothing
 
     """
-    _handle_errors_random_signal_gen(prob_zero, prob_one, prob_two)
-
-    signal = []
-
-    for i in range(len(data)):
-        if reproducible_rng_signal is True:
-            rng = np.random.default_rng(i)
-        else:
-            rng = np.random.default_rng()
-        signal.append(rng.choice([0, 1, 2], p=[prob_zero, prob_one, prob_two]))
-
-    return signal
+    return _random_signal_array(
+        data,
+        prob_zero,
+        prob_one,
+        prob_two,
+        reproducible_rng_signal,
+        random_mode,
+        seed,
+    ).tolist()
 
 
 def _crossover_signal_gen(data):
@@ -92,40 +113,7 @@ def _crossover_signal_gen(data):
            - 0 for no clear pattern, i.e. do nothing
 
     """
-    signals = [0]  # Initialize with no clear pattern for the first data point
-
-    for i in range(1, len(data)):
-        current_bar = data.iloc[i]
-        previous_bar = data.iloc[i - 1]
-
-        open_price = current_bar["Open"]
-        close_price = current_bar["Close"]
-        previous_open = previous_bar["Open"]
-        previous_close = previous_bar["Close"]
-
-        # Bearish Pattern
-        if (
-            open_price > close_price
-            and previous_open < previous_close
-            and close_price < previous_open
-            and open_price >= previous_close
-        ):
-            signals.append(1)  # Sell signal
-
-        # Bullish Pattern
-        elif (
-            open_price < close_price
-            and previous_open > previous_close
-            and close_price > previous_open
-            and open_price <= previous_close
-        ):
-            signals.append(2)  # Buy signal
-
-        # No clear pattern
-        else:
-            signals.append(0)  # No signal
-
-    return signals
+    return _crossover_signal_array(data).tolist()
 
 
 def _rsi_signal_gen(data, rsi_threshold_low=30, rsi_threshold_high=70, period=14):
@@ -144,30 +132,12 @@ def _rsi_signal_gen(data, rsi_threshold_low=30, rsi_threshold_high=70, period=14
       - 2: Buy signal (RSI below rsi_threshold_low).
 
     """
-    _handle_errors_rsi(rsi_threshold_low, rsi_threshold_high, period)
-    close_prices = data.Close
-    deltas = close_prices.diff()
-
-    gain = deltas.where(deltas > 0, 0)
-    loss = -deltas.where(deltas < 0, 0)
-
-    avg_gain = gain.rolling(window=period, min_periods=1).mean()
-    avg_loss = loss.rolling(window=period, min_periods=1).mean()
-
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
-
-    signal = []
-
-    for val in rsi:
-        if val < rsi_threshold_low:
-            signal.append(2)  # Buy signal
-        elif val > rsi_threshold_high:
-            signal.append(1)  # Sell signal
-        else:
-            signal.append(0)  # No signal
-
-    return signal
+    return _rsi_signal_array(
+        data,
+        rsi_threshold_low,
+        rsi_threshold_high,
+        period,
+    ).tolist()
 
 
 def _bollinger_bands_signal_gen(data, window=20, num_std_dev=1.5):
@@ -185,22 +155,7 @@ def _bollinger_bands_signal_gen(data, window=20, num_std_dev=1.5):
       - 2: Sell signal (price above upper band).
 
     """
-    _handle_errors_bb(window, num_std_dev)
-    rolling_mean = data.Close.rolling(window=window).mean()
-    upper_band = rolling_mean + (data.Close.rolling(window=window).std() * num_std_dev)
-    lower_band = rolling_mean - (data.Close.rolling(window=window).std() * num_std_dev)
-
-    signal = []
-
-    for i in range(len(data)):
-        if data.Close.iloc[i] < lower_band.iloc[i]:
-            signal.append(1)  # Buy signal
-        elif data.Close.iloc[i] > upper_band.iloc[i]:
-            signal.append(2)  # Sell signal
-        else:
-            signal.append(0)  # No signal
-
-    return signal
+    return _bollinger_bands_signal_array(data, window, num_std_dev).tolist()
 
 
 def _macd_signal_gen(
@@ -225,6 +180,206 @@ def _macd_signal_gen(
       - 1: Buy signal (MACD above signal line plus threshold).
       - 2: Sell signal (MACD below signal line minus threshold).
 
+    """
+    return _macd_signal_array(
+        data,
+        fast_period,
+        slow_period,
+        signal_period,
+        threshold_multiplier,
+    ).tolist()
+
+
+# Vectorized signal generator backend
+def _random_signal_array(
+    data,
+    prob_zero=0.7,
+    prob_one=0.15,
+    prob_two=0.15,
+    reproducible_rng_signal=True,
+    random_mode="compat",
+    seed=0,
+):
+    """Vectorized backend of _random_signal_gen.
+
+    Parameters:
+    - data (pandas.DataFrame): A DataFrame containing the financial data from data_download().
+    - prob_zero (float): Probability of generating 0.
+    - prob_one (float): Probability of generating 1.
+    - prob_two (float): Probability of generating 2.
+    - reproducible_rng_signal(True or False): Boolean signaling if the outcome is reproducible. If True, the outcome is reproducible.
+    - random_mode (str, optional): Either "compat" or "batched". Default is "compat".
+    - seed (int, optional): Seed of the generator in "batched" mode. Default is 0.
+
+    Returns:
+    - numpy.ndarray: An np.int8 array of randomly generated signals (0, 1 or 2).
+
+    """
+    _handle_errors_random_signal_gen(prob_zero, prob_one, prob_two)
+    _handle_errors_random_mode(random_mode)
+
+    if random_mode == "batched":
+        rng = np.random.default_rng(seed if reproducible_rng_signal is True else None)
+        signal = rng.choice(3, size=len(data), p=[prob_zero, prob_one, prob_two])
+        return signal.astype(np.int8)
+
+    if reproducible_rng_signal is True:
+        uniform_samples = _compat_uniform_samples(len(data))
+    else:
+        uniform_samples = np.random.default_rng().random(len(data))
+
+    # Same inverse transform as Generator.choice(), i.e. bit-for-bit the signals which
+    # choice() with these probabilities draws from a generator seeded with i
+    cdf = np.cumsum([prob_zero, prob_one, prob_two], dtype=np.float64)
+    cdf /= cdf[-1]
+
+    return cdf.searchsorted(uniform_samples, side="right").astype(np.int8)
+
+
+_COMPAT_UNIFORM_SAMPLES = np.empty(0, dtype=np.float64)
+
+
+def _compat_uniform_samples(length):
+    """Lookup table of the first uniform sample of np.random.default_rng(i) for every
+    index i.
+
+    The table is cached for the lifetime of the process and only extended if a longer
+    series is requested, so every generator is constructed at most once.
+
+    Parameters:
+    - length (int): Number of time steps the samples are needed for.
+
+    Returns:
+    - numpy.ndarray: Read-only array of uniform samples of length 'length'.
+
+    """
+    global _COMPAT_UNIFORM_SAMPLES
+
+    cached = len(_COMPAT_UNIFORM_SAMPLES)
+    if length > cached:
+        extension = np.fromiter(
+            (np.random.default_rng(i).random() for i in range(cached, length)),
+            dtype=np.float64,
+            count=length - cached,
+        )
+        _COMPAT_UNIFORM_SAMPLES = np.concatenate([_COMPAT_UNIFORM_SAMPLES, extension])
+        _COMPAT_UNIFORM_SAMPLES.flags.writeable = False
+
+    return _COMPAT_UNIFORM_SAMPLES[:length]
+
+
+def _crossover_signal_array(data):
+    """Vectorized backend of _crossover_signal_gen.
+
+    Parameters:
+    - data (pandas.DataFrame): A DataFrame containing the financial data from data_download().
+
+    Returns:
+    - numpy.ndarray: An np.int8 array of crossover signals (0, 1 or 2).
+
+    """
+    open_price = data.Open.to_numpy()[1:]
+    close_price = data.Close.to_numpy()[1:]
+    previous_open = data.Open.to_numpy()[:-1]
+    previous_close = data.Close.to_numpy()[:-1]
+
+    bearish = (
+        (open_price > close_price)
+        & (previous_open < previous_close)
+        & (close_price < previous_open)
+        & (open_price >= previous_close)
+    )
+    bullish = (
+        (open_price < close_price)
+        & (previous_open > previous_close)
+        & (close_price > previous_open)
+        & (open_price <= previous_close)
+    )
+
+    # The first data point has no previous bar and therefore no clear pattern
+    signal = np.zeros(len(data), dtype=np.int8)
+    signal[1:] = _masks_to_signal(bearish, bullish)
+
+    return signal
+
+
+def _rsi_signal_array(
+    data,
+    rsi_threshold_low=30,
+    rsi_threshold_high=70,
+    period=14,
+    indicators=None,
+):
+    """Vectorized backend of _rsi_signal_gen.
+
+    Parameters:
+    - data (pandas.DataFrame): A DataFrame containing the financial data from data_download().
+    - rsi_threshold_low (int, optional): The lower threshold for RSI indicating a buy signal. Default is 30.
+    - rsi_threshold_high (int, optional): The higher threshold for RSI indicating a sell signal. Default is 70.
+    - period (int, optional): The period used for calculating RSI. Default is 14.
+    - indicators (dict, optional): Storage for memoizing the RSI. Default is None.
+
+    Returns:
+    - numpy.ndarray: An np.int8 array of RSI signals (0, 1 or 2).
+
+    """
+    _handle_errors_rsi(rsi_threshold_low, rsi_threshold_high, period)
+    rsi = _memoized(indicators, ("rsi", period), _rsi, data.Close, period)
+
+    # RSI above the high threshold is a sell signal, below the low threshold a buy signal
+    return _masks_to_signal(rsi > rsi_threshold_high, rsi < rsi_threshold_low)
+
+
+def _bollinger_bands_signal_array(data, window=20, num_std_dev=1.5, indicators=None):
+    """Vectorized backend of _bollinger_bands_signal_gen.
+
+    Parameters:
+    - data (pandas.DataFrame): DataFrame containing 'Close' prices.
+    - window (int, optional): The window size for computing moving averages and standard deviations. Default is 20.
+    - num_std_dev (int, optional): The number of standard deviations to use for the Bollinger Bands. Default is 2.
+    - indicators (dict, optional): Storage for memoizing the rolling mean and standard deviation. Default is None.
+
+    Returns:
+    - numpy.ndarray: An np.int8 array of Bollinger Bands signals (0, 1 or 2).
+
+    """
+    _handle_errors_bb(window, num_std_dev)
+    rolling_mean, rolling_std = _memoized(
+        indicators,
+        ("rolling_mean_std", window),
+        _rolling_mean_std,
+        data.Close,
+        window,
+    )
+    upper_band = rolling_mean + (rolling_std * num_std_dev)
+    lower_band = rolling_mean - (rolling_std * num_std_dev)
+
+    close_prices = data.Close.to_numpy()
+
+    return _masks_to_signal(close_prices < lower_band, close_prices > upper_band)
+
+
+def _macd_signal_array(
+    data,
+    fast_period=12,
+    slow_period=26,
+    signal_period=9,
+    threshold_multiplier=0.4,
+    indicators=None,
+):
+    """Vectorized backend of _macd_signal_gen.
+
+    Parameters:
+    - data (pandas.DataFrame): A DataFrame containing the financial data from data_download().
+    - fast_period (int, optional): The number of periods for the fast EMA (Exponential Moving Average). Default is 12.
+    - slow_period (int, optional): The number of periods for the slow EMA. Default is 26.
+    - signal_period (int, optional): The number of periods for the signal line. Default is 9.
+    - threshold_multiplier (float, optional): A multiplier to adjust the threshold for buy and sell signals.
+    - indicators (dict, optional): Storage for memoizing the EMAs, the MACD and the signal line. Default is None.
+
+    Returns:
+    - numpy.ndarray: An np.int8 array of MACD signals (0, 1 or 2).
+
     """
     _handle_errors_macd_gen(
         fast_period,
@@ -232,28 +387,153 @@ def _macd_signal_gen(
         signal_period,
         threshold_multiplier,
     )
-    close_prices = data.Close
-    ema_fast = close_prices.ewm(span=fast_period, min_periods=fast_period).mean()
-    ema_slow = close_prices.ewm(span=slow_period, min_periods=slow_period).mean()
+    macd_line, signal_line, macd_std = _memoized(
+        indicators,
+        ("macd", fast_period, slow_period, signal_period),
+        _macd,
+        data.Close,
+        fast_period,
+        slow_period,
+        signal_period,
+        indicators,
+    )
+
+    # Calculate the threshold based on the standard deviation of the MACD line
+    threshold = threshold_multiplier * macd_std
+
+    return _masks_to_signal(
+        macd_line > signal_line + threshold,
+        macd_line < signal_line - threshold,
+    )
+
+
+# Indicators
+def _rsi(close_prices, period):
+    """Calculate the RSI (Relative Strength Index) of closing prices.
+
+    Parameters:
+    - close_prices (pandas.Series): Closing prices.
+    - period (int): The period used for calculating RSI.
+
+    Returns:
+    - numpy.ndarray: The RSI for each time step.
+
+    """
+    deltas = close_prices.diff()
+
+    gain = deltas.where(deltas > 0, 0)
+    loss = -deltas.where(deltas < 0, 0)
+
+    avg_gain = gain.rolling(window=period, min_periods=1).mean()
+    avg_loss = loss.rolling(window=period, min_periods=1).mean()
+
+    rs = avg_gain / avg_loss
+    return (100 - (100 / (1 + rs))).to_numpy()
+
+
+def _rolling_mean_std(close_prices, window):
+    """Calculate the rolling mean and standard deviation of closing prices.
+
+    Parameters:
+    - close_prices (pandas.Series): Closing prices.
+    - window (int): The window size for computing the rolling mean and standard deviation.
+
+    Returns:
+    - tuple: Arrays of the rolling mean and the rolling standard deviation.
+
+    """
+    rolling = close_prices.rolling(window=window)
+    return rolling.mean().to_numpy(), rolling.std().to_numpy()
+
+
+def _ema(close_prices, span):
+    """Calculate the EMA (Exponential Moving Average) of closing prices.
+
+    Parameters:
+    - close_prices (pandas.Series): Closing prices.
+    - span (int): The number of periods of the EMA.
+
+    Returns:
+    - numpy.ndarray: The EMA for each time step.
+
+    """
+    return close_prices.ewm(span=span, min_periods=span).mean().to_numpy()
+
+
+def _macd(close_prices, fast_period, slow_period, signal_period, indicators=None):
+    """Calculate the MACD line, its signal line and its standard deviation.
+
+    Parameters:
+    - close_prices (pandas.Series): Closing prices.
+    - fast_period (int): The number of periods for the fast EMA.
+    - slow_period (int): The number of periods for the slow EMA.
+    - signal_period (int): The number of periods for the signal line.
+    - indicators (dict, optional): Storage for memoizing the EMAs. Default is None.
+
+    Returns:
+    - tuple: Arrays of the MACD line and the signal line, and the standard deviation of the MACD line.
+
+    """
+    ema_fast = _memoized(
+        indicators,
+        ("ema", fast_period),
+        _ema,
+        close_prices,
+        fast_period,
+    )
+    ema_slow = _memoized(
+        indicators,
+        ("ema", slow_period),
+        _ema,
+        close_prices,
+        slow_period,
+    )
 
-    macd_line = ema_fast - ema_slow
+    macd_line = pd.Series(ema_fast - ema_slow)
     signal_line = macd_line.ewm(span=signal_period, min_periods=signal_period).mean()
 
-    macd_signal = []
-    macd_std = macd_line.std()
+    return macd_line.to_numpy(), signal_line.to_numpy(), macd_line.std()
+
+
+def _memoized(indicators, key, func, *args):
+    """Return func(*args) and memoize it in indicators under key.
+
+    Parameters:
+    - indicators (dict, mapping or None): Storage for memoized indicators, e.g. a view from IndicatorCache.bind(). If None, nothing is memoized.
+    - key (tuple): Key of the indicator and its parameters.
+    - func (callable): Function computing the indicator.
+    - *args: Arguments passed to func.
+
+    Returns:
+    - The (memoized) outcome of func(*args).
+
+    """
+    if indicators is None:
+        return func(*args)
+    if key not in indicators:
+        indicators[key] = func(*args)
+    return indicators[key]
+
+
+def _masks_to_signal(one_mask, two_mask):
+    """Combine two boolean masks into a compact signal array.
 
-    for macd, signal in zip(macd_line, signal_line):
-        # Calculate the threshold based on the standard deviation of the MACD line
-        threshold = threshold_multiplier * macd_std
+    Where both masks are True, one_mask takes precedence, mirroring the if/elif
+    order of the original generators. NaN comparisons are False, so missing indicator
+    values result in no signal.
 
-        if macd > signal + threshold:
-            macd_signal.append(1)  # Buy signal
-        elif macd < signal - threshold:
-            macd_signal.append(2)  # Sell signal
-        else:
-            macd_signal.append(0)  # No signal
+    Parameters:
+    - one_mask (numpy.ndarray): Boolean mask of time steps which get the signal 1.
+    - two_mask (numpy.ndarray): Boolean mask of time steps which get the signal 2.
 
-    return macd_signal
+    Returns:
+    - numpy.ndarray: An np.int8 array of signals (0, 1 or 2).
+
+    """
+    signal = np.zeros(len(one_mask), dtype=np.int8)
+    signal[two_mask] = 2
+    signal[one_mask] = 1
+    return signal
 
 
 def _handle_errors_signal_list(data, generator):
@@ -313,6 +593,23 @@ def _handle_errors_random_signal_gen(prob_zero, prob_one, prob_two):
         raise ValueError(msg)
 
 
+def _handle_errors_random_mode(random_mode):
+    """Handle type and value errors for the random_mode of _random_signal_gen.
+
+    Raises:
+    - TypeError: If random_mode is not a string.
+    - ValueError: If random_mode is not available.
+
+    """
+    if not isinstance(random_mode, str):
+        msg = f"'random_mode' has to be of type str and not {type(random_mode)}."
+        raise TypeError(msg)
+    og_random_modes = ["compat", "batched"]
+    if random_mode not in og_random_modes:
+        msg = f"Selected random_mode ({random_mode}) is not available. Please choose one from {og_random_modes}."
+        raise ValueError(msg)
+
+
 def _handle_errors_rsi(rsi_threshold_low, rsi_threshold_high, period):
     """Handle value and type errors for _rsi_signal_gen.
 
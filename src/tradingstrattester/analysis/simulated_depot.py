@@ -1,12 +1,75 @@
 """Function for simulating a depot to test strategies."""
 
 import math
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
-import pandas as pd
-from tradingstrattester.config import BLD
+from numpy.lib.stride_tricks import sliding_window_view
+from tradingstrattester.data_management.price_store import read_price_view
+from tradingstrattester.profiling import count, profiled, profiling_enabled
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
+_UNIT_STRAT_CODES = {
+    "fixed_trade_units": 0,
+    "percentage_to_value_trades": 1,
+    "volatility_unit_trades": 2,
+}
+
+
+class DepotResult(Mapping):
+    """Simulated depot balances backed by one preallocated array per asset.
+
+    For every asset the cash, unit and value balances are stored as the rows of a
+    single contiguous float64 array of shape (3, number of time steps). The result
+    behaves like the dictionary returned by simulated_depot() before, i.e.
+    depot["value_dict"]["60m_DB"] returns the value balances of that asset, but the
+    returned balances are views on the underlying arrays.
+
+    Attributes:
+    - balances (dict): Maps each asset name (e.g. "60m_DB") to its (3, n) array.
+
+    """
+
+    COLUMNS = ("cash_dict", "unit_dict", "value_dict")
+
+    def __init__(self):
+        self.balances = {}
+
+    def allocate(self, name, length):
+        """Allocate the balance array of an asset.
+
+        Args:
+        - name (str): The asset name, e.g. "60m_DB".
+        - length (int): Number of time steps, i.e. the length of the signal list.
+
+        Returns:
+        - tuple: Views on the cash, units and value rows of the new array.
+
+        """
+        self.balances[name] = np.zeros((len(self.COLUMNS), length), dtype=np.float64)
+        cash, units, value = self.balances[name]
+        return cash, units, value
+
+    def __getitem__(self, key):
+        try:
+            row = self.COLUMNS.index(key)
+        except ValueError:
+            raise KeyError(key) from None
+        return {name: balance[row] for name, balance in self.balances.items()}
+
+    def __iter__(self):
+        return iter(self.COLUMNS)
+
+    def __len__(self):
+        return len(self.COLUMNS)
+
+
+@profiled("depot")
 def simulated_depot(
     signal_dict,
     strategy,
@@ -16,6 +79,9 @@ def simulated_depot(
     unit_strat,
     unit_var,
     tac,
+    engine="kernel",
+    vol_window=50,
+    n_workers=1,
 ):
     """Simulates a trading strategy on multiple assets specified in ASSETS from the
     config.py file.
@@ -29,9 +95,13 @@ def simulated_depot(
     - unit_strat (str): Strategy for determining trade units. Supported strategies: 'fixed_trade_units',
                         'percentage_to_value_trades', 'volatility_unit_trades'.
     - unit_var (float): Variable used in the unit strategy calculation.
+    - tac (float): Transaction costs per traded unit.
+    - engine (str, optional): Either "kernel" for the array based simulation kernel, which is compiled with numba if it is installed, or "python" for the per time step reference implementation. Default is "kernel".
+    - vol_window (int, optional): Number of past closing prices used for the volatility in 'volatility_unit_trades'. Default is 50.
+    - n_workers (int, optional): Number of worker processes. If greater than 1, the assets are simulated in parallel on a process pool whose workers share the memory-mapped closing prices of the price store. Default is 1.
 
     Returns:
-    - dict: A dictionary containing cash, units, and portfolio value balances for each asset specified in ASSET from the config.py file.
+    - DepotResult: A mapping containing cash, units, and portfolio value balances for each asset specified in ASSET from the config.py file.
 
     """
     _handle_errors_in_input_variables(
@@ -43,124 +113,504 @@ def simulated_depot(
         unit_var,
         tac,
     )
+    _handle_errors_engine(engine)
+    _handle_errors_vol_window(vol_window)
+    _handle_errors_n_workers(n_workers)
+
+    sim_kwargs = {
+        "initial_depot_cash": initial_depot_cash,
+        "start_stock_prct": start_stock_prct,
+        "unit_strat": unit_strat,
+        "unit_var": unit_var,
+        "tac": tac,
+        "engine": engine,
+        "vol_window": vol_window,
+    }
+
+    if n_workers > 1:
+        depot = _simulated_depot_parallel(
+            signal_dict[strategy],
+            _id,
+            sim_kwargs,
+            n_workers,
+        )
+    else:
+        depot = DepotResult()
+
+        for id in _id:
+            signal = signal_dict[strategy][f"signal_{id}"]
+            data = read_price_view(id, columns=["Close"])
+
+            cash, units, value = depot.allocate(id.split(".")[0], len(signal))
+            _simulate_asset(signal, data, cash, units, value, **sim_kwargs)
+
+    if profiling_enabled():
+        # A trade is a time step at which the units held change
+        units = depot["unit_dict"].values()
+        count(
+            "depot",
+            "simulated_depot",
+            bars=sum(len(unit) for unit in units),
+            trades=sum(int(np.count_nonzero(np.diff(unit))) for unit in units),
+        )
+
+    return depot
+
+
+def _simulated_depot_parallel(signals, _id, sim_kwargs, n_workers):
+    """Simulates the depot of every asset in parallel on a process pool.
+
+    Every worker reads the closing prices of its asset with read_price_view(), i.e. as
+    a memory-mapped array of the price store. The price data is therefore neither
+    pickled to the workers nor duplicated in their memory.
+
+    Args:
+    - signals (dict): A dictionary containing the trading signals of one strategy for each asset.
+    - _id (list): A list of asset IDs specified in the config.py file.
+    - sim_kwargs (dict): Keyword arguments of _simulate_asset() besides the balances.
+    - n_workers (int): Number of worker processes.
+
+    Returns:
+    - DepotResult: A mapping containing cash, units, and portfolio value balances for each asset.
+
+    """
+    depot = DepotResult()
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        futures = {
+            id.split(".")[0]: executor.submit(
+                _simulate_shared_asset,
+                id,
+                np.asarray(signals[f"signal_{id}"], dtype=np.int8),
+                sim_kwargs,
+            )
+            for id in _id
+        }
+        for name, future in futures.items():
+            depot.balances[name] = future.result()
+
+    return depot
+
+
+def _simulate_shared_asset(id, signal, sim_kwargs):
+    """Worker function which simulates one asset on its memory-mapped closing prices.
+
+    Args:
+    - id (str): The identifier for the asset including the ending "[...].pkl", e.g. "60m_DB.pkl".
+    - signal (numpy.ndarray): Trading signals (0, 1 or 2) for each time step.
+    - sim_kwargs (dict): Keyword arguments of _simulate_asset() besides the balances.
+
+    Returns:
+    - numpy.ndarray: The (3, len(signal)) array of cash, units and value balances.
+
+    """
+    data = read_price_view(id, columns=["Close"])
+
+    balances = np.zeros((len(DepotResult.COLUMNS), len(signal)), dtype=np.float64)
+    cash, units, value = balances
+    _simulate_asset(signal, data, cash, units, value, **sim_kwargs)
+
+    return balances
+
+
+def _simulate_asset(
+    signal,
+    data,
+    cash,
+    units,
+    value,
+    initial_depot_cash,
+    start_stock_prct,
+    unit_strat,
+    unit_var,
+    tac,
+    engine,
+    vol_window,
+):
+    """Simulates the depot of a single asset into preallocated balances.
+
+    Args:
+    - signal (list or numpy.ndarray): Trading signals (0, 1 or 2) for each time step.
+    - data (pd.DataFrame): The DataFrame containing at least the closing data of the asset.
+    - cash (numpy.ndarray): Preallocated array of cash values.
+    - units (numpy.ndarray): Preallocated array of unit holdings.
+    - value (numpy.ndarray): Preallocated array of portfolio values.
+    - initial_depot_cash (float): The initial depot cash value defined in the config.py file.
+    - start_stock_prct (float): The percentage indicating the portion of the initial depot value to be invested in stocks.
+    - unit_strat (str): Strategy for determining trade units. Supported strategies: 'fixed_trade_units',
+                        'percentage_to_value_trades', 'volatility_unit_trades'.
+    - unit_var (float): Variable used in the unit strategy calculation.
+    - tac (float): Transaction costs per traded unit.
+    - engine (str): Either "kernel" or "python".
+    - vol_window (int): Volatility window of 'volatility_unit_trades'.
 
-    cash_dict = {}
-    unit_dict = {}
-    value_dict = {}
+    """
+    _initialize_variables(
+        data,
+        initial_depot_cash,
+        start_stock_prct,
+        units,
+        cash,
+        value,
+    )
 
-    for id in _id:
-        signal = signal_dict[strategy][f"signal_{id}"]
-        data = pd.read_pickle(BLD / "python" / "data" / id)
+    # The volatility only depends on the closing prices and is computed once
+    rolling_std = None
+    if unit_strat == "volatility_unit_trades":
+        rolling_std = _rolling_std(data.Close.to_numpy(dtype=np.float64), vol_window)
 
-        units, cash, value = _initialize_variables(
+    if engine == "kernel":
+        _simulate_kernel(
+            signal,
             data,
-            initial_depot_cash,
-            start_stock_prct,
+            unit_strat,
+            unit_var,
+            tac,
+            units,
+            cash,
+            value,
+            vol_window,
+            rolling_std,
+        )
+    else:
+        _simulate_python(
+            signal,
+            data,
+            unit_strat,
+            unit_var,
+            tac,
+            units,
+            cash,
+            value,
+            vol_window,
+            rolling_std,
         )
 
-        for i in range(1, len(signal)):
-            if signal[i] == 2:  # Sell signal
-                _execute_sell_signal(
-                    i,
-                    value,
-                    cash,
-                    units,
-                    data,
-                    unit_strat,
-                    unit_var,
-                    tac,
-                )
-            elif signal[i] == 1:  # Buy signal
-                _execute_buy_signal(
-                    i,
-                    value,
-                    cash,
-                    units,
-                    data,
-                    unit_strat,
-                    unit_var,
-                    tac,
-                )
-            else:
-                _execute_no_signal(i, cash, units)
-
-            value.append(units[i] * data.Close.iloc[i] + cash[i])
-
-        cash_dict[id.split(".")[0]] = cash
-        unit_dict[id.split(".")[0]] = units
-        value_dict[id.split(".")[0]] = value
-
-    return {
-        "cash_dict": cash_dict,
-        "unit_dict": unit_dict,
-        "value_dict": value_dict,
-    }
 
+def _simulate_python(
+    signal,
+    data,
+    unit_strat,
+    unit_var,
+    tac,
+    units,
+    cash,
+    value,
+    vol_window=50,
+    rolling_std=None,
+):
+    """Simulates the depot of a single asset time step by time step.
 
-def _initialize_variables(data, initial_depot_cash, start_stock_prct):
-    """Initializes variables for simulating the trading depot.
+    Args:
+    - signal (list or numpy.ndarray): Trading signals (0, 1 or 2) for each time step.
+    - data (pd.DataFrame): The DataFrame containing asset opening, high, low, and closing data from the data_download() function.
+    - unit_strat (str): Strategy for determining trade units. Supported strategies: 'fixed_trade_units',
+                        'percentage_to_value_trades', 'volatility_unit_trades'.
+    - unit_var (float): Variable used in the unit strategy calculation.
+    - tac (float): Transaction costs per traded unit.
+    - units (numpy.ndarray): Preallocated array of unit holdings, initialized at index 0.
+    - cash (numpy.ndarray): Preallocated array of cash values, initialized at index 0.
+    - value (numpy.ndarray): Preallocated array of portfolio values, initialized at index 0.
+    - vol_window (int, optional): Volatility window of 'volatility_unit_trades'. Default is 50.
+    - rolling_std (numpy.ndarray, optional): Precomputed volatility from _rolling_std().
+
+    """
+    for i in range(1, len(signal)):
+        if signal[i] == 2:  # Sell signal
+            _execute_sell_signal(
+                i,
+                value,
+                cash,
+                units,
+                data,
+                unit_strat,
+                unit_var,
+                tac,
+                vol_window,
+                rolling_std,
+            )
+        elif signal[i] == 1:  # Buy signal
+            _execute_buy_signal(
+                i,
+                value,
+                cash,
+                units,
+                data,
+                unit_strat,
+                unit_var,
+                tac,
+                vol_window,
+                rolling_std,
+            )
+        else:
+            _execute_no_signal(i, cash, units)
+
+        value[i] = units[i] * data.Close.iloc[i] + cash[i]
+
+
+def _simulate_kernel(
+    signal,
+    data,
+    unit_strat,
+    unit_var,
+    tac,
+    units,
+    cash,
+    value,
+    vol_window=50,
+    rolling_std=None,
+):
+    """Simulates the depot of a single asset with the array based simulation kernel.
 
     Args:
+    - signal (list or numpy.ndarray): Trading signals (0, 1 or 2) for each time step.
     - data (pd.DataFrame): The DataFrame containing asset opening, high, low, and closing data from the data_download() function.
-    - initial_depot_cash (float): The initial depot cash value defined in the config.py file.
-    - start_stock_prct (float): The percentage indicating the portion of the initial depot value to be invested in stocks.
+    - unit_strat (str): Strategy for determining trade units. Supported strategies: 'fixed_trade_units',
+                        'percentage_to_value_trades', 'volatility_unit_trades'.
+    - unit_var (float): Variable used in the unit strategy calculation.
+    - tac (float): Transaction costs per traded unit.
+    - units (numpy.ndarray): Preallocated float64 array of unit holdings, initialized at index 0.
+    - cash (numpy.ndarray): Preallocated float64 array of cash values, initialized at index 0.
+    - value (numpy.ndarray): Preallocated float64 array of portfolio values, initialized at index 0.
+    - vol_window (int, optional): Volatility window of 'volatility_unit_trades'. Default is 50.
+    - rolling_std (numpy.ndarray, optional): Precomputed volatility from _rolling_std().
+
+    """
+    signal = np.asarray(signal, dtype=np.int8)
+    close = data.Close.to_numpy(dtype=np.float64)[: len(signal)]
+    if rolling_std is None:
+        rolling_std = np.empty(0, dtype=np.float64)
+
+    _depot_kernel(
+        close,
+        signal,
+        _UNIT_STRAT_CODES[unit_strat],
+        float(unit_var),
+        float(tac),
+        units,
+        cash,
+        value,
+        int(vol_window),
+        rolling_std,
+    )
+
+
+def _depot_step(
+    signal,
+    close,
+    cash,
+    units,
+    previous_value,
+    unit_strat_code,
+    unit_var,
+    tac,
+    volatility,
+):
+    """Apply the buy, sell and no signal rules and the unit strategy to one time step.
+
+    Shared by _depot_kernel() and StreamingDepot, so both trade exactly alike.
+
+    Args:
+    - signal (int): The trading signal (0, 1 or 2) of the time step, where 2 sells and 1 buys.
+    - close (float): The closing price of the time step.
+    - cash (float): The cash of the previous time step.
+    - units (float): The unit holdings of the previous time step.
+    - previous_value (float): The portfolio value of the previous time step.
+    - unit_strat_code (int): Code of the unit strategy as defined in _UNIT_STRAT_CODES.
+    - unit_var (float): Variable used in the unit strategy calculation.
+    - tac (float): Transaction costs per traded unit.
+    - volatility (float): Volatility of the past vol_window closing prices for 'volatility_unit_trades', or 1.0 if there are not enough past closing prices yet.
 
     Returns:
-    - tuple: A tuple containing lists of units, cash, and portfolio value.
+    - tuple: The cash, unit holdings and portfolio value of the time step.
+
+    """
+    if signal == 1 or signal == 2:
+        if unit_strat_code == 0:
+            trade_units = unit_var
+        else:
+            trade_units = np.floor((previous_value * unit_var) / close)
+            if unit_strat_code == 2:
+                trade_units = np.floor(volatility * trade_units)
+
+        if signal == 2:  # Sell signal
+            if units >= trade_units:
+                cash = cash + close * trade_units * (1 - tac)
+                units = units - trade_units
+        elif cash >= close * trade_units:  # Buy signal
+            cash = cash - close * trade_units * (1 + tac)
+            units = units + trade_units
+
+    return cash, units, units * close + cash
+
+
+if njit is not None:
+    _depot_step = njit(cache=True)(_depot_step)
+
+
+def _depot_kernel(
+    close,
+    signal,
+    unit_strat_code,
+    unit_var,
+    tac,
+    units,
+    cash,
+    value,
+    vol_window,
+    rolling_std,
+):
+    """Simulation kernel which fills preallocated units, cash and value arrays.
+
+    The kernel mirrors _simulate_python() but only operates on NumPy arrays, so it can
+    be compiled with numba. Without numba it runs as a plain Python loop over the
+    arrays. The first entry of units, cash and value has to be initialized.
+
+    Args:
+    - close (numpy.ndarray): float64 array of closing prices.
+    - signal (numpy.ndarray): int8 array of trading signals (0, 1 or 2).
+    - unit_strat_code (int): Code of the unit strategy as defined in _UNIT_STRAT_CODES.
+    - unit_var (float): Variable used in the unit strategy calculation.
+    - tac (float): Transaction costs per traded unit.
+    - units (numpy.ndarray): Preallocated float64 array of unit holdings.
+    - cash (numpy.ndarray): Preallocated float64 array of cash values.
+    - value (numpy.ndarray): Preallocated float64 array of portfolio values.
+    - vol_window (int): Volatility window of 'volatility_unit_trades'.
+    - rolling_std (numpy.ndarray): Precomputed volatility from _rolling_std(), only used for 'volatility_unit_trades'.
 
     """
-    units = [math.floor((initial_depot_cash * start_stock_prct) / data.Close.iloc[0])]
-    cash = [initial_depot_cash - units[0] * data.Close.iloc[0]]
-    value = [units[0] * data.Close.iloc[0] + cash[0]]
+    for i in range(1, len(signal)):
+        volatility = 1.0
+        if unit_strat_code == 2 and i > vol_window:
+            volatility = rolling_std[i]
+        cash[i], units[i], value[i] = _depot_step(
+            signal[i],
+            close[i],
+            cash[i - 1],
+            units[i - 1],
+            value[i - 1],
+            unit_strat_code,
+            unit_var,
+            tac,
+            volatility,
+        )
+
 
-    return units, cash, value
+if njit is not None:
+    _depot_kernel = njit(cache=True)(_depot_kernel)
 
 
-def _execute_sell_signal(i, value, cash, units, data, unit_strat, unit_var, tac):
+def _initialize_variables(
+    data,
+    initial_depot_cash,
+    start_stock_prct,
+    units,
+    cash,
+    value,
+):
+    """Initializes the first time step of the preallocated depot balances.
+
+    Args:
+    - data (pd.DataFrame): The DataFrame containing asset opening, high, low, and closing data from the data_download() function.
+    - initial_depot_cash (float): The initial depot cash value defined in the config.py file.
+    - start_stock_prct (float): The percentage indicating the portion of the initial depot value to be invested in stocks.
+    - units (numpy.ndarray): Preallocated array of unit holdings.
+    - cash (numpy.ndarray): Preallocated array of cash values.
+    - value (numpy.ndarray): Preallocated array of portfolio values.
+
+    """
+    units[0] = math.floor((initial_depot_cash * start_stock_prct) / data.Close.iloc[0])
+    cash[0] = initial_depot_cash - units[0] * data.Close.iloc[0]
+    value[0] = units[0] * data.Close.iloc[0] + cash[0]
+
+
+def _execute_sell_signal(
+    i,
+    value,
+    cash,
+    units,
+    data,
+    unit_strat,
+    unit_var,
+    tac,
+    vol_window=50,
+    rolling_std=None,
+):
     """Executes sell signal for a given time step.
 
     Args:
     - i (int): Index of the current time step.
-    - value (list): List or array containing the value of the trading account at each time step.
-    - cash (list): List containing cash values for each time step.
+    - value (numpy.ndarray): Array containing the value of the trading account at each time step.
+    - cash (numpy.ndarray): Array containing cash values for each time step.
     - data (pd.DataFrame): DataFrame containing asset data.
-    - units (list): List containing unit holdings for each time step.
+    - units (numpy.ndarray): Array containing unit holdings for each time step.
     - unit_strat (str): Strategy for determining trade units. Supported strategies: 'fixed_trade_units',
                         'percentage_to_value_trades', 'volatility_unit_trades'.
     - unit_var (float): Variable used in the unit strategy calculation.
+    - vol_window (int, optional): Volatility window of 'volatility_unit_trades'. Default is 50.
+    - rolling_std (numpy.ndarray, optional): Precomputed volatility from _rolling_std().
 
     """
-    trade_units = _trade_units(i, data, value, unit_strat, unit_var)
+    trade_units = _trade_units(
+        i,
+        data,
+        value,
+        unit_strat,
+        unit_var,
+        vol_window,
+        rolling_std,
+    )
     if units[i - 1] >= trade_units:
-        cash.append(cash[i - 1] + data.Close.iloc[i] * trade_units * (1 - tac))
-        units.append(units[i - 1] - trade_units)
+        cash[i] = cash[i - 1] + data.Close.iloc[i] * trade_units * (1 - tac)
+        units[i] = units[i - 1] - trade_units
     else:
-        cash.append(cash[i - 1])
-        units.append(units[i - 1])
+        cash[i] = cash[i - 1]
+        units[i] = units[i - 1]
 
 
-def _execute_buy_signal(i, value, cash, units, data, unit_strat, unit_var, tac):
+def _execute_buy_signal(
+    i,
+    value,
+    cash,
+    units,
+    data,
+    unit_strat,
+    unit_var,
+    tac,
+    vol_window=50,
+    rolling_std=None,
+):
     """Executes buy signal for a given time step.
 
     Args:
     - i (int): Index of the current time step.
-    - value (list): List or array containing the value of the trading account at each time step.
-    - cash (list): List containing cash values for each time step.
-    - units (list): List containing unit holdings for each time step.
+    - value (numpy.ndarray): Array containing the value of the trading account at each time step.
+    - cash (numpy.ndarray): Array containing cash values for each time step.
+    - units (numpy.ndarray): Array containing unit holdings for each time step.
     - data (pd.DataFrame): DataFrame containing asset data.
     - unit_strat (str): Strategy for determining trade units. Supported strategies: 'fixed_trade_units',
                         'percentage_to_value_trades', 'volatility_unit_trades'.
     - unit_var (float): Variable used in the unit strategy calculation.
+    - vol_window (int, optional): Volatility window of 'volatility_unit_trades'. Default is 50.
+    - rolling_std (numpy.ndarray, optional): Precomputed volatility from _rolling_std().
 
     """
-    trade_units = _trade_units(i, data, value, unit_strat, unit_var)
+    trade_units = _trade_units(
+        i,
+        data,
+        value,
+        unit_strat,
+        unit_var,
+        vol_window,
+        rolling_std,
+    )
     cash_required = data.Close.iloc[i] * trade_units
     if cash[i - 1] >= cash_required:
-        cash.append(cash[i - 1] - data.Close.iloc[i] * trade_units * (1 + tac))
-        units.append(units[i - 1] + trade_units)
+        cash[i] = cash[i - 1] - data.Close.iloc[i] * trade_units * (1 + tac)
+        units[i] = units[i - 1] + trade_units
     else:
-        cash.append(cash[i - 1])
-        units.append(units[i - 1])
+        cash[i] = cash[i - 1]
+        units[i] = units[i - 1]
 
 
 def _execute_no_signal(i, cash, units):
@@ -168,18 +618,26 @@ def _execute_no_signal(i, cash, units):
 
     Args:
     - i (int): Index of the current time step.
-    - cash (list): List containing cash values for each time step.
-    - units (list): List containing unit holdings for each time step.
+    - cash (numpy.ndarray): Array containing cash values for each time step.
+    - units (numpy.ndarray): Array containing unit holdings for each time step.
 
     """
-    cash.append(cash[i - 1])
-    units.append(units[i - 1])
+    cash[i] = cash[i - 1]
+    units[i] = units[i - 1]
 
 
 # Determining the amount of units to trade
 
 
-def _trade_units(i, data, value, unit_strat, unit_var):
+def _trade_units(
+    i,
+    data,
+    value,
+    unit_strat,
+    unit_var,
+    vol_window=50,
+    rolling_std=None,
+):
     """Determine the number of units to trade based on the specified unit strategy.
 
     Args:
@@ -189,6 +647,8 @@ def _trade_units(i, data, value, unit_strat, unit_var):
     - unit_strat (str): Strategy for determining trade units. Supported strategies: 'fixed_trade_units',
                         'percentage_to_value_trades', 'volatility_unit_trades'.
     - unit_var (float): Variable used in the unit strategy calculation.
+    - vol_window (int, optional): Volatility window of 'volatility_unit_trades'. Default is 50.
+    - rolling_std (numpy.ndarray, optional): Precomputed volatility from _rolling_std(). If None, the volatility is computed from data.
 
     Returns:
     - out (int): Number of units to trade based on the specified strategy.
@@ -201,7 +661,14 @@ def _trade_units(i, data, value, unit_strat, unit_var):
         out = __percentage_to_value_trades(i, data, value, unit_var)
 
     if unit_strat == "volatility_unit_trades":
-        out = __volatility_unit_trades(i, data, value, unit_var)
+        out = __volatility_unit_trades(
+            i,
+            data,
+            value,
+            unit_var,
+            vol_window,
+            rolling_std,
+        )
 
     return out
 
@@ -223,15 +690,17 @@ def __percentage_to_value_trades(i, data, value, unit_var):
     return math.floor((value[i - 1] * unit_var) / data.Close.iloc[i])
 
 
-def __volatility_unit_trades(i, data, value, unit_var):
-    """Calculate the number of units to trade based on volatility of the past 50 trades
-    and a percentage of the account value.
+def __volatility_unit_trades(i, data, value, unit_var, vol_window=50, rolling_std=None):
+    """Calculate the number of units to trade based on volatility of the past vol_window
+    trades and a percentage of the account value.
 
     Args:
     - i (int): Index indicating the current time step.
     - data (pandas.DataFrame): DataFrame containing the data, with a 'Close' column representing closing prices.
     - value (list or numpy.ndarray): List or array containing the value of the trading account at each time step.
     - unit_var (float): Percentage of the account value to allocate for trading.
+    - vol_window (int, optional): Number of past closing prices used for the volatility. Default is 50.
+    - rolling_std (numpy.ndarray, optional): Precomputed volatility from _rolling_std(). If None, the volatility is computed from data.
 
     Returns:
     - int: Number of units to trade.
@@ -239,7 +708,40 @@ def __volatility_unit_trades(i, data, value, unit_var):
     """
     unit = math.floor((value[i - 1] * unit_var) / data.Close.iloc[i])
 
-    return unit if i <= 50 else math.floor(np.std(data.Close.iloc[i - 50 : i]) * unit)
+    if i <= vol_window:
+        return unit
+    if rolling_std is None:
+        return math.floor(np.std(data.Close.iloc[i - vol_window : i]) * unit)
+    return math.floor(rolling_std[i] * unit)
+
+
+def _rolling_std(close, window, chunk_size=2**20):
+    """Compute the volatility of the past window closing prices for every time step.
+
+    The windows are evaluated vectorized in chunks of about chunk_size values, which
+    bounds the memory usage while giving exactly the same values as calling np.std()
+    on every window separately.
+
+    Args:
+    - close (numpy.ndarray): float64 array of closing prices.
+    - window (int): Number of past closing prices used for the volatility.
+    - chunk_size (int, optional): Approximate number of values evaluated at once.
+
+    Returns:
+    - numpy.ndarray: Array out with out[i] = np.std(close[i - window : i]) for i >= window and NaN otherwise.
+
+    """
+    out = np.full(len(close), np.nan)
+    if len(close) <= window:
+        return out
+
+    windows = sliding_window_view(close[:-1], window)
+    rows = max(1, chunk_size // window)
+    for start in range(0, len(windows), rows):
+        chunk = windows[start : start + rows]
+        out[window + start : window + start + len(chunk)] = chunk.std(axis=1)
+
+    return out
 
 
 def _handle_errors_in_input_variables(
@@ -288,6 +790,55 @@ def _handle_errors_in_input_variables(
     )
 
 
+def _handle_errors_engine(engine):
+    """Handle type and value errors for the simulation engine.
+
+    Raises:
+    - TypeError: If engine is not a string.
+    - ValueError: If engine is not available.
+
+    """
+    if not isinstance(engine, str):
+        msg = f"'engine' has to be of type str and not {type(engine)}."
+        raise TypeError(msg)
+    og_engines = ["kernel", "python"]
+    if engine not in og_engines:
+        msg = f"Input for 'engine' ({engine}) is not in {og_engines}."
+        raise ValueError(msg)
+
+
+def _handle_errors_vol_window(vol_window):
+    """Handle type and value errors for the volatility window.
+
+    Raises:
+    - TypeError: If vol_window is not an int.
+    - ValueError: If vol_window is smaller than 1.
+
+    """
+    if not isinstance(vol_window, int):
+        msg = f"'vol_window' has the wrong type ({type(vol_window)}). '{vol_window}' has to be of type int."
+        raise TypeError(msg)
+    if vol_window < 1:
+        msg = f"Wrong input for 'vol_window' ({vol_window}). Input has to be greater than 0."
+        raise ValueError(msg)
+
+
+def _handle_errors_n_workers(n_workers):
+    """Handle type and value errors for the number of worker processes.
+
+    Raises:
+    - TypeError: If n_workers is not an int.
+    - ValueError: If n_workers is smaller than 1.
+
+    """
+    if not isinstance(n_workers, int):
+        msg = f"'n_workers' has the wrong type ({type(n_workers)}). '{n_workers}' has to be of type int."
+        raise TypeError(msg)
+    if n_workers < 1:
+        msg = f"Wrong input for 'n_workers' ({n_workers}). Input has to be greater than 0."
+        raise ValueError(msg)
+
+
 def __handle_errors_in_sim_depot_config_vars(
     initial_depot_cash,
     start_stock_prct,
@@ -0,0 +1,268 @@
+"""Function for simulating a portfolio of assets sharing one cash account."""
+
+import math
+
+import numpy as np
+import pandas as pd
+from tradingstrattester.analysis.simulated_depot import (
+    _handle_errors_in_input_variables,
+    _handle_errors_vol_window,
+    _rolling_std,
+)
+from tradingstrattester.data_management.alignment import (
+    _alignment_index,
+    align_prices,
+)
+from tradingstrattester.data_management.price_store import read_price_view
+from tradingstrattester.profiling import count, profiled, profiling_enabled
+
+
+@profiled("depot")
+def simulated_portfolio(
+    signal_dict,
+    strategy,
+    _id,
+    initial_depot_cash,
+    start_stock_prct,
+    unit_strat,
+    unit_var,
+    tac,
+    vol_window=50,
+):
+    """Simulates a trading strategy on a portfolio of assets with one shared cash
+    account.
+
+    In contrast to simulated_depot(), where every asset has its own depot, all assets
+    trade from the same cash account. They are stepped on the union of their time
+    steps. An asset without a closing price at a time step does not trade and is valued
+    with its last closing price. See _simulate_portfolio() for the order in which
+    simultaneous signals are executed.
+
+    Args:
+    - signal_dict (dict): A dictionary containing trading signals of the chosen strategy for each asset.
+    - strategy (str): The name of the trading strategy to be used.
+    - _id (list): The asset IDs of the portfolio, which all have to have the same frequency, e.g. ["1d_DB.pkl", "1d_KO.pkl"]. Simultaneous buy signals are executed in this order.
+    - initial_depot_cash (float): The initial cash of the whole portfolio.
+    - start_stock_prct (float): The percentage indicating the portion of the initial cash to be invested in stocks, split equally among the assets.
+    - unit_strat (str): Strategy for determining trade units. Supported strategies: 'fixed_trade_units',
+                        'percentage_to_value_trades', 'volatility_unit_trades'.
+    - unit_var (float): Variable used in the unit strategy calculation. For 'percentage_to_value_trades' and 'volatility_unit_trades' it is a percentage of the portfolio value.
+    - tac (float): Transaction costs per traded unit.
+    - vol_window (int, optional): Number of past closing prices of an asset used for its volatility in 'volatility_unit_trades'. Default is 50.
+
+    Returns:
+    - dict: The shared cash balance ('cash', pandas.Series), the unit holdings ('units', pandas.DataFrame with one column per asset) and the total portfolio value ('value', pandas.Series) for each time step.
+
+    """
+    _handle_errors_in_input_variables(
+        signal_dict,
+        strategy,
+        initial_depot_cash,
+        start_stock_prct,
+        unit_strat,
+        unit_var,
+        tac,
+    )
+    _handle_errors_vol_window(vol_window)
+    _handle_errors_portfolio_id(_id)
+
+    # Union of all time steps, where an asset without a bar has no price and no signal
+    aligned = align_prices(_id, column="Close", how="union")
+    close = aligned.to_numpy(dtype=np.float64, copy=True)
+    signal = np.zeros(close.shape, dtype=np.int8)
+    for j, id in enumerate(_id):
+        signal_j = np.asarray(signal_dict[strategy][f"signal_{id}"], dtype=np.int8)
+        index = read_price_view(id, columns=[]).index
+        steps = aligned.index.get_indexer(_alignment_index(index, id.split("_")[0]))
+        # Like simulated_depot(), an asset is only simulated for the length of its signals
+        close[steps[len(signal_j) :], j] = np.nan
+        signal[steps[: len(signal_j)], j] = signal_j[: len(steps)]
+
+    cash, units, value = _simulate_portfolio(
+        close,
+        signal,
+        initial_depot_cash,
+        start_stock_prct,
+        unit_strat,
+        unit_var,
+        tac,
+        vol_window,
+    )
+
+    # Time steps after the signals of all assets are not simulated
+    steps = ~np.isnan(close).all(axis=1)
+    if profiling_enabled():
+        count(
+            "depot",
+            "simulated_portfolio",
+            bars=int(steps.sum()),
+            trades=int(np.count_nonzero(np.diff(units[steps], axis=0))),
+        )
+    return {
+        "cash": pd.Series(cash[steps], index=aligned.index[steps]),
+        "units": pd.DataFrame(
+            units[steps],
+            index=aligned.index[steps],
+            columns=aligned.columns,
+        ),
+        "value": pd.Series(value[steps], index=aligned.index[steps]),
+    }
+
+
+def _simulate_portfolio(
+    close,
+    signal,
+    initial_depot_cash,
+    start_stock_prct,
+    unit_strat,
+    unit_var,
+    tac,
+    vol_window=50,
+):
+    """Simulates a portfolio on a (time steps x assets) matrix of closing prices.
+
+    The time steps are processed one after another, while all assets of a time step are
+    processed at once. Signals are resolved in a deterministic order: first all sell
+    signals are executed, which can not fail because of the cash account. Then the buy
+    signals are executed in the order of the columns, as long as the remaining cash
+    covers the next buy. The first buy which is not covered and all buys after it are
+    skipped. A portfolio of a single asset therefore has the same balances as
+    simulated_depot().
+
+    Args:
+    - close (numpy.ndarray): float64 matrix of closing prices, NaN where an asset has no price.
+    - signal (numpy.ndarray): int8 matrix of trading signals (0, 1 or 2) of the same shape, where 2 sells and 1 buys.
+    - initial_depot_cash (float): The initial cash of the whole portfolio.
+    - start_stock_prct (float): The percentage indicating the portion of the initial cash to be invested in stocks.
+    - unit_strat (str): Strategy for determining trade units. Supported strategies: 'fixed_trade_units',
+                        'percentage_to_value_trades', 'volatility_unit_trades'.
+    - unit_var (float): Variable used in the unit strategy calculation.
+    - tac (float): Transaction costs per traded unit.
+    - vol_window (int, optional): Volatility window of 'volatility_unit_trades'. Default is 50.
+
+    Returns:
+    - tuple: Arrays of the cash balance, the (time steps x assets) unit holdings and the portfolio value.
+
+    """
+    n_steps, n_assets = close.shape
+    tradable = ~np.isnan(close)
+    # Assets are valued with their last price, and hold no units before their first
+    price = pd.DataFrame(close).ffill().fillna(0).to_numpy()
+
+    volatility = None
+    if unit_strat == "volatility_unit_trades":
+        volatility = _portfolio_volatility(close, tradable, vol_window)
+
+    cash = np.empty(n_steps, dtype=np.float64)
+    units = np.zeros((n_steps, n_assets), dtype=np.float64)
+    value = np.empty(n_steps, dtype=np.float64)
+
+    # Initial investment, split equally among the assets with a price
+    for j in np.flatnonzero(tradable[0]):
+        units[0, j] = math.floor(
+            (initial_depot_cash * start_stock_prct / n_assets) / close[0, j],
+        )
+    cash[0] = initial_depot_cash - (units[0] * price[0]).sum()
+    value[0] = cash[0] + (units[0] * price[0]).sum()
+
+    for i in range(1, n_steps):
+        trade_units = _portfolio_trade_units(
+            close[i],
+            value[i - 1],
+            unit_strat,
+            unit_var,
+            None if volatility is None else volatility[i],
+        )
+        units[i] = units[i - 1]
+        cash[i] = cash[i - 1]
+
+        sell = tradable[i] & (signal[i] == 2) & (units[i - 1] >= trade_units)
+        if sell.any():
+            units[i, sell] -= trade_units[sell]
+            cash[i] += (close[i, sell] * trade_units[sell] * (1 - tac)).sum()
+
+        buy = np.flatnonzero(tradable[i] & (signal[i] == 1))
+        if buy.size:
+            required = close[i, buy] * trade_units[buy]
+            spent = close[i, buy] * trade_units[buy] * (1 + tac)
+            remaining = cash[i] - (np.cumsum(spent) - spent)
+            executed = buy[np.logical_and.accumulate(remaining >= required)]
+            units[i, executed] += trade_units[executed]
+            cash[i] -= spent[: executed.size].sum()
+
+        value[i] = cash[i] + (units[i] * price[i]).sum()
+
+    return cash, units, value
+
+
+def _portfolio_trade_units(close, previous_value, unit_strat, unit_var, volatility):
+    """Determine the number of units to trade of every asset at one time step.
+
+    Args:
+    - close (numpy.ndarray): Closing prices of the assets at the time step.
+    - previous_value (float): The portfolio value of the previous time step.
+    - unit_strat (str): Strategy for determining trade units.
+    - unit_var (float): Variable used in the unit strategy calculation.
+    - volatility (numpy.ndarray or None): Volatility of the assets at the time step from _portfolio_volatility(), NaN where it is not used.
+
+    Returns:
+    - numpy.ndarray: Number of units to trade of each asset.
+
+    """
+    if unit_strat == "fixed_trade_units":
+        return np.full(len(close), float(unit_var))
+
+    with np.errstate(invalid="ignore"):
+        trade_units = np.floor((previous_value * unit_var) / close)
+        if volatility is not None:
+            trade_units = np.where(
+                np.isnan(volatility),
+                trade_units,
+                np.floor(volatility * trade_units),
+            )
+    return trade_units
+
+
+def _portfolio_volatility(close, tradable, vol_window):
+    """Compute the volatility of every asset over its own past vol_window closing
+    prices.
+
+    Time steps where an asset has no price are skipped, so the volatility of an asset
+    is the same as in simulated_depot() on the asset alone.
+
+    Args:
+    - close (numpy.ndarray): float64 matrix of closing prices, NaN where an asset has no price.
+    - tradable (numpy.ndarray): Boolean matrix of the time steps where an asset has a price.
+    - vol_window (int): Number of past closing prices used for the volatility.
+
+    Returns:
+    - numpy.ndarray: Matrix of volatilities, NaN where the volatility is not used, i.e. within the first vol_window + 1 prices of an asset.
+
+    """
+    volatility = np.full(close.shape, np.nan)
+    for j in range(close.shape[1]):
+        rolling_std = _rolling_std(close[tradable[:, j], j], vol_window)
+        # Like simulated_depot(), the volatility is only used after vol_window steps
+        rolling_std[: vol_window + 1] = np.nan
+        volatility[tradable[:, j], j] = rolling_std
+    return volatility
+
+
+def _handle_errors_portfolio_id(_id):
+    """Handle type and value errors for the asset IDs of simulated_portfolio.
+
+    Raises:
+    - TypeError: If _id is not a list.
+    - ValueError: If _id is empty or the assets have different frequencies.
+
+    """
+    if not isinstance(_id, list):
+        msg = f"'_id' has to be of type list and not {type(_id)}."
+        raise TypeError(msg)
+    if not _id:
+        msg = "'_id' is empty. Please specify at least one asset ID for the portfolio."
+        raise ValueError(msg)
+    frequencies = {id.split("_")[0] for id in _id}
+    if len(frequencies) > 1:
+        msg = f"All assets of a portfolio need the same frequency, but '_id' has the frequencies {sorted(frequencies)}."
+        raise ValueError(msg)
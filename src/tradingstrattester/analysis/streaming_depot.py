@@ -0,0 +1,162 @@
+"""Class for simulating a depot event by event, e.g. for paper trading."""
+import math
+from collections import deque
+
+import numpy as np
+from tradingstrattester.analysis.simulated_depot import (
+    _UNIT_STRAT_CODES,
+    __handle_errors_in_sim_depot_config_vars,
+    _depot_step,
+    _handle_errors_vol_window,
+)
+
+
+class StreamingDepot:
+    """Depot which is updated by one (bar, signal) event of an asset at a time.
+
+    The depot applies the per time step rules of simulated_depot(), i.e. the same buy,
+    sell and no signal rules and unit strategies, but only keeps the current cash,
+    units and value of each asset. For 'volatility_unit_trades' the past vol_window
+    closing prices of each asset are kept additionally. Memory usage and the cost of
+    an event therefore do not grow with the number of processed events, and a stream
+    of events returns the same balances as simulated_depot() on the whole history.
+
+    The first event of an asset initializes its balances like simulated_depot(), i.e.
+    start_stock_prct of initial_depot_cash is invested and the signal is ignored. Every
+    asset has its own initial_depot_cash.
+
+    Args:
+    - initial_depot_cash (float): The initial depot cash value of each asset.
+    - start_stock_prct (float): The percentage indicating the portion of the initial depot value to be invested in stocks.
+    - unit_strat (str): Strategy for determining trade units. Supported strategies: 'fixed_trade_units',
+                        'percentage_to_value_trades', 'volatility_unit_trades'.
+    - unit_var (float): Variable used in the unit strategy calculation.
+    - tac (float): Transaction costs per traded unit.
+    - vol_window (int, optional): Number of past closing prices used for the volatility in 'volatility_unit_trades'. Default is 50.
+
+    Attributes:
+    - states (dict): Maps each asset name to its current state, see update().
+
+    """
+
+    def __init__(
+        self,
+        initial_depot_cash,
+        start_stock_prct,
+        unit_strat,
+        unit_var,
+        tac,
+        vol_window=50,
+    ):
+        _handle_errors_streaming_depot(
+            initial_depot_cash,
+            start_stock_prct,
+            unit_strat,
+            unit_var,
+            tac,
+            vol_window,
+        )
+        self.initial_depot_cash = initial_depot_cash
+        self.start_stock_prct = start_stock_prct
+        self.unit_strat = unit_strat
+        self.unit_var = unit_var
+        self.tac = tac
+        self.vol_window = vol_window
+        self.states = {}
+        self._past_closes = {}
+
+    def update(self, asset, bar, signal):
+        """Process the next event of an asset.
+
+        Args:
+        - asset (str): The asset name, e.g. "60m_DB".
+        - bar (Mapping): The next bar of the asset containing at least 'Close'.
+        - signal (int): The trading signal (0, 1 or 2) of the bar, where 2 sells and 1 buys.
+
+        Returns:
+        - dict: The updated state of the asset with the keys 'step' (number of previous events), 'cash', 'units' and 'value'. Every event returns a new dictionary, so returned states are not changed by later events.
+
+        """
+        close = bar["Close"]
+        state = self.states.get(asset)
+
+        if state is None:
+            units = float(
+                math.floor((self.initial_depot_cash * self.start_stock_prct) / close),
+            )
+            cash = self.initial_depot_cash - units * close
+            state = {
+                "step": 0,
+                "cash": cash,
+                "units": units,
+                "value": units * close + cash,
+            }
+            self.states[asset] = state
+            self._past_closes[asset] = deque([close], maxlen=self.vol_window)
+            return dict(state)
+
+        step = state["step"] + 1
+        volatility = 1.0
+        if self.unit_strat == "volatility_unit_trades" and step > self.vol_window:
+            # The buffer holds exactly the past vol_window closing prices
+            volatility = np.std(np.fromiter(self._past_closes[asset], dtype=np.float64))
+        cash, units, value = _depot_step(
+            signal,
+            close,
+            state["cash"],
+            state["units"],
+            state["value"],
+            _UNIT_STRAT_CODES[self.unit_strat],
+            self.unit_var,
+            self.tac,
+            volatility,
+        )
+
+        state = {"step": step, "cash": cash, "units": units, "value": value}
+        self.states[asset] = state
+        if self.unit_strat == "volatility_unit_trades":
+            self._past_closes[asset].append(close)
+
+        return dict(state)
+
+    def balances(self):
+        """Current balances of all assets in the layout of simulated_depot().
+
+        Returns:
+        - dict: Maps 'cash_dict', 'unit_dict' and 'value_dict' to dictionaries of the current balance of each asset.
+
+        """
+        return {
+            "cash_dict": {asset: state["cash"] for asset, state in self.states.items()},
+            "unit_dict": {
+                asset: state["units"] for asset, state in self.states.items()
+            },
+            "value_dict": {
+                asset: state["value"] for asset, state in self.states.items()
+            },
+        }
+
+
+def _handle_errors_streaming_depot(
+    initial_depot_cash,
+    start_stock_prct,
+    unit_strat,
+    unit_var,
+    tac,
+    vol_window,
+):
+    """Handle type and value errors for StreamingDepot.
+
+    Raises:
+    - TypeError: Raises TypeErrors in case inputs have not the right type.
+    - ValueError: Raises ValueErrors in case that inputs aren't in the correct format.
+
+    """
+    __handle_errors_in_sim_depot_config_vars(
+        initial_depot_cash,
+        start_stock_prct,
+        unit_strat,
+        unit_var,
+        tac,
+    )
+    _handle_errors_vol_window(vol_window)
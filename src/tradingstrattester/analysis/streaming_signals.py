@@ -0,0 +1,400 @@
+"""Classes for generating trading signals bar by bar on a live feed."""
+import math
+from collections import deque
+
+from tradingstrattester.analysis.signaling_functions import (
+    _handle_errors_bb,
+    _handle_errors_macd_gen,
+    _handle_errors_rsi,
+)
+
+
+def streaming_signal_generator(generator, **generator_kwargs):
+    """Create a streaming signal generator equivalent to a generator of signal_list().
+
+    Every streaming generator has an update(bar) method which takes the next bar, i.e. a
+    mapping like a dictionary or a row of the DataFrame from data_download(), and
+    returns its signal. The state of a generator only depends on its parameters and not
+    on the number of processed bars, and replaying a history bar by bar returns the same
+    signals as signal_list() on the whole history. The indicators are updated with the
+    online algorithms pandas uses for rolling windows and EMAs, so they only differ from
+    the batch indicators by floating point rounding. Hence, signals can only differ on
+    exact ties, e.g. a closing price lying exactly on a Bollinger Band.
+
+    Parameters:
+    - generator (str): The name of the signal generator, either "_crossover_gen", "_RSI_gen", "_BB_gen" or "_MACD_gen".
+    - **generator_kwargs: Parameters of the signal generator, e.g. period=10 for "_RSI_gen" or window=30 for "_BB_gen".
+
+    Returns:
+    - StreamingCrossover, StreamingRSI, StreamingBollingerBands or StreamingMACD: The streaming signal generator.
+
+    """
+    generators = {
+        "_crossover_gen": StreamingCrossover,
+        "_RSI_gen": StreamingRSI,
+        "_BB_gen": StreamingBollingerBands,
+        "_MACD_gen": StreamingMACD,
+    }
+    if generator not in generators:
+        msg = f"No streaming version of generator '{generator}'. Supported generators are {list(generators)}."
+        raise ValueError(msg)
+    return generators[generator](**generator_kwargs)
+
+
+class StreamingCrossover:
+    """Streaming version of _crossover_signal_gen.
+
+    Only the opening and closing price of the previous bar are kept.
+
+    """
+
+    def __init__(self):
+        self.previous_open = None
+        self.previous_close = None
+
+    def update(self, bar):
+        """Process the next bar.
+
+        Parameters:
+        - bar (Mapping): The next bar containing at least 'Open' and 'Close'.
+
+        Returns:
+        - int: The signal (0, 1 or 2) of the bar.
+
+        """
+        open_price, close_price = bar["Open"], bar["Close"]
+        previous_open, previous_close = self.previous_open, self.previous_close
+        self.previous_open, self.previous_close = open_price, close_price
+
+        # The first bar has no previous bar and therefore no clear pattern
+        if previous_open is None:
+            return 0
+        if (
+            open_price > close_price
+            and previous_open < previous_close
+            and close_price < previous_open
+            and open_price >= previous_close
+        ):
+            return 1
+        if (
+            open_price < close_price
+            and previous_open > previous_close
+            and close_price > previous_open
+            and open_price <= previous_close
+        ):
+            return 2
+        return 0
+
+
+class StreamingRSI:
+    """Streaming version of _rsi_signal_gen.
+
+    The average gains and losses are kept as rolling means over ring buffers of length
+    period.
+
+    """
+
+    def __init__(self, rsi_threshold_low=30, rsi_threshold_high=70, period=14):
+        _handle_errors_rsi(rsi_threshold_low, rsi_threshold_high, period)
+        self.rsi_threshold_low = rsi_threshold_low
+        self.rsi_threshold_high = rsi_threshold_high
+        self.previous_close = math.nan
+        self.avg_gain = _RollingMean(period, min_periods=1)
+        self.avg_loss = _RollingMean(period, min_periods=1)
+
+    def update(self, bar):
+        """Process the next bar.
+
+        Parameters:
+        - bar (Mapping): The next bar containing at least 'Close'.
+
+        Returns:
+        - int: The signal (0, 1 or 2) of the bar.
+
+        """
+        delta = bar["Close"] - self.previous_close
+        self.previous_close = bar["Close"]
+
+        # Same zeros as in _rsi(), where the loss of a time step without loss is -0.0
+        avg_gain = self.avg_gain.update(delta if delta > 0 else 0.0)
+        avg_loss = self.avg_loss.update(-delta if delta < 0 else -0.0)
+
+        if avg_loss == 0:
+            rsi = 100.0 if avg_gain > 0 else math.nan
+        else:
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+
+        if rsi > self.rsi_threshold_high:
+            return 1
+        if rsi < self.rsi_threshold_low:
+            return 2
+        return 0
+
+
+class StreamingBollingerBands:
+    """Streaming version of _bollinger_bands_signal_gen.
+
+    The rolling mean and standard deviation are kept over a ring buffer of length
+    window.
+
+    """
+
+    def __init__(self, window=20, num_std_dev=1.5):
+        _handle_errors_bb(window, num_std_dev)
+        self.num_std_dev = num_std_dev
+        self.rolling_mean = _RollingMean(window, min_periods=window)
+        self.rolling_var = _RollingVar(window, min_periods=window)
+
+    def update(self, bar):
+        """Process the next bar.
+
+        Parameters:
+        - bar (Mapping): The next bar containing at least 'Close'.
+
+        Returns:
+        - int: The signal (0, 1 or 2) of the bar.
+
+        """
+        close_price = bar["Close"]
+        rolling_mean = self.rolling_mean.update(close_price)
+        rolling_var = self.rolling_var.update(close_price)
+        rolling_std = _zsqrt(rolling_var)
+
+        if close_price < rolling_mean - (rolling_std * self.num_std_dev):
+            return 1
+        if close_price > rolling_mean + (rolling_std * self.num_std_dev):
+            return 2
+        return 0
+
+
+class StreamingMACD:
+    """Streaming version of _macd_signal_gen.
+
+    The batch generator scales its threshold with the standard deviation of the MACD
+    line over the whole data, which is not known on a live feed. It can be passed as
+    macd_std, e.g. computed on a history with _macd(). Otherwise the standard deviation
+    of the MACD line up to the current bar is used, so only signals with a given
+    macd_std match the batch generator.
+
+    """
+
+    def __init__(
+        self,
+        fast_period=12,
+        slow_period=26,
+        signal_period=9,
+        threshold_multiplier=0.4,
+        macd_std=None,
+    ):
+        _handle_errors_macd_gen(
+            fast_period,
+            slow_period,
+            signal_period,
+            threshold_multiplier,
+        )
+        self.threshold_multiplier = threshold_multiplier
+        self.macd_std = macd_std
+        self.ema_fast = _EWMMean(fast_period)
+        self.ema_slow = _EWMMean(slow_period)
+        self.ema_signal = _EWMMean(signal_period)
+        self.expanding_var = _RollingVar(None, min_periods=2)
+
+    def update(self, bar):
+        """Process the next bar.
+
+        Parameters:
+        - bar (Mapping): The next bar containing at least 'Close'.
+
+        Returns:
+        - int: The signal (0, 1 or 2) of the bar.
+
+        """
+        macd = self.ema_fast.update(bar["Close"]) - self.ema_slow.update(bar["Close"])
+        signal_line = self.ema_signal.update(macd)
+
+        if self.macd_std is None:
+            macd_std = _zsqrt(self.expanding_var.update(macd))
+        else:
+            macd_std = self.macd_std
+        threshold = self.threshold_multiplier * macd_std
+
+        if macd > signal_line + threshold:
+            return 1
+        if macd < signal_line - threshold:
+            return 2
+        return 0
+
+
+# Online accumulators following the algorithms of pandas for rolling windows and EMAs
+class _RollingMean:
+    """Rolling mean with Kahan summation, like Series.rolling(...).mean().
+
+    Parameters:
+    - window (int): The window size.
+    - min_periods (int): Minimum number of observations in the window for a result.
+
+    """
+
+    def __init__(self, window, min_periods):
+        self.values = deque(maxlen=window)
+        self.min_periods = min_periods
+        self.nobs = 0
+        self.neg_ct = 0
+        self.sum_x = 0.0
+        self.compensation_add = 0.0
+        self.compensation_remove = 0.0
+        self.num_consecutive_same_value = 0
+        self.prev_value = None
+
+    def update(self, value):
+        """Add value to the window, remove the oldest value if the window is full and
+        return the mean of the window.
+        """
+        if len(self.values) == self.values.maxlen:
+            self._remove(self.values[0])
+        self.values.append(value)
+        if self.prev_value is None:
+            self.prev_value = value
+
+        if value == value:
+            self.nobs += 1
+            y = value - self.compensation_add
+            t = self.sum_x + y
+            self.compensation_add = t - self.sum_x - y
+            self.sum_x = t
+            if math.copysign(1.0, value) < 0:
+                self.neg_ct += 1
+            if value == self.prev_value:
+                self.num_consecutive_same_value += 1
+            else:
+                self.num_consecutive_same_value = 1
+            self.prev_value = value
+
+        if self.nobs < self.min_periods or self.nobs == 0:
+            return math.nan
+        if self.num_consecutive_same_value >= self.nobs:
+            return self.prev_value
+        result = self.sum_x / self.nobs
+        if (self.neg_ct == 0 and result < 0) or (
+            self.neg_ct == self.nobs and result > 0
+        ):
+            return 0.0
+        return result
+
+    def _remove(self, value):
+        if value == value:
+            self.nobs -= 1
+            y = -value - self.compensation_remove
+            t = self.sum_x + y
+            self.compensation_remove = t - self.sum_x - y
+            self.sum_x = t
+            if math.copysign(1.0, value) < 0:
+                self.neg_ct -= 1
+
+
+class _RollingVar:
+    """Rolling variance (ddof=1) with Welford's algorithm, like
+    Series.rolling(...).var().
+
+    Parameters:
+    - window (int or None): The window size. If None, the window is expanding.
+    - min_periods (int): Minimum number of observations in the window for a result.
+
+    """
+
+    def __init__(self, window, min_periods):
+        self.values = deque(maxlen=window)
+        self.min_periods = min_periods
+        self.nobs = 0
+        self.mean_x = 0.0
+        self.ssqdm_x = 0.0
+        self.compensation_add = 0.0
+        self.compensation_remove = 0.0
+        self.num_consecutive_same_value = 0
+        self.prev_value = None
+
+    def update(self, value):
+        """Add value to the window, remove the oldest value if the window is full and
+        return the variance of the window.
+        """
+        if len(self.values) == self.values.maxlen:
+            self._remove(self.values[0])
+        if self.values.maxlen is not None:
+            self.values.append(value)
+        if self.prev_value is None:
+            self.prev_value = value
+
+        if value == value:
+            if value == self.prev_value:
+                self.num_consecutive_same_value += 1
+            else:
+                self.num_consecutive_same_value = 1
+            self.prev_value = value
+            self.nobs += 1
+            prev_mean = self.mean_x - self.compensation_add
+            y = value - self.compensation_add
+            t = y - self.mean_x
+            self.compensation_add = t + self.mean_x - y
+            self.mean_x += t / self.nobs
+            self.ssqdm_x += (value - prev_mean) * (value - self.mean_x)
+
+        if self.nobs < self.min_periods or self.nobs <= 1:
+            return math.nan
+        if self.num_consecutive_same_value >= self.nobs:
+            return 0.0
+        return self.ssqdm_x / (self.nobs - 1)
+
+    def _remove(self, value):
+        if value == value:
+            self.nobs -= 1
+            if self.nobs:
+                prev_mean = self.mean_x - self.compensation_remove
+                y = value - self.compensation_remove
+                t = y - self.mean_x
+                self.compensation_remove = t + self.mean_x - y
+                self.mean_x -= t / self.nobs
+                self.ssqdm_x -= (value - prev_mean) * (value - self.mean_x)
+            else:
+                self.mean_x = 0.0
+                self.ssqdm_x = 0.0
+
+
+def _zsqrt(var):
+    """Square root of a variance, which is 0 for negative rounding artifacts."""
+    if var != var:
+        return math.nan
+    return math.sqrt(max(var, 0.0))
+
+
+class _EWMMean:
+    """Exponentially weighted mean with adjust=True, like
+    Series.ewm(span=span, min_periods=span).mean().
+
+    Parameters:
+    - span (int): The number of periods of the EMA.
+
+    """
+
+    def __init__(self, span):
+        self.min_periods = span
+        self.old_wt_factor = 1 - 2 / (span + 1)
+        self.old_wt = 1.0
+        self.weighted = math.nan
+        self.nobs = 0
+
+    def update(self, value):
+        """Add value and return the exponentially weighted mean."""
+        is_observation = value == value
+        self.nobs += is_observation
+
+        if self.weighted == self.weighted:
+            self.old_wt *= self.old_wt_factor
+            if is_observation:
+                if self.weighted != value:
+                    self.weighted = self.old_wt * self.weighted + value
+                    self.weighted /= self.old_wt + 1.0
+                self.old_wt += 1.0
+        elif is_observation:
+            self.weighted = value
+
+        return self.weighted if self.nobs >= self.min_periods else math.nan
@@ -9,11 +9,18 @@ TEST_DIR = SRC.joinpath("..", "..", "tests").resolve()
 ## Downloading financial data configurations
 # possible frequencies: 1m, 2m, 5m, 15m, 30m, 60m, 1d, 5d, 1wk, 1mo, 3mo
 FREQUENCIES = ["60m", "1d", "1wk"]
+# frequencies of FREQUENCIES derived from the finest downloaded frequency instead of downloaded, e.g. ["1wk"]
+RESAMPLE_FREQUENCIES = []
 # date format is YYYY-MM-DD
 START_DATE = "2018-01-01"
 END_DATE = "2024-03-01"
 # Symbols that include '.' or '_' are not suitable!
 ASSETS = ["DB", "KO", "^GSPC", "EURUSD=X", "CL=F"]
+# source of the financial data: "yfinance" or "synthetic" (offline data of SYNTHETIC_MODEL)
+DATA_SOURCE = "yfinance"
+# possible synthetic models: "gbm", "jump_diffusion", "regime_switching"
+SYNTHETIC_MODEL = "gbm"
+SYNTHETIC_SEED = 0
 
 ## Simulating depot configurations
 # possible signaling strategies: "_random_gen", "_crossover_gen", "_RSI_gen", "_BB_gen", "_MACD_gen"
@@ -21,11 +28,23 @@ STRATEGIES = ["_random_gen", "_crossover_gen", "_RSI_gen", "_BB_gen", "_MACD_gen
 # possible unit trading strategies: "fixed_trade_units", "percentage_to_value_trades", "volatility_unit_trades"
 UNIT_STRAT = "percentage_to_value_trades"
 UNIT_VAR = 0.05  # variable used in unit trade strategies (positive int / float)
+VOL_WINDOW = (
+    50  # number of past closing prices used in "volatility_unit_trades" (positive int)
+)
 INITIAL_DEPOT_CASH = (
     10_000  # determines initial total depot value (positive int / float)
 )
 START_STOCK_PRCT = 0.25  # determines how much of the initial cash will be invested in assets (positive int / float)
 TAC = 0.0005  # transactionscosts per transaction (= trade_units * tac) (positive int / float)
+# maximum size in bytes of the cache of signal lists and depot results in bld/python/results, which keeps the results of previous configurations (positive int)
+RESULT_CACHE_SIZE = 1_000_000_000
+
+## Plotting configurations
+PLOT_MAX_POINTS = 5_000  # maximum number of points per trace of the plots (positive int >= 4 or None for all bars)
+
+## Profiling configurations
+# time and count the work of every stage and write a report to bld/profiling (also enabled by TRADINGSTRATTESTER_PROFILE=1)
+PROFILE = False
 
 
 _ID = [f"{frequency}_{asset}.pkl" for frequency in FREQUENCIES for asset in ASSETS]
@@ -36,14 +55,22 @@ __all__ = [
     "SRC",
     "TEST_DIR",
     "ASSETS",
+    "DATA_SOURCE",
+    "SYNTHETIC_MODEL",
+    "SYNTHETIC_SEED",
     "START_DATE",
     "END_DATE",
     "FREQUENCIES",
+    "RESAMPLE_FREQUENCIES",
     "_ID",
     "STRATEGIES",
     "INITIAL_DEPOT_CASH",
     "START_STOCK_PRCT",
     "UNIT_STRAT",
     "UNIT_VAR",
+    "VOL_WINDOW",
     "TAC",
+    "RESULT_CACHE_SIZE",
+    "PLOT_MAX_POINTS",
+    "PROFILE",
 ]
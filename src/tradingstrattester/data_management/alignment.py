@@ -0,0 +1,312 @@
+"""Functions for aligning assets on a common time index and resampling bars."""
+
+import hashlib
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+from tradingstrattester.config import BLD
+from tradingstrattester.data_management.price_store import (
+    PRICE_STORE,
+    _handle_errors_price_id,
+    _read_price_arrays,
+    _write_price_arrays,
+    price_store_path,
+    read_price_view,
+)
+
+ALIGNED_STORE = BLD / "python" / "aligned"
+
+# Supported frequencies from the finest to the coarsest and their pandas offset
+# aliases. Bins are closed and labeled on the left like the bars of yfinance.
+_FREQUENCY_RULES = {
+    "1m": "1min",
+    "2m": "2min",
+    "5m": "5min",
+    "15m": "15min",
+    "30m": "30min",
+    "60m": "60min",
+    "1d": "1D",
+    "5d": "5D",
+    "1wk": "W-MON",
+    "1mo": "MS",
+    "3mo": "QS",
+}
+
+# Aggregation of the columns of data_download() when bars are resampled
+_OHLCV_AGGREGATION = {
+    "Open": "first",
+    "High": "max",
+    "Low": "min",
+    "Close": "last",
+    "Adj Close": "last",
+    "Volume": "sum",
+}
+
+
+def align_prices(
+    _id,
+    column="Close",
+    how="union",
+    root=PRICE_STORE,
+    cache=ALIGNED_STORE,
+):
+    """Align a column of several assets on a common time index.
+
+    Different assets have different trading calendars, e.g. "EURUSD=X" trades on days
+    on which "DB" does not. The column of each asset is read from the price store and
+    the assets are joined on the union or the intersection of their time steps. Bars
+    of intraday frequencies are aligned in UTC. Bars of daily and coarser frequencies
+    are aligned on their date in the time zone of their exchange, as yfinance labels
+    them with local midnight.
+
+    The aligned matrix is cached in cache as memory-mappable .npy files, like the
+    price store does for single assets, and is read as a zero-copy view as long as
+    none of the assets was written again since. Every version of the assets gets its
+    own cache directory, which is written to a temporary directory and renamed into
+    place, so concurrent calls never read or change a partially written matrix.
+
+    Args:
+    - _id (list): The asset IDs, which all have to have the same frequency, e.g. ["1d_DB.pkl", "1d_KO.pkl"].
+    - column (str, optional): The column to align. Default is "Close".
+    - how (str, optional): "union" to keep every time step of any asset, with NaN where an asset has no bar, or "intersection" to keep only the time steps of all assets. Default is "union".
+    - root (pathlib.Path, optional): Root directory of the price store. Default is bld/python/data.
+    - cache (pathlib.Path, optional): Directory of the cached aligned matrices. Default is bld/python/aligned.
+
+    Returns:
+    - pandas.DataFrame: A read-only (time steps x assets) DataFrame with one column per asset, named like the ID without ending, e.g. "1d_DB".
+
+    """
+    _handle_errors_align_prices(_id, column, how)
+
+    key = json.dumps([_id, column, how])
+    entry = cache / hashlib.sha256(key.encode()).hexdigest()[:16]
+    source = {id: _source_fingerprint(id, root) for id in _id}
+    path = entry / hashlib.sha256(json.dumps(source).encode()).hexdigest()[:16]
+
+    if path.exists():
+        return _read_price_arrays(path / "arrays", None, _id)
+
+    frequency = _id[0].split("_")[0]
+    columns = []
+    for id in _id:
+        prices = read_price_view(id, columns=[column], root=root)[column]
+        prices.index = _alignment_index(prices.index, frequency)
+        columns.append(prices[~prices.index.duplicated(keep="last")])
+
+    aligned = pd.concat(
+        columns,
+        axis=1,
+        join="outer" if how == "union" else "inner",
+        keys=[id.split(".")[0] for id in _id],
+    ).sort_index()
+
+    entry.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(prefix=".", dir=entry))
+    _write_price_arrays(aligned, tmp)
+    try:
+        tmp.rename(path)
+    except OSError:
+        # Another call has written the same version in the meantime
+        shutil.rmtree(tmp, ignore_errors=True)
+    else:
+        # Matrices of previous versions of the assets, but not unfinished writes
+        for stale in entry.iterdir():
+            if stale != path and not stale.name.startswith("."):
+                shutil.rmtree(stale, ignore_errors=True)
+
+    return _read_price_arrays(path / "arrays", None, _id)
+
+
+def resample_prices(data, frequency):
+    """Derive coarser bars from the bars of the financial data.
+
+    The bars are grouped into bins of the coarser frequency, which are closed and
+    labeled on the left like the bars of yfinance, i.e. a daily bar of a time zone aware
+    index starts at local midnight and a weekly bar on Monday. Within each bin, the
+    columns are aggregated in one vectorized group-by: 'Open' is the first, 'High' the
+    maximum, 'Low' the minimum, 'Close' and 'Adj Close' the last value and 'Volume' the
+    sum. Other columns take the last value. Bins without any bar are dropped.
+
+    Args:
+    - data (pandas.DataFrame): A DataFrame containing the financial data from data_download() with a DatetimeIndex.
+    - frequency (str): The frequency of the resampled bars, e.g. "1d" or "1wk".
+
+    Returns:
+    - pandas.DataFrame: A DataFrame containing the resampled financial data.
+
+    """
+    _handle_errors_resample_prices(data, frequency)
+
+    aggregation = {col: _OHLCV_AGGREGATION.get(col, "last") for col in data.columns}
+    out = data.resample(
+        _FREQUENCY_RULES[frequency],
+        closed="left",
+        label="left",
+    ).agg(aggregation)
+
+    # Sums of empty bins are 0, so only the other columns mark empty bins
+    has_bar = (
+        data.index.to_series()
+        .resample(
+            _FREQUENCY_RULES[frequency],
+            closed="left",
+            label="left",
+        )
+        .count()
+    )
+    return out[has_bar.to_numpy() > 0]
+
+
+def derive_prices(id, frequency, root=PRICE_STORE):
+    """Derive the financial data of an asset for a coarser frequency from the bars in
+    the price store, without downloading it.
+
+    Args:
+    - id (str): The identifier of the stored asset with the finer frequency, e.g. "60m_DB.pkl".
+    - frequency (str): The coarser frequency, e.g. "1d" or "1wk".
+    - root (pathlib.Path, optional): Root directory of the price store. Default is bld/python/data.
+
+    Returns:
+    - pandas.DataFrame: A DataFrame containing the resampled financial data, which can be stored with write_prices() as f"{frequency}_{symbol}.pkl".
+
+    """
+    _handle_errors_price_id(id)
+    _handle_errors_coarser_frequency(id.split("_")[0], frequency)
+    return resample_prices(read_price_view(id, root=root), frequency)
+
+
+def split_frequencies(frequencies, resample_frequencies):
+    """Split frequencies into the ones which are downloaded and the ones which are
+    derived with derive_prices().
+
+    Args:
+    - frequencies (list): All frequencies of the project, e.g. FREQUENCIES of config.py.
+    - resample_frequencies (list): The frequencies which are derived instead of downloaded.
+
+    Returns:
+    - tuple: The list of frequencies to download and the finest of them, from which the other frequencies are derived.
+
+    Raises:
+    - ValueError: If a derived frequency is not in frequencies, all frequencies are derived or a derived frequency is not coarser than the finest downloaded one.
+
+    """
+    for frequency in resample_frequencies:
+        if frequency not in frequencies:
+            msg = f"The resampled frequency '{frequency}' is not one of the frequencies {frequencies}."
+            raise ValueError(msg)
+
+    download_frequencies = [f for f in frequencies if f not in resample_frequencies]
+    if not download_frequencies:
+        msg = "All frequencies are resampled. Please download at least one frequency to resample the others from."
+        raise ValueError(msg)
+
+    source_frequency = min(download_frequencies, key=list(_FREQUENCY_RULES).index)
+    for frequency in resample_frequencies:
+        _handle_errors_coarser_frequency(source_frequency, frequency)
+
+    return download_frequencies, source_frequency
+
+
+def _alignment_index(index, frequency):
+    """Map the index of an asset to the index it is aligned on in align_prices().
+
+    Args:
+    - index (pandas.DatetimeIndex): The index of the asset.
+    - frequency (str): The frequency of the asset.
+
+    Returns:
+    - pandas.DatetimeIndex: The index in UTC for intraday frequencies and the time zone naive local dates otherwise.
+
+    """
+    if index.tz is None:
+        return index
+    if list(_FREQUENCY_RULES).index(frequency) < list(_FREQUENCY_RULES).index("1d"):
+        return index.tz_convert("UTC")
+    return index.tz_localize(None).normalize()
+
+
+def _source_fingerprint(id, root):
+    """Fingerprint of the stored arrays of an asset, which changes when the asset is
+    written again.
+
+    Args:
+    - id (str): The identifier for the asset including the ending "[...].pkl", e.g. "60m_DB.pkl".
+    - root (pathlib.Path): Root directory of the price store.
+
+    Returns:
+    - list: The modification time in nanoseconds and the size of the asset's index file, or None if the asset is not stored.
+
+    """
+    path = price_store_path(id, root) / "arrays" / "index.npy"
+    if not path.exists():
+        return None
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _handle_errors_align_prices(_id, column, how):
+    """Handle type and value errors for align_prices.
+
+    Raises:
+    - TypeError: If _id is not a list or column is not a string.
+    - ValueError: If _id is empty, the assets have different frequencies or how is neither "union" nor "intersection".
+
+    """
+    if not isinstance(_id, list):
+        msg = f"'_id' has to be of type list and not {type(_id)}."
+        raise TypeError(msg)
+    if not _id:
+        msg = "'_id' is empty. Please specify at least one asset ID to align."
+        raise ValueError(msg)
+    for id in _id:
+        _handle_errors_price_id(id)
+    frequencies = {id.split("_")[0] for id in _id}
+    if len(frequencies) > 1:
+        msg = f"Only assets of the same frequency can be aligned, but '_id' has the frequencies {sorted(frequencies)}."
+        raise ValueError(msg)
+
+    if not isinstance(column, str):
+        msg = f"'column' has to be of type str and not {type(column)}."
+        raise TypeError(msg)
+    if how not in ["union", "intersection"]:
+        msg = f"'how' has to be either 'union' or 'intersection' and not '{how}'."
+        raise ValueError(msg)
+
+
+def _handle_errors_resample_prices(data, frequency):
+    """Handle type and value errors for resample_prices.
+
+    Raises:
+    - TypeError: If data is not a DataFrame with a DatetimeIndex.
+    - ValueError: If frequency is not supported.
+
+    """
+    if not isinstance(data, pd.DataFrame):
+        msg = f"'data' has to be a pandas.DataFrame and not {type(data)}."
+        raise TypeError(msg)
+    if not isinstance(data.index, pd.DatetimeIndex):
+        msg = f"The index of 'data' has to be a pandas.DatetimeIndex and not {type(data.index)}."
+        raise TypeError(msg)
+    if frequency not in _FREQUENCY_RULES:
+        msg = f"Frequency '{frequency}' is not supported. Supported frequencies are {list(_FREQUENCY_RULES)}."
+        raise ValueError(msg)
+
+
+def _handle_errors_coarser_frequency(source_frequency, frequency):
+    """Handle value errors for the frequencies of derive_prices.
+
+    Raises:
+    - ValueError: If a frequency is not supported or frequency is not coarser than source_frequency.
+
+    """
+    for value in [source_frequency, frequency]:
+        if value not in _FREQUENCY_RULES:
+            msg = f"Frequency '{value}' is not supported. Supported frequencies are {list(_FREQUENCY_RULES)}."
+            raise ValueError(msg)
+    frequencies = list(_FREQUENCY_RULES)
+    if frequencies.index(frequency) <= frequencies.index(source_frequency):
+        msg = f"Bars of frequency '{frequency}' can not be derived from the equal or coarser frequency '{source_frequency}'."
+        raise ValueError(msg)
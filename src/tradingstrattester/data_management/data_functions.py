@@ -1,13 +1,27 @@
 """Functions for downloading financial data."""
 
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime, timedelta
 
+import pandas as pd
 import yfinance as yf
-from tradingstrattester.config import FREQUENCIES
+from tradingstrattester.config import BLD, FREQUENCIES
+from tradingstrattester.data_management.price_store import (
+    append_prices,
+    read_coverage,
+    read_prices,
+    write_coverage,
+    write_prices,
+)
+from tradingstrattester.profiling import count, profiled
 
+DOWNLOAD_CACHE = BLD / "python" / "download_cache"
 
-def data_download(symbol, frequency, start_date=None, end_date=None):
+
+@profiled("data")
+def data_download(symbol, frequency, start_date=None, end_date=None, fetcher=None):
     """Download financial data for a given stock symbol within a specified time range
     and frequency.
 
@@ -16,15 +30,18 @@ def data_download(symbol, frequency, start_date=None, end_date=None):
     - frequency (str, optional): The frequency of the data, e.g. "5m", "60m", "1d".
     - start_date (str, optional): The start date in the format "YYYY-MM-DD". If None, start_date will be set to the maximum possible time difference.
     - end_date (str, optional): The end date in the format "YYYY-MM-DD". If None, end_date will be set to today's date.
+    - fetcher (callable, optional): Function fetcher(symbol, start_date, end_date, frequency) returning a DataFrame for the half-open range [start_date, end_date). If None, the data is downloaded from Yahoo Finance.
 
     Returns:
     pandas.DataFrame: A DataFrame containing the financial data.
 
     """
     _handle_errors_data_download(start_date, end_date, frequency)
+    _handle_errors_fetcher(fetcher)
     dates = _define_dates(frequency=frequency, start_date=start_date, end_date=end_date)
 
-    temp = yf.download(symbol, start=dates[0], end=dates[1], interval=frequency)
+    fetcher = _yfinance_fetcher if fetcher is None else fetcher
+    temp = fetcher(symbol, dates[0], dates[1], frequency)
 
     if temp.empty:
         msg = f"Input symbol ('{symbol}') is invalid. Please choose a valid input ticker-symbol from Yahoo Finance."
@@ -33,9 +50,413 @@ def data_download(symbol, frequency, start_date=None, end_date=None):
     else:
         out = temp
 
+    count("data", "data_download", bars=len(out))
+    return out
+
+
+def cached_data_download(
+    symbol,
+    frequency,
+    start_date=None,
+    end_date=None,
+    root=DOWNLOAD_CACHE,
+    fetcher=None,
+):
+    """Download financial data incrementally, using a local price store as cache.
+
+    The cache remembers which date ranges it holds for every symbol and frequency (see
+    read_coverage()). Only the gaps between the requested and the cached ranges are
+    fetched. Data after the last cached time step is appended, data before it is
+    merged into the cached data. The requested range is limited to the maximum
+    lookback of the frequency in the same way as in data_download().
+
+    A fetched gap is only recorded as cached until the day after its last returned
+    time step, as Yahoo Finance returns no data instead of raising for failed
+    downloads. A gap without any data, e.g. of an invalid symbol or a failed download,
+    is therefore never recorded and tried again by the next call, and so is the end of
+    a gap after the last returned time step, e.g. a weekend.
+
+    Args:
+    - symbol (str): The stock symbol for which data is being downloaded.
+    - frequency (str): The frequency of the data, e.g. "5m", "60m", "1d".
+    - start_date (str, optional): The start date in the format "YYYY-MM-DD". If None, start_date will be set to the maximum possible time difference.
+    - end_date (str, optional): The end date in the format "YYYY-MM-DD". If None, end_date will be set to today's date.
+    - root (pathlib.Path, optional): Root directory of the cache. Default is bld/python/download_cache.
+    - fetcher (callable, optional): Function fetcher(symbol, start_date, end_date, frequency) returning a DataFrame for the half-open range [start_date, end_date). If None, the data is downloaded from Yahoo Finance.
+
+    Returns:
+    pandas.DataFrame: A DataFrame containing the financial data from start_date until (excluding) end_date.
+
+    """
+    _handle_errors_data_download(start_date, end_date, frequency)
+    _handle_errors_fetcher(fetcher)
+    dates = _define_dates(frequency=frequency, start_date=start_date, end_date=end_date)
+
+    fetcher = _yfinance_fetcher if fetcher is None else fetcher
+    id = f"{frequency}_{symbol}.pkl"
+    coverage = read_coverage(id, root)
+
+    for gap in _missing_ranges(coverage, dates[0], dates[1]):
+        new_data = fetcher(symbol, gap[0], gap[1], frequency)
+        coverage = _cache_gap(new_data, id, root, coverage, gap)
+
+    return _read_cached(symbol, id, root, dates)
+
+
+@profiled("data")
+def bulk_data_download(
+    assets,
+    frequencies,
+    start_date=None,
+    end_date=None,
+    root=DOWNLOAD_CACHE,
+    batch_size=10,
+    max_workers=4,
+    retries=3,
+    backoff=1.0,
+    fetcher=None,
+):
+    """Download financial data of many symbols and frequencies through the download
+    cache with batched, concurrent requests.
+
+    Symbols of the same frequency which miss the same date range in the cache (see
+    cached_data_download()) are fetched together, in batches of at most batch_size
+    symbols per request. The requests run on a pool of max_workers threads and are
+    retried with exponential backoff (backoff, 2 * backoff, 4 * backoff, ... seconds)
+    if they raise an exception. As Yahoo Finance reports failed downloads by returning
+    no data instead of raising, symbols without any data are retried as well. The
+    combined frames are split into the data of each symbol and added to the cache as
+    soon as their request is done.
+
+    Args:
+    - assets (list): The stock symbols for which data is being downloaded, e.g. ASSETS from the config.py file.
+    - frequencies (list): The frequencies of the data, e.g. FREQUENCIES from the config.py file.
+    - start_date (str, optional): The start date in the format "YYYY-MM-DD". If None, start_date will be set to the maximum possible time difference of each frequency.
+    - end_date (str, optional): The end date in the format "YYYY-MM-DD". If None, end_date will be set to today's date.
+    - root (pathlib.Path, optional): Root directory of the cache. Default is bld/python/download_cache.
+    - batch_size (int, optional): Maximum number of symbols per request. Default is 10.
+    - max_workers (int, optional): Maximum number of concurrent requests. Default is 4.
+    - retries (int, optional): Number of retries of a failed request. Default is 3.
+    - backoff (float, optional): Seconds to wait before the first retry. Default is 1.0.
+    - fetcher (callable, optional): Function fetcher(symbols, start_date, end_date, frequency) returning one DataFrame for the half-open range [start_date, end_date) whose columns have the symbols as first level. If None, the data is downloaded from Yahoo Finance.
+
+    Returns:
+    dict: Maps each ID "frequency_symbol.pkl" (as in _ID of the config.py file) to a DataFrame containing its financial data from start_date until (excluding) end_date.
+
+    """
+    _handle_errors_bulk_data_download(
+        assets,
+        frequencies,
+        batch_size,
+        max_workers,
+        retries,
+        backoff,
+    )
+    for frequency in frequencies:
+        _handle_errors_data_download(start_date, end_date, frequency)
+    _handle_errors_fetcher(fetcher)
+
+    fetcher = _yfinance_batch_fetcher if fetcher is None else fetcher
+    dates = {
+        frequency: _define_dates(frequency, start_date, end_date)
+        for frequency in frequencies
+    }
+    coverage = {
+        f"{frequency}_{symbol}.pkl": read_coverage(f"{frequency}_{symbol}.pkl", root)
+        for frequency in frequencies
+        for symbol in assets
+    }
+
+    # Group the symbols by frequency and missing date range
+    requests = {}
+    for frequency in frequencies:
+        for symbol in assets:
+            id = f"{frequency}_{symbol}.pkl"
+            for gap in _missing_ranges(coverage[id], *dates[frequency]):
+                requests.setdefault((frequency, gap), []).append(symbol)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                _fetch_with_retries,
+                fetcher,
+                symbols[i : i + batch_size],
+                gap,
+                frequency,
+                retries,
+                backoff,
+            ): (frequency, gap, symbols[i : i + batch_size])
+            for (frequency, gap), symbols in requests.items()
+            for i in range(0, len(symbols), batch_size)
+        }
+        # The cache is only written by this thread
+        for future in as_completed(futures):
+            frequency, gap, symbols = futures[future]
+            batch = future.result()
+            for symbol in symbols:
+                id = f"{frequency}_{symbol}.pkl"
+                coverage[id] = _cache_gap(batch[symbol], id, root, coverage[id], gap)
+
+    return {
+        f"{frequency}_{symbol}.pkl": _read_cached(
+            symbol,
+            f"{frequency}_{symbol}.pkl",
+            root,
+            dates[frequency],
+        )
+        for frequency in frequencies
+        for symbol in assets
+    }
+
+
+def _yfinance_fetcher(symbol, start_date, end_date, frequency):
+    """Download financial data from Yahoo Finance.
+
+    Args:
+    - symbol (str): The stock symbol for which data is being downloaded.
+    - start_date (str): The start date in the format "YYYY-MM-DD".
+    - end_date (str): The (excluded) end date in the format "YYYY-MM-DD".
+    - frequency (str): The frequency of the data, e.g. "5m", "60m", "1d".
+
+    Returns:
+    pandas.DataFrame: A DataFrame containing the financial data, empty if there is none.
+
+    """
+    return yf.download(symbol, start=start_date, end=end_date, interval=frequency)
+
+
+def _yfinance_batch_fetcher(symbols, start_date, end_date, frequency):
+    """Download the financial data of several symbols from Yahoo Finance at once.
+
+    The symbols of one call are downloaded one after another, as the requests are
+    already run concurrently by the thread pool of bulk_data_download().
+
+    Args:
+    - symbols (list): The stock symbols for which data is being downloaded.
+    - start_date (str): The start date in the format "YYYY-MM-DD".
+    - end_date (str): The (excluded) end date in the format "YYYY-MM-DD".
+    - frequency (str): The frequency of the data, e.g. "5m", "60m", "1d".
+
+    Returns:
+    pandas.DataFrame: A DataFrame whose columns have the symbols as first level.
+
+    """
+    return yf.download(
+        symbols,
+        start=start_date,
+        end=end_date,
+        interval=frequency,
+        group_by="ticker",
+        threads=False,
+    )
+
+
+@profiled("data")
+def _fetch_with_retries(fetcher, symbols, gap, frequency, retries, backoff):
+    """Call a batch fetcher and retry it with exponential backoff if it fails.
+
+    Symbols without any data in the result of the fetcher, e.g. because their
+    download failed, are retried with the next attempt, while the data of the other
+    symbols is kept.
+
+    Args:
+    - fetcher (callable): Function fetcher(symbols, start_date, end_date, frequency).
+    - symbols (list): The stock symbols of the batch.
+    - gap (tuple): The [start_date, end_date) pair to fetch.
+    - frequency (str): The frequency of the data, e.g. "5m", "60m", "1d".
+    - retries (int): Number of retries.
+    - backoff (float): Seconds to wait before the first retry.
+
+    Returns:
+    dict: Maps each symbol to its DataFrame (see _split_batch()), which is empty if the symbol has no data after the last attempt.
+
+    Raises:
+    - Exception: The exception of the last attempt if it failed.
+
+    """
+    out = {symbol: pd.DataFrame() for symbol in symbols}
+    pending = list(symbols)
+    for attempt in range(retries + 1):
+        try:
+            batch = _split_batch(fetcher(pending, gap[0], gap[1], frequency), pending)
+        except Exception:
+            if attempt == retries:
+                raise
+        else:
+            out.update(batch)
+            count("data", "_fetch_with_retries", bars=sum(map(len, batch.values())))
+            pending = [symbol for symbol in pending if batch[symbol].empty]
+            if not pending or attempt == retries:
+                return out
+        count("data", "_fetch_with_retries", retries=1)
+        time.sleep(backoff * 2**attempt)
+    return out
+
+
+def _split_batch(data, symbols):
+    """Split the combined frame of a batch request into one DataFrame per symbol.
+
+    Rows without any data of a symbol, e.g. time steps where only other symbols were
+    traded, are dropped.
+
+    Args:
+    - data (pandas.DataFrame): Result of a batch fetcher, with the symbols as first column level.
+    - symbols (list): The stock symbols of the batch.
+
+    Returns:
+    dict: Maps each symbol to its DataFrame, which is empty if the symbol has no data.
+
+    """
+    if not isinstance(data.columns, pd.MultiIndex):
+        # A single symbol may be returned without the symbol column level
+        if len(symbols) == 1:
+            return {symbols[0]: data.dropna(how="all")}
+        return {symbol: pd.DataFrame() for symbol in symbols}
+
+    out = {}
+    for symbol in symbols:
+        if symbol in data.columns.get_level_values(0):
+            out[symbol] = data[symbol].dropna(how="all")
+        else:
+            out[symbol] = pd.DataFrame()
     return out
 
 
+def _cache_gap(data, id, root, coverage, gap):
+    """Add the data fetched for a missing date range to the cache.
+
+    The gap is only recorded as cached from its start until the day after the last
+    fetched time step. An empty result, e.g. of a failed download, is not recorded at
+    all, so the missing dates are fetched again by the next download.
+
+    Args:
+    - data (pandas.DataFrame): The fetched financial data.
+    - id (str): The identifier for the asset, e.g. "60m_DB.pkl".
+    - root (pathlib.Path): Root directory of the cache.
+    - coverage (list): The cached date ranges from read_coverage().
+    - gap (tuple): The fetched [start_date, end_date) pair.
+
+    Returns:
+    list: The updated cached date ranges.
+
+    """
+    if data.empty:
+        return coverage
+    _store_prices(data, id, root)
+    # Dates refer to the local time of time zone aware indices, like in _select_dates()
+    fetched_end = (data.index.max().date() + timedelta(days=1)).isoformat()
+    # Written after every gap, so an interrupted download keeps its progress
+    return write_coverage([*coverage, (gap[0], min(gap[1], fetched_end))], id, root)
+
+
+def _read_cached(symbol, id, root, dates):
+    """Read the cached data of an asset within the requested dates.
+
+    Args:
+    - symbol (str): The stock symbol of the asset.
+    - id (str): The identifier for the asset, e.g. "60m_DB.pkl".
+    - root (pathlib.Path): Root directory of the cache.
+    - dates (tuple): The start and (excluded) end date in the format "YYYY-MM-DD".
+
+    Returns:
+    pandas.DataFrame: A DataFrame containing the financial data.
+
+    Raises:
+    - TypeError: If there is no data within the dates, i.e. the symbol is invalid.
+
+    """
+    try:
+        data = read_prices(id, root=root)
+    except FileNotFoundError:
+        data = pd.DataFrame()
+    out = _select_dates(data, dates[0], dates[1])
+
+    if out.empty:
+        msg = f"Input symbol ('{symbol}') is invalid. Please choose a valid input ticker-symbol from Yahoo Finance."
+        raise TypeError(msg)
+
+    return out
+
+
+def _missing_ranges(coverage, start_date, end_date):
+    """Determine the parts of a date range which are not covered yet.
+
+    Args:
+    - coverage (list): Sorted, non-overlapping [start_date, end_date) pairs from read_coverage().
+    - start_date (str): The start date in the format "YYYY-MM-DD".
+    - end_date (str): The (excluded) end date in the format "YYYY-MM-DD".
+
+    Returns:
+    list: The uncovered [start_date, end_date) pairs in chronological order.
+
+    """
+    gaps = []
+    cursor = start_date
+    # ISO formatted dates compare chronologically as strings
+    for covered_start, covered_end in coverage:
+        if covered_end <= cursor:
+            continue
+        if covered_start >= end_date:
+            break
+        if covered_start > cursor:
+            gaps.append((cursor, covered_start))
+        cursor = covered_end
+    if cursor < end_date:
+        gaps.append((cursor, end_date))
+    return gaps
+
+
+def _store_prices(data, id, root):
+    """Add fetched data to the cached data of an asset.
+
+    Data after the last cached time step is appended as a new part file. Otherwise the
+    cached and the fetched data are merged and written again, where fetched rows
+    replace cached rows with the same time step.
+
+    Args:
+    - data (pandas.DataFrame): The fetched financial data.
+    - id (str): The identifier for the asset, e.g. "60m_DB.pkl".
+    - root (pathlib.Path): Root directory of the cache.
+
+    """
+    try:
+        last_index = read_prices(id, columns=[], root=root).index.max()
+    except FileNotFoundError:
+        write_prices(data, id, root)
+        return
+
+    if data.index.min() > last_index:
+        append_prices(data, id, root)
+    else:
+        merged = pd.concat([read_prices(id, root=root), data])
+        merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+        write_prices(merged, id, root)
+
+
+def _select_dates(data, start_date, end_date):
+    """Select the rows of data from start_date until (excluding) end_date.
+
+    The dates refer to the local time of time zone aware indices, like the dates of
+    the downloads.
+
+    Args:
+    - data (pandas.DataFrame): A DataFrame with a DatetimeIndex.
+    - start_date (str): The start date in the format "YYYY-MM-DD".
+    - end_date (str): The (excluded) end date in the format "YYYY-MM-DD".
+
+    Returns:
+    pandas.DataFrame: The selected rows.
+
+    """
+    if data.empty:
+        return data
+    index = data.index
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    mask = (index >= pd.Timestamp(start_date)) & (index < pd.Timestamp(end_date))
+    return data[mask]
+
+
 def _define_dates(frequency, start_date=None, end_date=None):
     """Define start and end dates based on the specified frequency.
 
@@ -133,6 +554,61 @@ def __get_max_days(FREQUENCIES):
     return out
 
 
+def _handle_errors_fetcher(fetcher):
+    """Handle type errors for the fetcher of data_download and cached_data_download.
+
+    Raises:
+    - TypeError: If fetcher is neither None nor callable.
+
+    """
+    if fetcher is not None and not callable(fetcher):
+        msg = f"'fetcher' has to be a callable or None and not {type(fetcher)}."
+        raise TypeError(msg)
+
+
+def _handle_errors_bulk_data_download(
+    assets,
+    frequencies,
+    batch_size,
+    max_workers,
+    retries,
+    backoff,
+):
+    """Handle type and value errors for bulk_data_download.
+
+    Raises:
+    - TypeError: If assets or frequencies are not lists, batch_size, max_workers or retries are not integers or backoff is not a number.
+    - ValueError: If assets or frequencies are empty, batch_size or max_workers are smaller than 1 or retries or backoff are negative.
+
+    """
+    for name, value in [("assets", assets), ("frequencies", frequencies)]:
+        if not isinstance(value, list):
+            msg = f"'{name}' has to be of type list and not {type(value)}."
+            raise TypeError(msg)
+        if not value:
+            msg = f"'{name}' is empty. Please specify at least one element in '{name}'."
+            raise ValueError(msg)
+
+    for name, value, minimum in [
+        ("batch_size", batch_size, 1),
+        ("max_workers", max_workers, 1),
+        ("retries", retries, 0),
+    ]:
+        if not isinstance(value, int) or isinstance(value, bool):
+            msg = f"'{name}' has to be of type int and not {type(value)}."
+            raise TypeError(msg)
+        if value < minimum:
+            msg = f"'{name}' has to be at least {minimum} and not {value}."
+            raise ValueError(msg)
+
+    if not isinstance(backoff, int | float) or isinstance(backoff, bool):
+        msg = f"'backoff' has to be of type int or float and not {type(backoff)}."
+        raise TypeError(msg)
+    if backoff < 0:
+        msg = f"'backoff' must not be negative ({backoff})."
+        raise ValueError(msg)
+
+
 def _handle_errors_data_download(start_date, end_date, frequency):
     """Handle type and value errors for data_download.
 
@@ -0,0 +1,482 @@
+"""Functions for storing financial data in a columnar Parquet store."""
+
+import io
+import json
+import shutil
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from tradingstrattester.config import BLD
+from tradingstrattester.profiling import count, profiled, profiling_enabled
+
+PRICE_STORE = BLD / "python" / "data"
+
+
+@profiled("data")
+def write_prices(data, id, root=PRICE_STORE):
+    """Write the financial data of an asset to the price store, replacing any data
+    stored for it before.
+
+    The data of each asset is stored in the directory root/frequency/symbol as one or
+    more Parquet part files, see price_store_path(). Additionally, every column is
+    stored as a memory-mappable .npy file for read_price_view(). The date ranges
+    recorded by write_coverage() are reset, as they described the replaced data.
+
+    Args:
+    - data (pandas.DataFrame): A DataFrame containing the financial data from data_download().
+    - id (str): The identifier for the asset including the ending "[...].pkl", e.g. "60m_DB.pkl".
+    - root (pathlib.Path, optional): Root directory of the price store. Default is bld/python/data.
+
+    Returns:
+    - pathlib.Path: Path to the written part file.
+
+    """
+    _handle_errors_price_data(data)
+    path = price_store_path(id, root)
+    path.mkdir(parents=True, exist_ok=True)
+    for part in _part_files(path):
+        part.unlink()
+    (path / "coverage.json").unlink(missing_ok=True)
+
+    part = _write_part(data, path, 0)
+    _write_price_arrays(data, path)
+
+    count("data", "write_prices", bars=len(data))
+    return part
+
+
+def stored_prices_equal(data, id, root=PRICE_STORE):
+    """Check whether the price store already holds exactly the given data of an asset.
+
+    Writing unchanged data again would only update the modification times of the
+    stored files, which makes pytask rerun every task depending on them.
+
+    Args:
+    - data (pandas.DataFrame): A DataFrame containing the financial data from data_download().
+    - id (str): The identifier for the asset including the ending "[...].pkl", e.g. "60m_DB.pkl".
+    - root (pathlib.Path, optional): Root directory of the price store. Default is bld/python/data.
+
+    Returns:
+    - bool: True if the stored data has the same index, columns and values as data.
+
+    """
+    path = price_store_path(id, root) / "arrays"
+    if (
+        not (path / "meta.json").exists()
+        or not price_store_part(id, root=root).exists()
+    ):
+        return False
+
+    stored = _read_price_arrays(path, None, id)
+    if [str(col) for col in data.columns] != list(stored.columns):
+        return False
+    return stored.index.equals(data.index) and all(
+        np.array_equal(stored[str(col)], data[col], equal_nan=True)
+        for col in data.columns
+    )
+
+
+def append_prices(data, id, root=PRICE_STORE):
+    """Append the financial data of an asset to the price store.
+
+    Only rows after the last stored time step are appended, as a new part file, and
+    to the end of the memory-mapped arrays, so already stored data is neither read
+    completely nor rewritten. Only if the columns or types of the new rows differ from
+    the stored ones, the arrays are rewritten from all part files.
+
+    Args:
+    - data (pandas.DataFrame): A DataFrame containing the financial data from data_download().
+    - id (str): The identifier for the asset including the ending "[...].pkl", e.g. "60m_DB.pkl".
+    - root (pathlib.Path, optional): Root directory of the price store. Default is bld/python/data.
+
+    Returns:
+    - pathlib.Path or None: Path to the written part file or None if there were no new rows.
+
+    """
+    _handle_errors_price_data(data)
+    path = price_store_path(id, root)
+    parts = _part_files(path)
+    if not parts:
+        return write_prices(data, id, root)
+
+    # Only the index of the last part is read to find the last stored time step
+    last_part = pq.read_table(
+        parts[-1],
+        columns=[],
+        memory_map=True,
+        use_pandas_metadata=True,
+    )
+    last_index = last_part.to_pandas().index.max()
+    new_data = data[data.index > last_index]
+    if new_data.empty:
+        return None
+
+    part = _write_part(new_data, path, len(parts))
+    if not _append_price_arrays(new_data, path):
+        _write_price_arrays(read_prices(id, root=root), path)
+
+    return part
+
+
+@profiled("data")
+def read_prices(id, columns=None, root=PRICE_STORE, memory_map=True):
+    """Read the financial data of an asset from the price store.
+
+    Args:
+    - id (str): The identifier for the asset including the ending "[...].pkl", e.g. "60m_DB.pkl".
+    - columns (list, optional): Columns to read, e.g. ["Close"]. The index is always read. If None, all columns are read.
+    - root (pathlib.Path, optional): Root directory of the price store. Default is bld/python/data.
+    - memory_map (bool, optional): If True, the part files are memory-mapped instead of read into a buffer. Default is True.
+
+    Returns:
+    - pandas.DataFrame: A DataFrame containing the (selected columns of the) financial data.
+
+    """
+    path = price_store_path(id, root)
+    parts = _part_files(path)
+    if not parts:
+        msg = f"No financial data stored for '{id}' in {path}. Please write the data with write_prices() first."
+        raise FileNotFoundError(msg)
+
+    table = pa.concat_tables(
+        [
+            pq.read_table(
+                part,
+                columns=columns,
+                memory_map=memory_map,
+                use_pandas_metadata=True,
+            )
+            for part in parts
+        ],
+    )
+    count("data", "read_prices", bars=table.num_rows, bytes_read=table.nbytes)
+    return table.to_pandas()
+
+
+@profiled("data")
+def read_price_view(id, columns=None, root=PRICE_STORE):
+    """Read the financial data of an asset as a read-only, zero-copy view.
+
+    The columns of the returned DataFrame are memory-mapped .npy files written by
+    write_prices() or append_prices(). Nothing is deserialized, and all processes
+    reading the same asset share its pages in the operating system's page cache, so
+    memory usage does not grow with the number of readers.
+
+    Args:
+    - id (str): The identifier for the asset including the ending "[...].pkl", e.g. "60m_DB.pkl".
+    - columns (list, optional): Columns to read, e.g. ["Close"]. If None, all columns are read.
+    - root (pathlib.Path, optional): Root directory of the price store. Default is bld/python/data.
+
+    Returns:
+    - pandas.DataFrame: A DataFrame whose columns are read-only views on the memory-mapped arrays.
+
+    """
+    path = price_store_path(id, root) / "arrays"
+    if not (path / "meta.json").exists():
+        msg = f"No financial data stored for '{id}' in {path}. Please write the data with write_prices() first."
+        raise FileNotFoundError(msg)
+
+    out = _read_price_arrays(path, columns, id)
+    if profiling_enabled():
+        count(
+            "data",
+            "read_price_view",
+            bars=len(out),
+            bytes_read=int(out.memory_usage(index=True).sum()),
+        )
+    return out
+
+
+def _read_price_arrays(path, columns, name):
+    """Memory-map the arrays written by _write_price_arrays() into a DataFrame.
+
+    Args:
+    - path (pathlib.Path): The directory containing the arrays and meta.json.
+    - columns (list or None): Columns to read. If None, all columns are read.
+    - name (str): Name of the stored data used in error messages, e.g. the asset ID.
+
+    Returns:
+    - pandas.DataFrame: A DataFrame whose columns are read-only views on the memory-mapped arrays.
+
+    """
+    with open(path / "meta.json") as file:
+        meta = json.load(file)
+
+    if columns is None:
+        columns = meta["columns"]
+    for col in columns:
+        if col not in meta["columns"]:
+            msg = f"Stored data of '{name}' has columns {meta['columns']} and is therefore missing column '{col}'."
+            raise ValueError(msg)
+
+    index = np.asarray(np.load(path / "index.npy", mmap_mode="r"))
+    if meta["tz"] is not None:
+        index = pd.DatetimeIndex(index).tz_localize("UTC").tz_convert(meta["tz"])
+    index = pd.Index(index, name=meta["index_name"], copy=False)
+
+    return pd.DataFrame(
+        {
+            col: np.asarray(np.load(path / f"{number}.npy", mmap_mode="r"))
+            for number, col in enumerate(meta["columns"])
+            if col in columns
+        },
+        index=index,
+        copy=False,
+    )[columns]
+
+
+def read_coverage(id, root=PRICE_STORE):
+    """Read the date ranges which were already downloaded for an asset.
+
+    Args:
+    - id (str): The identifier for the asset including the ending "[...].pkl", e.g. "60m_DB.pkl".
+    - root (pathlib.Path, optional): Root directory of the price store. Default is bld/python/data.
+
+    Returns:
+    - list: Sorted, non-overlapping [start_date, end_date) pairs in the format "YYYY-MM-DD". Empty if nothing is recorded.
+
+    """
+    path = price_store_path(id, root) / "coverage.json"
+    if not path.exists():
+        return []
+    with open(path) as file:
+        return [tuple(date_range) for date_range in json.load(file)]
+
+
+def write_coverage(coverage, id, root=PRICE_STORE):
+    """Record the date ranges which were downloaded for an asset.
+
+    Overlapping and adjacent ranges are merged before they are written.
+
+    Args:
+    - coverage (list): [start_date, end_date) pairs in the format "YYYY-MM-DD".
+    - id (str): The identifier for the asset including the ending "[...].pkl", e.g. "60m_DB.pkl".
+    - root (pathlib.Path, optional): Root directory of the price store. Default is bld/python/data.
+
+    Returns:
+    - list: The merged date ranges.
+
+    """
+    merged = []
+    # ISO formatted dates sort chronologically as strings
+    for start, end in sorted(coverage):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    path = price_store_path(id, root)
+    path.mkdir(parents=True, exist_ok=True)
+    with open(path / "coverage.json", "w") as file:
+        json.dump(merged, file)
+
+    return merged
+
+
+def price_store_path(id, root=PRICE_STORE):
+    """Path of the directory storing the part files of an asset.
+
+    Args:
+    - id (str): The identifier for the asset including the ending "[...].pkl", e.g. "60m_DB.pkl".
+    - root (pathlib.Path, optional): Root directory of the price store. Default is bld/python/data.
+
+    Returns:
+    - pathlib.Path: The directory root/frequency/symbol, e.g. root/60m/DB.
+
+    """
+    _handle_errors_price_id(id)
+    frequency, symbol = id.split(".")[0].split("_")
+    return root / frequency / symbol
+
+
+def price_store_part(id, number=0, root=PRICE_STORE):
+    """Path of a part file of an asset in the price store.
+
+    Args:
+    - id (str): The identifier for the asset including the ending "[...].pkl", e.g. "60m_DB.pkl".
+    - number (int, optional): Number of the part file. The first part is written by write_prices(). Default is 0.
+    - root (pathlib.Path, optional): Root directory of the price store. Default is bld/python/data.
+
+    Returns:
+    - pathlib.Path: Path to the part file, e.g. root/60m/DB/part-00000.parquet.
+
+    """
+    return price_store_path(id, root) / f"part-{number:05d}.parquet"
+
+
+def _write_part(data, path, number):
+    """Write data as the part file with the given number.
+
+    Args:
+    - data (pandas.DataFrame): A DataFrame containing the financial data.
+    - path (pathlib.Path): The directory of the asset in the price store.
+    - number (int): Number of the part file.
+
+    Returns:
+    - pathlib.Path: Path to the written part file.
+
+    """
+    part = path / f"part-{number:05d}.parquet"
+    pq.write_table(pa.Table.from_pandas(data), part)
+    return part
+
+
+def _write_price_arrays(data, path):
+    """Write every column and the index of data as a memory-mappable .npy file.
+
+    The files are written to path/arrays. Time zone aware indices are stored in UTC and
+    the time zone is kept in the meta.json file next to them.
+
+    Args:
+    - data (pandas.DataFrame): A DataFrame containing the financial data.
+    - path (pathlib.Path): The directory of the asset in the price store.
+
+    """
+    arrays = path / "arrays"
+    shutil.rmtree(arrays, ignore_errors=True)
+    arrays.mkdir()
+
+    # Columns are numbered, as column names may not be valid file names
+    for number, col in enumerate(data.columns):
+        np.save(arrays / f"{number}.npy", data[col].to_numpy())
+
+    index = data.index
+    tz = None
+    if isinstance(index, pd.DatetimeIndex) and index.tz is not None:
+        tz = str(index.tz)
+        index = index.tz_convert(None)
+    np.save(arrays / "index.npy", index.to_numpy())
+
+    meta = {
+        "columns": [str(col) for col in data.columns],
+        "index_name": data.index.name,
+        "tz": tz,
+    }
+    with open(arrays / "meta.json", "w") as file:
+        json.dump(meta, file)
+
+
+def _append_price_arrays(data, path):
+    """Append every column and the index of data to the arrays of _write_price_arrays().
+
+    The shape in the header of every .npy file is updated in place and the new values
+    are written to the end of the file. All files are checked before the first one is
+    changed.
+
+    Args:
+    - data (pandas.DataFrame): A DataFrame containing the new rows of the financial data.
+    - path (pathlib.Path): The directory of the asset in the price store.
+
+    Returns:
+    - bool: False if nothing was appended, as the columns, the time zone or the types of data differ from the stored arrays, or a header would grow.
+
+    """
+    arrays = path / "arrays"
+    with open(arrays / "meta.json") as file:
+        meta = json.load(file)
+
+    index = data.index
+    tz = None
+    if isinstance(index, pd.DatetimeIndex) and index.tz is not None:
+        tz = str(index.tz)
+        index = index.tz_convert(None)
+    if meta["columns"] != [str(col) for col in data.columns] or meta["tz"] != tz:
+        return False
+
+    values = {
+        f"{number}.npy": data[col].to_numpy() for number, col in enumerate(data.columns)
+    }
+    values["index.npy"] = index.to_numpy()
+    headers = {}
+    for name, new in values.items():
+        header = _appended_npy_header(arrays / name, new)
+        if header is None:
+            return False
+        headers[name] = header
+
+    for name, new in values.items():
+        with open(arrays / name, "r+b") as file:
+            file.write(headers[name])
+            file.seek(0, 2)
+            file.write(np.ascontiguousarray(new).tobytes())
+    return True
+
+
+def _appended_npy_header(path, new):
+    """Header of a one-dimensional .npy file after new values were appended to it.
+
+    Args:
+    - path (pathlib.Path): Path to the .npy file.
+    - new (numpy.ndarray): The values to append.
+
+    Returns:
+    - bytes or None: The new header, or None if new has another type than the stored values or the header would be longer than the current one.
+
+    """
+    with open(path, "rb") as file:
+        version = np.lib.format.read_magic(file)
+        if version != (1, 0):
+            return None
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+        offset = file.tell()
+    if len(shape) != 1 or fortran_order or dtype != new.dtype or dtype.hasobject:
+        return None
+
+    buffer = io.BytesIO()
+    np.lib.format.write_array_header_1_0(
+        buffer,
+        {
+            "descr": np.lib.format.dtype_to_descr(dtype),
+            "fortran_order": False,
+            "shape": (shape[0] + len(new),),
+        },
+    )
+    header = buffer.getvalue()
+    return header if len(header) == offset else None
+
+
+def _part_files(path):
+    """Sorted list of the part files of an asset.
+
+    Args:
+    - path (pathlib.Path): The directory of the asset in the price store.
+
+    Returns:
+    - list: Paths to the part files in the order they were written.
+
+    """
+    return sorted(path.glob("part-*.parquet"))
+
+
+def _handle_errors_price_id(id):
+    """Handle type and value errors for asset identifiers of the price store.
+
+    Raises:
+    - TypeError: If id is not a string.
+    - ValueError: If id is not of the form "frequency_symbol[...]".
+
+    """
+    if not isinstance(id, str):
+        msg = f"The identifier 'id' must be a string and not {type(id)}."
+        raise TypeError(msg)
+    if len(id.split(".")[0].split("_")) != 2:
+        msg = f"Identifier '{id}' is not of the form 'frequency_symbol.pkl', e.g. '60m_DB.pkl'."
+        raise ValueError(msg)
+
+
+def _handle_errors_price_data(data):
+    """Handle type and value errors for data written to the price store.
+
+    Raises:
+    - TypeError: If data is not a DataFrame.
+    - ValueError: If data is empty.
+
+    """
+    if not isinstance(data, pd.core.frame.DataFrame):
+        msg = f"Data has to be of type 'pd.DataFrame' and not {type(data)}."
+        raise TypeError(msg)
+    if data.empty:
+        msg = f"Input data is empty ({data}). Please use data_download() with valid inputs as input data."
+        raise ValueError(msg)
@@ -0,0 +1,379 @@
+"""Functions for generating synthetic financial data without a network connection."""
+
+import math
+import zlib
+
+import numpy as np
+import pandas as pd
+from tradingstrattester.data_management.data_functions import (
+    _handle_errors_data_download,
+)
+from tradingstrattester.profiling import count, profiled
+
+# Trading days per year and minutes per trading day of the simulated exchange
+_TRADING_DAYS = 252
+_SESSION_MINUTES = 390
+_SESSION_OPEN = np.timedelta64(9 * 60 + 30, "m")
+_SESSION_TZ = "America/New_York"
+
+_INTRADAY_MINUTES = {"1m": 1, "2m": 2, "5m": 5, "15m": 15, "30m": 30, "60m": 60}
+# Minimum number of days between and length in years of daily and coarser bars
+_PERIOD_DAYS = {"1d": 1, "5d": 5, "1wk": 7, "1mo": 28, "3mo": 89}
+_YEARS_PER_BAR = {
+    "1d": 1 / 252,
+    "5d": 5 / 252,
+    "1wk": 1 / 52,
+    "1mo": 1 / 12,
+    "3mo": 1 / 4,
+}
+
+
+@profiled("data")
+def synthetic_data_download(
+    symbol,
+    frequency,
+    start_date,
+    end_date,
+    model="gbm",
+    seed=0,
+    initial_price=100.0,
+    **model_kwargs,
+):
+    """Generate synthetic financial data in the shape of data_download().
+
+    The bars lie on the calendar of an exchange trading on weekdays from 9:30 to 16:00
+    New York time, e.g. seven "60m" bars per day starting at 9:30, 10:30, ..., 15:30
+    with a time zone aware index named "Datetime", and one "1d" bar per weekday with
+    a time zone naive index named "Date", like the data of Yahoo Finance. The data of
+    every symbol and frequency is drawn from its own random number generator derived
+    from seed, so it is reproducible and different for every asset. Coarser bars which
+    are consistent with finer ones can be derived with derive_prices().
+
+    Args:
+    - symbol (str): The symbol of the asset, which only seeds its random number generator.
+    - frequency (str): The frequency of the data, e.g. "5m", "60m", "1d".
+    - start_date (str): The start date in the format "YYYY-MM-DD".
+    - end_date (str): The (excluded) end date in the format "YYYY-MM-DD".
+    - model (str, optional): The price model, "gbm", "jump_diffusion" or "regime_switching". See synthetic_prices(). Default is "gbm".
+    - seed (int, optional): Seed of the random number generators. Default is 0.
+    - initial_price (float, optional): Closing price before the first bar. Default is 100.0.
+    - **model_kwargs: Parameters of the price model, e.g. sigma=0.3.
+
+    Returns:
+    pandas.DataFrame: A DataFrame containing the synthetic financial data.
+
+    """
+    _handle_errors_data_download(start_date, end_date, frequency)
+    if start_date is None or end_date is None:
+        msg = "Synthetic data needs both a start_date and an end_date."
+        raise ValueError(msg)
+
+    index = _trading_calendar(frequency, start_date, end_date=end_date)
+    rng = np.random.default_rng([seed, zlib.crc32(f"{frequency}_{symbol}".encode())])
+    count("data", "synthetic_data_download", bars=len(index))
+    return _synthetic_ohlcv(index, frequency, model, rng, initial_price, model_kwargs)
+
+
+def synthetic_prices(
+    n_bars,
+    frequency="1d",
+    model="gbm",
+    seed=0,
+    start_date="2000-01-03",
+    initial_price=100.0,
+    **model_kwargs,
+):
+    """Generate a given number of synthetic bars, e.g. for large-scale offline runs.
+
+    The log returns of all bars are drawn at once from one of the following models,
+    whose parameters are annualized:
+    - "gbm": Geometric Brownian motion with drift mu (default 0.05) and volatility sigma (default 0.2).
+    - "jump_diffusion": Merton's jump diffusion, i.e. a geometric Brownian motion with normally distributed jumps in the log price of mean jump_mean (default -0.05) and standard deviation jump_std (default 0.1), which occur jump_intensity times a year on average (default 1.0). The drift is compensated, so mu is the expected return.
+    - "regime_switching": Geometric Brownian motion whose drift and volatility switch between a calm and a turbulent regime with mu (default (0.15, -0.25)) and sigma (default (0.15, 0.35)). The regimes last mean_duration years on average (default (1.0, 0.25)).
+    The opening prices gap from the previous closing prices, the highs and lows lie
+    beyond the opening and closing prices by a fraction of the volatility of a bar, and
+    the volume grows with the absolute return of a bar.
+
+    Args:
+    - n_bars (int): Number of bars.
+    - frequency (str, optional): The frequency of the bars, e.g. "5m", "60m", "1d". Default is "1d".
+    - model (str, optional): The price model, "gbm", "jump_diffusion" or "regime_switching". Default is "gbm".
+    - seed (int, optional): Seed of the random number generator. Default is 0.
+    - start_date (str, optional): The date of the first bar in the format "YYYY-MM-DD". Default is "2000-01-03".
+    - initial_price (float, optional): Closing price before the first bar. Default is 100.0.
+    - **model_kwargs: Parameters of the price model, e.g. sigma=0.3.
+
+    Returns:
+    pandas.DataFrame: A DataFrame containing the synthetic financial data in the shape of data_download().
+
+    """
+    _handle_errors_n_bars(n_bars)
+    _handle_errors_data_download(start_date, None, frequency)
+
+    index = _trading_calendar(frequency, start_date, n_bars=n_bars)
+    rng = np.random.default_rng(seed)
+    return _synthetic_ohlcv(index, frequency, model, rng, initial_price, model_kwargs)
+
+
+def _synthetic_ohlcv(index, frequency, model, rng, initial_price, model_kwargs):
+    """Generate the OHLCV bars of a price model on a calendar.
+
+    Args:
+    - index (pandas.DatetimeIndex): The time steps of the bars.
+    - frequency (str): The frequency of the bars.
+    - model (str): The price model.
+    - rng (numpy.random.Generator): The random number generator.
+    - initial_price (float): Closing price before the first bar.
+    - model_kwargs (dict): Parameters of the price model.
+
+    Returns:
+    pandas.DataFrame: A DataFrame containing the synthetic financial data.
+
+    """
+    models = {
+        "gbm": _gbm_returns,
+        "jump_diffusion": _jump_diffusion_returns,
+        "regime_switching": _regime_switching_returns,
+    }
+    if model not in models:
+        msg = f"Model '{model}' is not available. Please choose one of {list(models)}."
+        raise ValueError(msg)
+
+    n_bars = len(index)
+    dt = _years_per_bar(frequency)
+    returns = models[model](rng, n_bars, dt, **model_kwargs)
+    close = initial_price * np.exp(np.cumsum(returns))
+
+    # Bars move by about the volatility of a bar, which scales the intrabar noise
+    bar_sigma = max(returns.std(), 1e-12) if n_bars > 1 else 0.01
+    previous_close = np.concatenate(([initial_price], close[:-1]))
+    open_price = previous_close * np.exp(rng.normal(0, 0.1 * bar_sigma, n_bars))
+    high = np.maximum(open_price, close) * np.exp(
+        np.abs(rng.normal(0, 0.5 * bar_sigma, n_bars)),
+    )
+    low = np.minimum(open_price, close) * np.exp(
+        -np.abs(rng.normal(0, 0.5 * bar_sigma, n_bars)),
+    )
+    volume = np.rint(
+        1e6
+        * dt
+        * _TRADING_DAYS
+        * np.exp(rng.normal(0, 0.3, n_bars))
+        * (1 + np.abs(returns) / bar_sigma),
+    ).astype(np.int64)
+
+    return pd.DataFrame(
+        {
+            "Open": open_price,
+            "High": high,
+            "Low": low,
+            "Close": close,
+            "Adj Close": close,
+            "Volume": volume,
+        },
+        index=index,
+    )
+
+
+def _gbm_returns(rng, n_bars, dt, mu=0.05, sigma=0.2):
+    """Log returns of a geometric Brownian motion.
+
+    Args:
+    - rng (numpy.random.Generator): The random number generator.
+    - n_bars (int): Number of bars.
+    - dt (float): Length of a bar in years.
+    - mu (float, optional): Annualized drift. Default is 0.05.
+    - sigma (float, optional): Annualized volatility. Default is 0.2.
+
+    Returns:
+    numpy.ndarray: The log return of every bar.
+
+    """
+    return (mu - sigma**2 / 2) * dt + sigma * math.sqrt(dt) * rng.standard_normal(
+        n_bars,
+    )
+
+
+def _jump_diffusion_returns(
+    rng,
+    n_bars,
+    dt,
+    mu=0.05,
+    sigma=0.2,
+    jump_intensity=1.0,
+    jump_mean=-0.05,
+    jump_std=0.1,
+):
+    """Log returns of Merton's jump diffusion.
+
+    Args:
+    - rng (numpy.random.Generator): The random number generator.
+    - n_bars (int): Number of bars.
+    - dt (float): Length of a bar in years.
+    - mu (float, optional): Annualized expected return. Default is 0.05.
+    - sigma (float, optional): Annualized volatility of the diffusion. Default is 0.2.
+    - jump_intensity (float, optional): Expected number of jumps per year. Default is 1.0.
+    - jump_mean (float, optional): Mean of the jumps in the log price. Default is -0.05.
+    - jump_std (float, optional): Standard deviation of the jumps in the log price. Default is 0.1.
+
+    Returns:
+    numpy.ndarray: The log return of every bar.
+
+    """
+    compensation = jump_intensity * (math.exp(jump_mean + jump_std**2 / 2) - 1)
+    n_jumps = rng.poisson(jump_intensity * dt, n_bars)
+    # The sum of n normally distributed jumps is normally distributed
+    jumps = jump_mean * n_jumps + jump_std * np.sqrt(n_jumps) * rng.standard_normal(
+        n_bars,
+    )
+    return _gbm_returns(rng, n_bars, dt, mu - compensation, sigma) + jumps
+
+
+def _regime_switching_returns(
+    rng,
+    n_bars,
+    dt,
+    mu=(0.15, -0.25),
+    sigma=(0.15, 0.35),
+    mean_duration=(1.0, 0.25),
+):
+    """Log returns of a geometric Brownian motion switching between two regimes.
+
+    The regimes follow a Markov chain, i.e. their durations are geometrically
+    distributed. The durations are drawn at once and expanded to the regime of every
+    bar, so no loop over the bars is needed.
+
+    Args:
+    - rng (numpy.random.Generator): The random number generator.
+    - n_bars (int): Number of bars.
+    - dt (float): Length of a bar in years.
+    - mu (tuple, optional): Annualized drift in each regime. Default is (0.15, -0.25).
+    - sigma (tuple, optional): Annualized volatility in each regime. Default is (0.15, 0.35).
+    - mean_duration (tuple, optional): Average duration of each regime in years. Default is (1.0, 0.25).
+
+    Returns:
+    numpy.ndarray: The log return of every bar.
+
+    """
+    mu, sigma = np.asarray(mu, dtype=float), np.asarray(sigma, dtype=float)
+    switch_prob = np.minimum(dt / np.asarray(mean_duration, dtype=float), 1.0)
+
+    # Enough alternating regimes to cover n_bars bars on average, drawn again if not
+    n_pairs = math.ceil(n_bars / (1 / switch_prob).sum()) + 1
+    durations = rng.geometric(np.tile(switch_prob, n_pairs))
+    while durations.sum() < n_bars:
+        durations = np.concatenate(
+            (durations, rng.geometric(np.tile(switch_prob, n_pairs))),
+        )
+    first = rng.integers(2)
+    regime = np.repeat((np.arange(len(durations)) + first) % 2, durations)[:n_bars]
+
+    return (mu[regime] - sigma[regime] ** 2 / 2) * dt + sigma[regime] * math.sqrt(
+        dt,
+    ) * rng.standard_normal(n_bars)
+
+
+def _trading_calendar(frequency, start_date, end_date=None, n_bars=None):
+    """Time steps of the bars of a frequency on the calendar of the exchange.
+
+    The calendar is built with numpy's business day functions instead of
+    pandas.date_range(), whose business day offsets are evaluated one date at a time.
+
+    Args:
+    - frequency (str): The frequency of the bars.
+    - start_date (str): The first date in the format "YYYY-MM-DD".
+    - end_date (str, optional): The (excluded) end date in the format "YYYY-MM-DD".
+    - n_bars (int, optional): Number of bars, used if end_date is None.
+
+    Returns:
+    pandas.DatetimeIndex: The time steps of the bars.
+
+    """
+    start = np.datetime64(start_date, "D")
+    bars_per_day = 1
+    if frequency in _INTRADAY_MINUTES:
+        bars_per_day = math.ceil(_SESSION_MINUTES / _INTRADAY_MINUTES[frequency])
+
+    if end_date is None:
+        dates = _calendar_dates(frequency, start, math.ceil(n_bars / bars_per_day))
+    else:
+        end = np.datetime64(end_date, "D")
+        # More periods than fit between the dates, the surplus is cut off
+        n_periods = (end - start).astype(int) // _PERIOD_DAYS.get(frequency, 1) + 2
+        dates = _calendar_dates(frequency, start, n_periods)
+        dates = dates[dates < end]
+
+    # Microseconds instead of nanoseconds, which overflow for dates after 2262
+    dates = dates.astype("datetime64[us]")
+    if frequency not in _INTRADAY_MINUTES:
+        return pd.DatetimeIndex(dates, name="Date")
+
+    # Only the session opens are localized, as the bars of a session share their offset
+    opens = pd.DatetimeIndex(dates + _SESSION_OPEN)
+    opens = opens.tz_localize(_SESSION_TZ).tz_convert(None).to_numpy()
+    offsets = np.arange(bars_per_day) * np.timedelta64(
+        _INTRADAY_MINUTES[frequency],
+        "m",
+    )
+    # All bars of all sessions at once, as the outer sum of opens and offsets
+    times = (opens[:, None] + offsets[None, :]).ravel()
+    if end_date is None:
+        times = times[:n_bars]
+    return (
+        pd.DatetimeIndex(times, name="Datetime")
+        .tz_localize("UTC")
+        .tz_convert(_SESSION_TZ)
+    )
+
+
+def _calendar_dates(frequency, start, n_periods):
+    """Dates of the first n_periods bars of a frequency from start on.
+
+    Args:
+    - frequency (str): The frequency of the bars. Intraday frequencies return the trading days.
+    - start (numpy.datetime64): The first possible date.
+    - n_periods (int): Number of dates.
+
+    Returns:
+    numpy.ndarray: The dates as datetime64[D] array.
+
+    """
+    periods = np.arange(n_periods)
+    if frequency in _INTRADAY_MINUTES or frequency == "1d":
+        return np.busday_offset(start, periods, roll="forward")
+    if frequency == "5d":
+        return np.busday_offset(start, 5 * periods, roll="forward")
+    if frequency == "1wk":
+        monday = np.busday_offset(start, 0, roll="forward", weekmask="Mon")
+        return monday + 7 * periods
+
+    # Months since 1970-01 of the first month or quarter starting on or after start
+    month = start.astype("datetime64[M]")
+    month = month.astype(int) + (month.astype("datetime64[D]") < start)
+    if frequency == "3mo":
+        month += -month % 3
+        periods = 3 * periods
+    return (month + periods).astype("datetime64[M]").astype("datetime64[D]")
+
+
+def _years_per_bar(frequency):
+    """Length of a bar of the frequency in years of trading time."""
+    if frequency in _INTRADAY_MINUTES:
+        return _INTRADAY_MINUTES[frequency] / (_SESSION_MINUTES * _TRADING_DAYS)
+    return _YEARS_PER_BAR[frequency]
+
+
+def _handle_errors_n_bars(n_bars):
+    """Handle type and value errors for the number of bars of synthetic_prices.
+
+    Raises:
+    - TypeError: If n_bars is not an integer.
+    - ValueError: If n_bars is smaller than 1.
+
+    """
+    if not isinstance(n_bars, int) or isinstance(n_bars, bool):
+        msg = f"'n_bars' has to be of type int and not {type(n_bars)}."
+        raise TypeError(msg)
+    if n_bars < 1:
+        msg = f"'n_bars' has to be at least 1 and not {n_bars}."
+        raise ValueError(msg)
@@ -1,7 +1,7 @@
 """"Task to check if config.py lists."""
 
 import pytask
-from tradingstrattester.config import ASSETS, FREQUENCIES, STRATEGIES
+from tradingstrattester.config import ASSETS, DATA_SOURCE, FREQUENCIES, STRATEGIES
 
 
 @pytask.mark.try_first
@@ -18,3 +18,7 @@ def task_check_config_lists():
         if "." in syb or "_" in syb:
             msg = f"Symbols cannot include '.' or '_' in their names. Please enter a different symbol instead of {syb}."
             raise ValueError(msg)
+
+    if DATA_SOURCE not in ["yfinance", "synthetic"]:
+        msg = f"DATA_SOURCE has to be either 'yfinance' or 'synthetic' and not '{DATA_SOURCE}'."
+        raise ValueError(msg)
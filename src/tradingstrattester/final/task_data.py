@@ -1,22 +1,74 @@
 """"Task to download the financial data and store it."""
 
-import pytask
-from tradingstrattester.config import _ID, BLD, END_DATE, START_DATE
-from tradingstrattester.data_management.data_functions import data_download
+from tradingstrattester.config import (
+    _ID,
+    ASSETS,
+    DATA_SOURCE,
+    END_DATE,
+    FREQUENCIES,
+    RESAMPLE_FREQUENCIES,
+    START_DATE,
+    SYNTHETIC_MODEL,
+    SYNTHETIC_SEED,
+)
+from tradingstrattester.data_management.alignment import (
+    derive_prices,
+    split_frequencies,
+)
+from tradingstrattester.data_management.data_functions import bulk_data_download
+from tradingstrattester.data_management.price_store import (
+    price_store_part,
+    stored_prices_equal,
+    write_prices,
+)
+from tradingstrattester.data_management.synthetic_data import synthetic_data_download
 
-for id in _ID:
+_produces = [price_store_part(id) for id in _ID]
 
-    @pytask.task(id=id.split(".")[0])
-    def task_download_data(
-        symbol=id.split(".")[0].split("_")[1],
-        frequency=id.split(".")[0].split("_")[0],
-        produces=BLD / "python" / "data" / id,
-    ):
-        """Download financial data and store it in the bld folder."""
-        data = data_download(
-            symbol,
-            frequency=frequency,
+
+def task_download_data(produces=_produces):
+    """Download financial data and store it in the bld folder.
+
+    If DATA_SOURCE is "synthetic", the data is generated offline with
+    synthetic_data_download(). Otherwise all symbols and frequencies are downloaded
+    together in batched, concurrent requests, and only date ranges which are missing
+    in the download cache are downloaded. The frequencies in RESAMPLE_FREQUENCIES are
+    not downloaded, but derived from the stored bars of the finest downloaded
+    frequency. Only the data of assets which changed is written, so the tasks of the
+    other assets are not rerun.
+
+    """
+    download_frequencies, source_frequency = split_frequencies(
+        FREQUENCIES,
+        RESAMPLE_FREQUENCIES,
+    )
+    if DATA_SOURCE == "synthetic":
+        data_dict = {
+            f"{frequency}_{asset}.pkl": synthetic_data_download(
+                asset,
+                frequency,
+                START_DATE,
+                END_DATE,
+                model=SYNTHETIC_MODEL,
+                seed=SYNTHETIC_SEED,
+            )
+            for frequency in download_frequencies
+            for asset in ASSETS
+        }
+    else:
+        data_dict = bulk_data_download(
+            ASSETS,
+            download_frequencies,
             start_date=START_DATE,
             end_date=END_DATE,
         )
-        data.to_pickle(produces)
+    for id, data in data_dict.items():
+        if not stored_prices_equal(data, id):
+            write_prices(data, id)
+
+    for frequency in RESAMPLE_FREQUENCIES:
+        for asset in ASSETS:
+            id = f"{frequency}_{asset}.pkl"
+            data = derive_prices(f"{source_frequency}_{asset}.pkl", frequency)
+            if not stored_prices_equal(data, id):
+                write_prices(data, id)
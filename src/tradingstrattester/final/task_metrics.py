@@ -0,0 +1,46 @@
+""""Task for evaluating the performance of all simulated depots."""
+
+import pytask
+from tradingstrattester.analysis.depot_results import depot_path, read_depot_balances
+from tradingstrattester.analysis.performance_metrics import (
+    bars_per_year,
+    depot_metrics,
+)
+from tradingstrattester.config import _ID, BLD, STRATEGIES
+from tradingstrattester.data_management.price_store import price_store_part
+
+# Preparing depending paths
+_dependencies = {
+    "depots": {
+        strategy: [depot_path(strategy, id) for id in _ID] for strategy in STRATEGIES
+    },
+    "data": [price_store_part(id) for id in _ID],
+}
+
+
+@pytask.mark.try_last
+def task_depot_metrics(
+    depends_on=_dependencies,
+    produces=BLD / "python" / "analysis" / "depot_metrics.csv",
+):
+    """Compute the performance metrics of the depots of all strategies and assets.
+
+    Returns are annualized with the bars per year of each asset estimated from its
+    data, so intraday bars of assets which are traded around the clock are not
+    annualized like the ones of stocks.
+
+    """
+    depots = {
+        strategy: {column: {} for column in ["cash_dict", "unit_dict", "value_dict"]}
+        for strategy in STRATEGIES
+    }
+    for strategy in STRATEGIES:
+        for id in _ID:
+            for column, balance in read_depot_balances(strategy, id).items():
+                depots[strategy][column][id.split(".")[0]] = balance
+
+    metrics = depot_metrics(
+        depots,
+        periods_per_year={id.split(".")[0]: bars_per_year(id) for id in _ID},
+    )
+    metrics.to_csv(produces)
@@ -1,20 +1,30 @@
 """"Tasks for creating all analysis plots."""
 
 
-import pandas as pd
 import pytask
+from tradingstrattester.analysis.depot_results import depot_path
 from tradingstrattester.analysis.plotting_functions import (
     plot_asset_strategy,
     plot_indicators,
     plot_units_and_cash,
 )
-from tradingstrattester.config import _ID, BLD, INITIAL_DEPOT_CASH, STRATEGIES
+from tradingstrattester.config import (
+    _ID,
+    BLD,
+    INITIAL_DEPOT_CASH,
+    PLOT_MAX_POINTS,
+    STRATEGIES,
+)
+from tradingstrattester.data_management.price_store import (
+    price_store_part,
+    read_price_view,
+)
+from tradingstrattester.profiling import profile_stage
 
 # Preparing depending and producing paths
-_dependencies = []
-for strategy in STRATEGIES:
-    _dependencies.append(BLD / "python" / "analysis" / f"sim_depot{strategy}.pkl")
-
+_dependencies = {
+    id: [depot_path(strategy, id) for strategy in STRATEGIES] for id in _ID
+}
 
 _produce_paths = []
 plot_names = ["asset_and_depot_value_plot", "indicator-bar_plot", "units_and_cash_plot"]
@@ -35,20 +45,44 @@ for id in _ID:
     @pytask.task(id=id.split(".")[0])
     def task_create_plots(
         id=id,
-        depends_on=_dependencies,
+        depends_on=_dependencies[id],
+        prices=price_store_part(id),
         produces=_produce_paths[index_start:index_end],
     ):
-        """Create all plots (asset+depot value, indicators, unit+cash)."""
-        data = pd.read_pickle(BLD / "python" / "data" / id)
+        """Create all plots (asset+depot value, indicators, unit+cash).
+
+        The task only depends on the data and the depots of the plotted asset, so it
+        is only rerun if they changed.
+
+        The traces of the asset+depot value and unit+cash plots are downsampled to at
+        most PLOT_MAX_POINTS points, so the size of the HTML files does not grow with
+        the number of bars.
+
+        """
+        data = read_price_view(id)
 
         # Plot asset and depot_value
-        fig_asset_strat = plot_asset_strategy(data, id, INITIAL_DEPOT_CASH, depends_on)
-        fig_asset_strat.write_html(produces[0])
+        fig_asset_strat = plot_asset_strategy(
+            data,
+            id,
+            INITIAL_DEPOT_CASH,
+            depends_on,
+            max_points=PLOT_MAX_POINTS,
+        )
+        with profile_stage("plotting", "write_html"):
+            fig_asset_strat.write_html(produces[0])
 
         # Plot indicator bars
         fig_indicators = plot_indicators(data, id, INITIAL_DEPOT_CASH, depends_on)
-        fig_indicators.write_html(produces[1])
+        with profile_stage("plotting", "write_html"):
+            fig_indicators.write_html(produces[1])
 
         # Plot units and cash
-        fig_units_cash = plot_units_and_cash(data, id, depends_on)
-        fig_units_cash.write_html(produces[2])
+        fig_units_cash = plot_units_and_cash(
+            data,
+            id,
+            depends_on,
+            max_points=PLOT_MAX_POINTS,
+        )
+        with profile_stage("plotting", "write_html"):
+            fig_units_cash.write_html(produces[2])
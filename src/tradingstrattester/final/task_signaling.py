@@ -1,31 +1,43 @@
 """"Tasks for creating all signal lists."""
 
-import pickle
-
-import pandas as pd
+import numpy as np
 import pytask
+from tradingstrattester.analysis.result_cache import ResultCache, result_key
 from tradingstrattester.analysis.signaling_functions import signal_list
 from tradingstrattester.config import _ID, BLD, STRATEGIES
-
-_dependencies = []
-for i in _ID:
-    _dependencies.append(BLD / "python" / "data" / i)
-
+from tradingstrattester.data_management.price_store import (
+    price_store_part,
+    read_price_view,
+)
 
 for strategy in STRATEGIES:
+    for id in _ID:
+
+        @pytask.task(id=f"{strategy}_{id.split('.')[0]}")
+        def task_signal_list(
+            signal_generator=strategy,
+            id=id,
+            depends_on=price_store_part(id),
+            produces=BLD
+            / "python"
+            / "analysis"
+            / "signals"
+            / strategy
+            / f"{id.split('.')[0]}.npy",
+        ):
+            """Create the signal list of one strategy for one asset.
 
-    @pytask.task(id=strategy)
-    def task_signal_list(
-        signal_generator=strategy,
-        depends_on=_dependencies,
-        produces=BLD / "python" / "analysis" / f"{strategy}.pkl",
-    ):
-        """Create a dictionary of signal lists for each strategy."""
-        strategy_dict = {}
-        for i in range(len(_ID)):
-            name = f"signal_{_ID[i]}"
-            data = pd.read_pickle(depends_on[i])
-            strategy_dict[name] = signal_list(data, signal_generator)
+            The signal list is taken from the result cache if it was already created on
+            the same data by the same code. Otherwise it is computed from scratch, so a
+            recomputed signal list never uses indicators stored by older code.
 
-        with open(produces, "wb") as file:
-            pickle.dump(strategy_dict, file)
+            """
+            data = read_price_view(id, columns=["Open", "High", "Low", "Close"])
+            signal = ResultCache().memoize(
+                result_key(signal_list, data, generator=signal_generator),
+                signal_list,
+                data,
+                signal_generator,
+                as_array=True,
+            )
+            np.save(produces, signal)
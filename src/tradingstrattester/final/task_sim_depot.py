@@ -2,42 +2,166 @@
 
 import pickle
 
+import numpy as np
 import pytask
+from pytask import PythonNode
+from tradingstrattester.analysis.depot_results import depot_path, write_depot
+from tradingstrattester.analysis.result_cache import (
+    ResultCache,
+    fingerprint,
+    result_key,
+)
 from tradingstrattester.analysis.simulated_depot import simulated_depot
+from tradingstrattester.analysis.simulated_portfolio import simulated_portfolio
 from tradingstrattester.config import (
     _ID,
+    ASSETS,
     BLD,
+    FREQUENCIES,
     INITIAL_DEPOT_CASH,
     START_STOCK_PRCT,
     STRATEGIES,
     TAC,
     UNIT_STRAT,
     UNIT_VAR,
+    VOL_WINDOW,
+)
+from tradingstrattester.data_management.price_store import (
+    price_store_part,
+    read_price_view,
 )
 
+# Part of the dependencies, so changes of the depot configuration rerun the tasks
+_depot_config = {
+    "initial_depot_cash": INITIAL_DEPOT_CASH,
+    "start_stock_prct": START_STOCK_PRCT,
+    "unit_strat": UNIT_STRAT,
+    "unit_var": UNIT_VAR,
+    "tac": TAC,
+    "vol_window": VOL_WINDOW,
+}
+
+_signal_paths = {
+    (strategy, id): BLD
+    / "python"
+    / "analysis"
+    / "signals"
+    / strategy
+    / f"{id.split('.')[0]}.npy"
+    for strategy in STRATEGIES
+    for id in _ID
+}
+_depot_dependencies = {
+    (strategy, id): {
+        "signal": _signal_paths[strategy, id],
+        "data": price_store_part(id),
+        "config": PythonNode(value=_depot_config, hash=fingerprint),
+    }
+    for strategy in STRATEGIES
+    for id in _ID
+}
+_portfolio_dependencies = {
+    (strategy, frequency): {
+        "signals": [
+            _signal_paths[strategy, f"{frequency}_{asset}.pkl"] for asset in ASSETS
+        ],
+        "data": [price_store_part(f"{frequency}_{asset}.pkl") for asset in ASSETS],
+        "config": PythonNode(value=_depot_config, hash=fingerprint),
+    }
+    for strategy in STRATEGIES
+    for frequency in FREQUENCIES
+}
+
+for strategy in STRATEGIES:
+    for id in _ID:
+
+        @pytask.task(id=f"{strategy}_{id.split('.')[0]}_depot")
+        def task_simulating_depot(
+            strategy=strategy,
+            id=id,
+            depends_on=_depot_dependencies[strategy, id],
+            produces=depot_path(strategy, id),
+        ):
+            """Create the simulated depot of one strategy for one asset.
+
+            The depot is taken from the result cache if it was already simulated with
+            the same data, signals and depot configuration.
+
+            """
+            signal = np.load(depends_on["signal"])
+            config = depends_on["config"]
+
+            sim_depot_out = ResultCache().memoize(
+                result_key(
+                    simulated_depot,
+                    read_price_view(id),
+                    signal,
+                    id=id,
+                    **config,
+                ),
+                simulated_depot,
+                {strategy: {f"signal_{id}": signal}},
+                strategy,
+                [id],
+                config["initial_depot_cash"],
+                config["start_stock_prct"],
+                config["unit_strat"],
+                config["unit_var"],
+                config["tac"],
+                vol_window=config["vol_window"],
+            )
+
+            write_depot(sim_depot_out, strategy)
+
+
 for strategy in STRATEGIES:
+    for frequency in FREQUENCIES:
+        _portfolio_id = [f"{frequency}_{asset}.pkl" for asset in ASSETS]
+
+        @pytask.task(id=f"{strategy}_{frequency}_portfolio")
+        def task_simulating_portfolio(
+            strategy=strategy,
+            _id=_portfolio_id,
+            depends_on=_portfolio_dependencies[strategy, frequency],
+            produces=BLD
+            / "python"
+            / "analysis"
+            / f"sim_portfolio{strategy}_{frequency}.pkl",
+        ):
+            """Create the simulated portfolio of all assets of one frequency for each
+            strategy.
+
+            The portfolio is taken from the result cache if it was already simulated
+            with the same data, signals and depot configuration.
+
+            """
+            signals = [np.load(path) for path in depends_on["signals"]]
+            config = depends_on["config"]
+
+            sim_portfolio_out = ResultCache().memoize(
+                result_key(
+                    simulated_portfolio,
+                    *[read_price_view(id) for id in _id],
+                    *signals,
+                    _id=_id,
+                    **config,
+                ),
+                simulated_portfolio,
+                {
+                    strategy: {
+                        f"signal_{id}": signal
+                        for id, signal in zip(_id, signals, strict=True)
+                    },
+                },
+                strategy,
+                _id,
+                config["initial_depot_cash"],
+                config["start_stock_prct"],
+                config["unit_strat"],
+                config["unit_var"],
+                config["tac"],
+                vol_window=config["vol_window"],
+            )
 
-    @pytask.task(id=f"{strategy}_depot")
-    def task_simulating_depot(
-        strategy=strategy,
-        depends_on=BLD / "python" / "analysis" / f"{strategy}.pkl",
-        produces=BLD / "python" / "analysis" / f"sim_depot{strategy}.pkl",
-    ):
-        """Create the simulated depot for each strategy."""
-        signal_dict = {}
-        with open(depends_on, "rb") as file:
-            signal_dict[strategy] = pickle.load(file)
-
-        sim_depot_out = simulated_depot(
-            signal_dict,
-            strategy,
-            _ID,
-            INITIAL_DEPOT_CASH,
-            START_STOCK_PRCT,
-            UNIT_STRAT,
-            UNIT_VAR,
-            TAC,
-        )
-
-        with open(produces, "wb") as file:
-            pickle.dump(sim_depot_out, file)
+            with open(produces, "wb") as file:
+                pickle.dump(sim_portfolio_out, file)
@@ -0,0 +1,235 @@
+"""Functions for timing and counting the work of the stages of the project."""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+from tradingstrattester.config import BLD, PROFILE
+
+PROFILE_DIR = BLD / "profiling"
+PROFILE_ENV = "TRADINGSTRATTESTER_PROFILE"
+# Values of PROFILE_ENV which enable profiling, all other values disable it
+PROFILE_ENV_VALUES = {"1", "true", "yes", "on"}
+
+
+class Profiler:
+    """Collects the timings and counters of profiled functions of one process.
+
+    Timings and counters are recorded per (stage, function), e.g. ("signaling",
+    "signal_list"), where the stage is one of "data", "signaling", "depot" and
+    "plotting". Times are inclusive, i.e. the time of a profiled function contains the
+    time of the profiled functions it calls. Recording is thread-safe, but functions
+    running in worker processes, e.g. with pytask-parallel, are only recorded by the
+    profiler of their worker, which writes its own report.
+
+    Args:
+    - enabled (bool, optional): Whether timings and counters are recorded. Default is False.
+
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.started = time.time()
+        self._records = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage, function, seconds=None, **counters):
+        """Add one call and its duration or counters to the record of a function.
+
+        Args:
+        - stage (str): The stage of the function, e.g. "depot".
+        - function (str): The name of the function, e.g. "simulated_depot".
+        - seconds (float, optional): Duration of one call. If None, only the counters are added. Default is None.
+        - **counters: Amounts added to the counters of the function, e.g. bars=1000.
+
+        """
+        with self._lock:
+            entry = self._records.setdefault(
+                (stage, function),
+                {"calls": 0, "total_seconds": 0.0, "max_seconds": 0.0, "counters": {}},
+            )
+            if seconds is not None:
+                entry["calls"] += 1
+                entry["total_seconds"] += seconds
+                entry["max_seconds"] = max(entry["max_seconds"], seconds)
+            for name, amount in counters.items():
+                entry["counters"][name] = entry["counters"].get(name, 0) + amount
+
+    def report(self):
+        """Timings and counters of all recorded functions.
+
+        Returns:
+        - pandas.DataFrame: One row per (stage, function) with the columns 'stage', 'function', 'calls', 'total_seconds', 'mean_seconds' and 'max_seconds', followed by one column per counter, sorted by total_seconds.
+
+        """
+        with self._lock:
+            rows = [
+                {
+                    "stage": stage,
+                    "function": function,
+                    "calls": entry["calls"],
+                    "total_seconds": entry["total_seconds"],
+                    "mean_seconds": entry["total_seconds"] / max(entry["calls"], 1),
+                    "max_seconds": entry["max_seconds"],
+                    **entry["counters"],
+                }
+                for (stage, function), entry in self._records.items()
+            ]
+        columns = [
+            "stage",
+            "function",
+            "calls",
+            "total_seconds",
+            "mean_seconds",
+            "max_seconds",
+        ]
+        out = pd.DataFrame(rows, columns=None if rows else columns)
+        return out.sort_values("total_seconds", ascending=False, ignore_index=True)
+
+    def write_report(self, directory=PROFILE_DIR):
+        """Write the report of the recorded functions as JSON and CSV.
+
+        Args:
+        - directory (pathlib.Path, optional): Directory of the report. Default is bld/profiling.
+
+        Returns:
+        - pathlib.Path: Path to the JSON report. The CSV report has the same name with the ending ".csv".
+
+        """
+        report = self.report()
+        run = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(self.started))}_{os.getpid()}"
+        path = directory / f"profile_{run}.json"
+        directory.mkdir(parents=True, exist_ok=True)
+
+        with open(path, "w") as file:
+            json.dump(
+                {
+                    "run": run,
+                    "started": self.started,
+                    "finished": time.time(),
+                    "functions": json.loads(report.to_json(orient="records")),
+                },
+                file,
+                indent=2,
+            )
+        report.to_csv(path.with_suffix(".csv"), index=False)
+
+        return path
+
+    def reset(self):
+        """Discard all recorded timings and counters."""
+        with self._lock:
+            self._records.clear()
+        self.started = time.time()
+
+
+def _env_enables_profiling(value):
+    """Whether a value of PROFILE_ENV, e.g. "1" or "True", enables profiling."""
+    return value.strip().lower() in PROFILE_ENV_VALUES
+
+
+PROFILER = Profiler(
+    enabled=PROFILE or _env_enables_profiling(os.environ.get(PROFILE_ENV, "")),
+)
+
+
+def profiled(stage):
+    """Decorator recording the calls and durations of a function in PROFILER.
+
+    If profiling is disabled, the decorated function only checks PROFILER.enabled
+    before calling the function.
+
+    Args:
+    - stage (str): The stage of the function, e.g. "signaling".
+
+    Returns:
+    - callable: The decorator.
+
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                PROFILER.record(stage, func.__name__, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def profile_stage(stage, name):
+    """Context manager recording the duration of a block of code in PROFILER.
+
+    Args:
+    - stage (str): The stage of the block, e.g. "plotting".
+    - name (str): The name of the block, e.g. "write_html".
+
+    """
+    if not PROFILER.enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        PROFILER.record(stage, name, time.perf_counter() - start)
+
+
+def count(stage, function, **counters):
+    """Add to the counters of a function in PROFILER, if profiling is enabled.
+
+    Args:
+    - stage (str): The stage of the function, e.g. "depot".
+    - function (str): The name of the function, e.g. "simulated_depot".
+    - **counters: Amounts added to the counters, e.g. bars=1000, trades=52.
+
+    """
+    if PROFILER.enabled:
+        PROFILER.record(stage, function, **counters)
+
+
+def enable_profiling(enabled=True):
+    """Enable or disable the recording of timings and counters.
+
+    Args:
+    - enabled (bool, optional): Whether profiling is enabled. Default is True.
+
+    """
+    _handle_errors_enable_profiling(enabled)
+    PROFILER.enabled = enabled
+
+
+def profiling_enabled():
+    """Whether timings and counters are recorded."""
+    return PROFILER.enabled
+
+
+@atexit.register
+def _write_report_at_exit():
+    """Write the report of a profiled run, e.g. of pytask, when the process exits."""
+    if PROFILER.enabled and not PROFILER.report().empty:
+        PROFILER.write_report()
+
+
+def _handle_errors_enable_profiling(enabled):
+    """Handle type errors for enable_profiling().
+
+    Raises:
+    - TypeError: If enabled is not a boolean.
+
+    """
+    if not isinstance(enabled, bool):
+        msg = f"'enabled' has to be of type bool and not {type(enabled)}."
+        raise TypeError(msg)
@@ -0,0 +1,61 @@
+""""Test for the depot result functions."""
+
+import numpy as np
+import pytest
+from tradingstrattester.analysis.depot_results import (
+    depot_path,
+    load_depot_balances,
+    read_depot_balances,
+    write_depot,
+    write_depot_balances,
+)
+from tradingstrattester.analysis.simulated_depot import DepotResult
+
+
+# Test depot result outcomes
+def test_write_and_read_depot(tmp_path):
+    """Test if the balances of every asset are stored in and read from their own
+    file.
+    """
+    depot = DepotResult()
+    for number, name in enumerate(["60m_DB", "60m_KO", "1d_DB"]):
+        depot.allocate(name, 10 + number)
+        depot.balances[name][:] = np.arange(3)[:, None] + number
+
+    paths = write_depot(depot, "_RSI_gen", root=tmp_path)
+    assert paths == [
+        depot_path("_RSI_gen", f"{name}.pkl", tmp_path)
+        for name in ["60m_DB", "60m_KO", "1d_DB"]
+    ]
+    assert not list(tmp_path.rglob("*.tmp"))
+
+    out = read_depot_balances("_RSI_gen", "60m_KO.pkl", root=tmp_path)
+    for column in DepotResult.COLUMNS:
+        assert isinstance(out[column], np.memmap)
+        np.testing.assert_array_equal(out[column], depot[column]["60m_KO"])
+
+
+def test_load_depot_balances_of_store(tmp_path):
+    """Test if the balances of an asset file of the depot store are returned."""
+    path = write_depot_balances(np.ones((3, 5)), "_BB_gen", "1d_KO.pkl", tmp_path)
+    out = load_depot_balances(path, "1d_KO")
+    np.testing.assert_array_equal(out["unit_dict"], np.ones(5))
+    with pytest.raises(ValueError):
+        load_depot_balances(path, "1d_DB")
+
+
+# Test depot result error handling
+def test_depot_store_errors(tmp_path):
+    with pytest.raises(TypeError):
+        write_depot_balances([[1.0], [2.0], [3.0]], "_BB_gen", "1d_KO.pkl", tmp_path)
+    with pytest.raises(ValueError):
+        write_depot_balances(np.ones((2, 5)), "_BB_gen", "1d_KO.pkl", tmp_path)
+    with pytest.raises(FileNotFoundError):
+        read_depot_balances("_BB_gen", "1d_KO.pkl", root=tmp_path)
+
+
+def test_load_depot_balances_errors(tmp_path):
+    with pytest.raises(ValueError):
+        load_depot_balances(tmp_path / "sim_depot_RSI_gen.pkl", "60m_DB")
+    with pytest.raises(FileNotFoundError):
+        load_depot_balances(tmp_path / "60m_DB.npy", "60m_DB")
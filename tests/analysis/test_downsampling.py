@@ -0,0 +1,109 @@
+""""Test for the downsampling functions."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from tradingstrattester.analysis.depot_results import write_depot_balances
+from tradingstrattester.analysis.downsampling import (
+    _lttb_indices,
+    downsample_line,
+    downsample_ohlc,
+)
+from tradingstrattester.analysis.plotting_functions import (
+    plot_asset_strategy,
+    plot_units_and_cash,
+)
+from tradingstrattester.config import _ID, STRATEGIES
+from tradingstrattester.data_management.synthetic_data import synthetic_prices
+
+
+def _depends_on(data, tmp_path):
+    """Store depots of all strategies with the closing prices as balances."""
+    balances = np.tile(data.Close.to_numpy(), (3, 1))
+    return [
+        write_depot_balances(balances, strategy, _ID[0], tmp_path)
+        for strategy in STRATEGIES
+    ]
+
+
+# Test downsampling outcomes
+@pytest.mark.parametrize("n", [10, 1_000, 100_003])
+def test_downsample_line(n):
+    """Test if at most max_points points including the end points and extremes are
+    kept.
+    """
+    values = np.random.default_rng(n).normal(size=n).cumsum()
+    index = pd.RangeIndex(n)
+    x, y = downsample_line(index, values, 100)
+    assert len(x) == len(y) <= 100
+    assert len(x) >= min(n, 98)
+    assert x[0] == 0
+    assert x[-1] == n - 1
+    assert (np.diff(x) > 0).all()
+    np.testing.assert_array_equal(y, values[x])
+    assert y.min() == values.min()
+    assert y.max() == values.max()
+
+
+def test_lttb_indices_keeps_peaks():
+    """Test if LTTB keeps a spike which a strided subsample would miss."""
+    values = np.zeros(10_000)
+    values[5_001] = 1
+    assert 5_001 in _lttb_indices(values, 50)
+    assert len(_lttb_indices(values, 50)) == 50
+
+
+def test_downsample_line_unchanged():
+    values = np.arange(10.0)
+    x, y = downsample_line(pd.RangeIndex(10), values, None)
+    np.testing.assert_array_equal(y, values)
+    x, y = downsample_line(pd.RangeIndex(10), values, 10)
+    np.testing.assert_array_equal(y, values)
+
+
+def test_downsample_ohlc():
+    """Test if re-aggregated bars keep the extremes and the first and last price."""
+    data = synthetic_prices(10_001, "60m", seed=3)
+    out = downsample_ohlc(data, 500)
+    assert len(out) == 500
+    assert out.index[0] == data.index[0]
+    assert out.Open.iloc[0] == data.Open.iloc[0]
+    assert out.Close.iloc[-1] == data.Close.iloc[-1]
+    assert out.High.max() == data.High.max()
+    assert out.Low.min() == data.Low.min()
+    assert out.Volume.sum() == data.Volume.sum()
+    assert (out.High >= out[["Open", "Close"]].max(axis=1)).all()
+    assert (out.Low <= out[["Open", "Close"]].min(axis=1)).all()
+    pd.testing.assert_frame_equal(downsample_ohlc(data, None), data)
+
+
+def test_plot_size_independent_of_bars(tmp_path):
+    """Test if the size of downsampled figures does not grow with the number of
+    bars.
+    """
+    sizes = []
+    for n_bars in [20_000, 200_000]:
+        data = synthetic_prices(n_bars, "60m")
+        depends_on = _depends_on(data, tmp_path)
+        fig_asset = plot_asset_strategy(
+            data,
+            _ID[0],
+            10_000,
+            depends_on,
+            max_points=1_000,
+        )
+        fig_units = plot_units_and_cash(data, _ID[0], depends_on, max_points=1_000)
+        for trace in [*fig_asset.data, *fig_units.data]:
+            assert len(trace.x) <= 1_000
+        sizes.append(len(fig_asset.to_json()) + len(fig_units.to_json()))
+    assert sizes[1] < 1.05 * sizes[0]
+
+
+# Test downsampling error handling
+def test_downsampling_errors():
+    with pytest.raises(TypeError):
+        downsample_line(pd.RangeIndex(10), np.arange(10.0), 5.0)
+    with pytest.raises(ValueError):
+        downsample_line(pd.RangeIndex(10), np.arange(10.0), 3)
+    with pytest.raises(ValueError):
+        downsample_ohlc(synthetic_prices(10), 0)
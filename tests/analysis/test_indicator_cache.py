@@ -0,0 +1,53 @@
+""""Test for the indicator cache."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from tradingstrattester.analysis.indicator_cache import IndicatorCache
+from tradingstrattester.analysis.signaling_functions import signal_list
+
+rng = np.random.default_rng(0)
+close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 500)))
+data = pd.DataFrame({"Open": close, "High": close, "Low": close, "Close": close})
+
+
+# Test indicator cache outcomes
+@pytest.mark.parametrize("generator", ["_RSI_gen", "_BB_gen", "_MACD_gen"])
+def test_signal_list_with_indicator_cache(generator):
+    """Test if signals with the cache equal the signals without it."""
+    indicators = IndicatorCache().bind(data, "1d_DB.pkl")
+    expected = signal_list(data, generator, as_array=True)
+    for _ in range(2):
+        out = signal_list(data, generator, as_array=True, indicators=indicators)
+        np.testing.assert_array_equal(out, expected)
+
+
+def test_indicator_cache_keys():
+    """Test if indicators are keyed by asset ID, indicator, parameters and data."""
+    cache = IndicatorCache()
+    signal_list(data, "_RSI_gen", indicators=cache.bind(data, "1d_DB.pkl"), period=5)
+    assert ("rsi", 5) in cache.bind(data, "1d_DB.pkl")
+    assert ("rsi", 5) not in cache.bind(data, "1d_KO.pkl")
+    assert ("rsi", 5) not in cache.bind(data * 2, "1d_DB.pkl")
+    assert ("rsi", 14) not in cache.bind(data, "1d_DB.pkl")
+
+
+def test_indicator_cache_lru_eviction():
+    """Test if the least recently used indicator is evicted."""
+    cache = IndicatorCache(maxsize=2)
+    cache["a"], cache["b"] = 1, 2
+    assert cache["a"] == 1
+    cache["c"] = 3
+    assert len(cache) == 2
+    assert "a" in cache
+    assert "b" not in cache
+    with pytest.raises(KeyError):
+        cache["b"]
+
+
+# Test indicator cache error handling
+def test_indicator_cache_errors():
+    with pytest.raises(TypeError):
+        IndicatorCache(maxsize=1.5)
+    with pytest.raises(ValueError):
+        IndicatorCache(maxsize=0)
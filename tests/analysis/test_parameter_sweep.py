@@ -0,0 +1,100 @@
+""""Test for the parameter sweep functions."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from tradingstrattester.analysis.parameter_sweep import (
+    _grid_combinations,
+    _handle_errors_parameter_sweep,
+    parameter_sweep,
+)
+from tradingstrattester.analysis.signaling_functions import signal_list
+from tradingstrattester.analysis.simulated_depot import (
+    DepotResult,
+    _initialize_variables,
+    _simulate_python,
+)
+
+rng = np.random.default_rng(0)
+close = 100 + np.cumsum(rng.normal(0, 1, 300))
+data = pd.DataFrame({"Open": close, "High": close, "Low": close, "Close": close})
+data_dict = {"60m_DB.pkl": data, "1d_DB.pkl": data.iloc[:200]}
+depot_grid = {
+    "unit_strat": ["percentage_to_value_trades", "volatility_unit_trades"],
+    "unit_var": [0.05, 0.1],
+    "tac": [0.0005],
+}
+
+
+# Test parameter_sweep outcomes
+def test_parameter_sweep_table_shape():
+    """Test if every asset and parameter combination gets one row."""
+    param_grid = {"period": [7, 14], "rsi_threshold_low": [20, 30]}
+    out = parameter_sweep(data_dict, "_RSI_gen", param_grid, depot_grid, 1000, 0.25)
+    assert len(out) == len(data_dict) * 4 * 4
+    assert set(out.columns) == {
+        "id",
+        "generator",
+        "period",
+        "rsi_threshold_low",
+        "unit_strat",
+        "unit_var",
+        "tac",
+        "final_value",
+    }
+    assert set(out.id) == {"60m_DB", "1d_DB"}
+
+
+@pytest.mark.parametrize(
+    ("generator", "param_grid"),
+    [
+        ("_BB_gen", {"window": [10, 20], "num_std_dev": [1, 1.5]}),
+        ("_MACD_gen", {"fast_period": [6, 12], "threshold_multiplier": [0, 0.4]}),
+    ],
+)
+def test_parameter_sweep_equals_single_simulation(generator, param_grid):
+    """Test if the final values equal separately simulated depots."""
+    out = parameter_sweep(data_dict, generator, param_grid, depot_grid, 1000, 0.25)
+    for row in out.itertuples():
+        asset_data = data_dict[f"{row.id}.pkl"]
+        params = {key: getattr(row, key) for key in param_grid}
+        signal = signal_list(asset_data, generator, as_array=True, **params)
+
+        depot = DepotResult()
+        cash, units, value = depot.allocate(row.id, len(signal))
+        _initialize_variables(asset_data, 1000, 0.25, units, cash, value)
+        _simulate_python(
+            signal,
+            asset_data,
+            row.unit_strat,
+            row.unit_var,
+            row.tac,
+            units,
+            cash,
+            value,
+        )
+        assert value[-1] == pytest.approx(row.final_value)
+
+
+def test_grid_combinations():
+    """Test the expansion of parameter grids."""
+    assert _grid_combinations({}) == [{}]
+    assert _grid_combinations({"a": [1, 2], "b": [3]}) == [
+        {"a": 1, "b": 3},
+        {"a": 2, "b": 3},
+    ]
+
+
+# Test parameter_sweep error handling
+@pytest.mark.parametrize(
+    ("args", "error"),
+    [
+        (([data], "_RSI_gen", {}, depot_grid), TypeError),
+        ((data_dict, "_RSI_gen", {"period": 14}, depot_grid), TypeError),
+        (({}, "_RSI_gen", {}, depot_grid), ValueError),
+        ((data_dict, "_RSI_gen", {}, {"unit_var": [0.1]}), ValueError),
+    ],
+)
+def test_handle_errors_parameter_sweep(args, error):
+    with pytest.raises(error):
+        _handle_errors_parameter_sweep(*args)
@@ -0,0 +1,125 @@
+""""Test for the performance metrics functions."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from tradingstrattester.analysis.performance_metrics import (
+    METRICS,
+    PERIODS_PER_YEAR,
+    _longest_run,
+    bars_per_year,
+    depot_metrics,
+)
+from tradingstrattester.data_management.price_store import write_prices
+
+
+def _depot(**assets):
+    """Depot of (cash, units, value) balances of each asset."""
+    return {
+        column: {
+            asset: np.asarray(balances[i], dtype=float)
+            for asset, balances in assets.items()
+        }
+        for i, column in enumerate(["cash_dict", "unit_dict", "value_dict"])
+    }
+
+
+depots = {
+    "_RSI_gen": _depot(
+        **{
+            "1d_DB": ([50, 50, 0, 0, 0], [1, 1, 2, 2, 2], [100, 110, 99, 121, 110]),
+            "1wk_DB": ([100, 100, 100], [0, 0, 0], [100, 100, 100]),
+        },
+    ),
+    "_BB_gen": _depot(**{"1d_DB": ([0, 0, 0], [1, 1, 1], [100, 90, 99])}),
+}
+
+
+# Test performance metrics outcomes
+def test_depot_metrics_shape():
+    """Test if there is one row per strategy and asset and one column per metric."""
+    out = depot_metrics(depots)
+    assert list(out.columns) == METRICS
+    assert list(out.index) == [
+        ("_RSI_gen", "1d_DB"),
+        ("_RSI_gen", "1wk_DB"),
+        ("_BB_gen", "1d_DB"),
+    ]
+
+
+def test_depot_metrics_values():
+    """Test the metrics of a depot against values computed by hand."""
+    out = depot_metrics(depots).loc["_RSI_gen", "1d_DB"]
+    returns = np.array([0.1, -0.1, 2 / 9, -1 / 11])
+
+    assert out.total_return == pytest.approx(0.1)
+    assert out.annualized_return == pytest.approx(1.1 ** (252 / 4) - 1)
+    assert out.annualized_volatility == pytest.approx(
+        returns.std(ddof=1) * np.sqrt(252),
+    )
+    assert out.sharpe_ratio == pytest.approx(
+        returns.mean() / returns.std(ddof=1) * np.sqrt(252),
+    )
+    assert out.sortino_ratio == pytest.approx(
+        returns.mean() / np.sqrt((0.1**2 + (1 / 11) ** 2) / 4) * np.sqrt(252),
+    )
+    assert out.max_drawdown == pytest.approx(0.1)
+    assert out.max_drawdown_bars == 1
+    assert out.max_drawdown_years == pytest.approx(1 / 252)
+    assert out.turnover == pytest.approx(50 / 108 * 252 / 4)
+    assert out.trade_count == 1
+    assert out.hit_rate == pytest.approx(0.5)
+    assert out.exposure == pytest.approx(np.mean([0.5, 60 / 110, 1, 1, 1]))
+
+
+def test_depot_metrics_frequency():
+    """Test if metrics are annualized with the bars per year of the frequency."""
+    out = depot_metrics(depots)
+    assert out.loc[("_BB_gen", "1d_DB"), "max_drawdown_bars"] == 2
+    assert out.loc[("_BB_gen", "1d_DB"), "max_drawdown_years"] == pytest.approx(
+        2 / 252,
+    )
+    custom = depot_metrics(depots, periods_per_year={"1d_DB": 365})
+    assert custom.loc[("_BB_gen", "1d_DB"), "max_drawdown_years"] == pytest.approx(
+        2 / 365,
+    )
+
+
+def test_depot_metrics_without_position():
+    """Test if a depot which never holds units has no return, trades or exposure."""
+    out = depot_metrics(depots).loc["_RSI_gen", "1wk_DB"]
+    assert out.total_return == 0
+    assert out.trade_count == 0
+    assert out.exposure == 0
+    assert np.isnan(out.hit_rate)
+
+
+def test_longest_run():
+    mask = np.array([[1, 0], [1, 0], [0, 1], [1, 1], [1, 1], [1, 0]], dtype=bool)
+    np.testing.assert_array_equal(_longest_run(mask), [3, 3])
+
+
+def test_bars_per_year(tmp_path):
+    """Test if the bars per year are estimated from the stored time steps."""
+    index = pd.date_range("2020-01-01", periods=25 * 365 + 1, freq="h", name="Datetime")
+    data = pd.DataFrame({"Close": np.ones(len(index))}, index=index)
+    write_prices(data, "60m_EURUSD=X.pkl", tmp_path)
+    assert bars_per_year("60m_EURUSD=X.pkl", root=tmp_path) == pytest.approx(
+        24 * 365.25,
+    )
+    write_prices(data.iloc[:1], "60m_DB.pkl", tmp_path)
+    assert bars_per_year("60m_DB.pkl", root=tmp_path) == PERIODS_PER_YEAR["60m"]
+
+
+# Test performance metrics error handling
+def test_depot_metrics_errors():
+    with pytest.raises(TypeError):
+        depot_metrics([depots])
+    with pytest.raises(TypeError):
+        depot_metrics(depots, periods_per_year=252)
+    with pytest.raises(TypeError):
+        depot_metrics(depots, risk_free_rate="0.02")
+    with pytest.raises(ValueError):
+        depot_metrics({"_RSI_gen": _depot(**{"2h_DB": ([0], [0], [100])})})
+    with pytest.raises(ValueError):
+        depot_metrics({"_RSI_gen": _depot(**{"1d_DB": ([0, 0], [0], [100, 100])})})
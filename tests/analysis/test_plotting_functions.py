@@ -1,6 +1,7 @@
 """"Test for the plotting functions."""
 import pandas as pd
 import pytest
+from tradingstrattester.analysis.depot_results import depot_path
 from tradingstrattester.analysis.plotting_functions import (
     _generate_intervals,
     _handle_errors_in_plot_functions,
@@ -8,7 +9,7 @@ from tradingstrattester.analysis.plotting_functions import (
     plot_indicators,
     plot_units_and_cash,
 )
-from tradingstrattester.config import _ID, BLD, STRATEGIES
+from tradingstrattester.config import _ID, STRATEGIES
 from tradingstrattester.data_management.data_functions import data_download
 
 # Correct input variables
@@ -17,7 +18,7 @@ id = "60m_DB.pkl"
 initial_depot_cash = 100
 _dependencies = []
 for strategy in STRATEGIES:
-    _dependencies.append(BLD / "python" / "analysis" / f"sim_depot{strategy}.pkl")
+    _dependencies.append(depot_path(strategy, id))
 
 
 ## Testing error_handling
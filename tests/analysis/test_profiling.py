@@ -0,0 +1,134 @@
+""""Test for the profiling functions."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from tradingstrattester.analysis.signaling_functions import signal_list
+from tradingstrattester.data_management.price_store import (
+    read_price_view,
+    write_prices,
+)
+from tradingstrattester.profiling import (
+    PROFILER,
+    _env_enables_profiling,
+    count,
+    enable_profiling,
+    profile_stage,
+    profiled,
+    profiling_enabled,
+)
+
+rng = np.random.default_rng(0)
+close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 500)))
+data = pd.DataFrame(
+    {"Open": close, "High": close, "Low": close, "Close": close},
+    index=pd.date_range("2020-01-01", periods=500, freq="D", name="Date"),
+)
+
+
+@pytest.fixture()
+def profiler():
+    enabled = profiling_enabled()
+    PROFILER.reset()
+    enable_profiling()
+    yield PROFILER
+    enable_profiling(enabled)
+    PROFILER.reset()
+
+
+# Test profiling outcomes
+def test_profiled_pipeline_functions(profiler, tmp_path):
+    """Test if the calls, times and counters of the stages are recorded."""
+    write_prices(data, "1d_DB.pkl", root=tmp_path)
+    view = read_price_view("1d_DB.pkl", columns=["Close"], root=tmp_path)
+    for generator in ["_RSI_gen", "_BB_gen"]:
+        signal_list(data, generator)
+
+    report = profiler.report().set_index(["stage", "function"])
+    assert report.loc[("signaling", "signal_list"), "calls"] == 2
+    assert report.loc[("signaling", "signal_list"), "bars"] == 1_000
+    assert report.loc[("data", "write_prices"), "bars"] == 500
+    assert report.loc[("data", "read_price_view"), "bytes_read"] == (
+        view.memory_usage(index=True).sum()
+    )
+    assert (report.total_seconds > 0).all()
+    assert (report.max_seconds <= report.total_seconds).all()
+
+
+def test_profile_stage_and_count(profiler):
+    """Test if blocks of code and counters without calls are recorded."""
+    with profile_stage("plotting", "write_html"):
+        pass
+    with pytest.raises(ZeroDivisionError), profile_stage("plotting", "write_html"):
+        1 / 0
+    count("depot", "simulated_depot", trades=3)
+    count("depot", "simulated_depot", trades=4)
+
+    report = profiler.report().set_index(["stage", "function"])
+    assert report.loc[("plotting", "write_html"), "calls"] == 2
+    assert report.loc[("depot", "simulated_depot"), "calls"] == 0
+    assert report.loc[("depot", "simulated_depot"), "trades"] == 7
+
+
+def test_profiling_disabled():
+    """Test if nothing is recorded if profiling is disabled."""
+    enabled = profiling_enabled()
+    enable_profiling(False)
+    PROFILER.reset()
+
+    @profiled("signaling")
+    def double(x):
+        return 2 * x
+
+    assert double(2) == 4
+    assert double.__name__ == "double"
+    signal_list(data, "_crossover_gen")
+    count("depot", "simulated_depot", trades=1)
+    assert PROFILER.report().empty
+
+    enable_profiling(enabled)
+
+
+def test_write_report(profiler, tmp_path):
+    """Test if the JSON and CSV report contain the recorded functions."""
+    signal_list(data, "_MACD_gen")
+    path = profiler.write_report(tmp_path)
+
+    with open(path) as file:
+        report = json.load(file)
+    assert report["functions"][0]["function"] == "signal_list"
+    assert report["functions"][0]["bars"] == 500
+    assert report["finished"] >= report["started"]
+    out = pd.read_csv(path.with_suffix(".csv"))
+    assert out.loc[0, "calls"] == 1
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("1", True),
+        ("true", True),
+        ("True", True),
+        (" YES ", True),
+        ("on", True),
+        ("", False),
+        ("0", False),
+        ("false", False),
+        ("False", False),
+        ("no", False),
+        ("off", False),
+    ],
+)
+def test_profiling_environment_variable(value, expected):
+    """Test if only explicit truthy values of the environment variable enable
+    profiling.
+    """
+    assert _env_enables_profiling(value) is expected
+
+
+# Test profiling error handling
+def test_enable_profiling_errors():
+    with pytest.raises(TypeError):
+        enable_profiling("yes")
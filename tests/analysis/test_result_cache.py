@@ -0,0 +1,111 @@
+""""Test for the result cache."""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from tradingstrattester.analysis.result_cache import (
+    ResultCache,
+    fingerprint,
+    result_key,
+)
+from tradingstrattester.analysis.signaling_functions import signal_list
+
+rng = np.random.default_rng(0)
+close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 500)))
+data = pd.DataFrame(
+    {"Open": close, "High": close, "Low": close, "Close": close},
+    index=pd.date_range("2024-01-01", periods=500, freq="D", tz="UTC"),
+)
+
+
+def _touch(cache, key, seconds):
+    """Set the time of last use of key, as file times may be too coarse for LRU."""
+    os.utime(cache._path(key), ns=(seconds * 10**9, seconds * 10**9))
+
+
+# Test result cache outcomes
+def test_result_cache_memoize(tmp_path):
+    """Test if a result is computed once and read from disk afterwards."""
+    calls = []
+
+    def compute(value):
+        calls.append(value)
+        return np.full(3, value)
+
+    key = result_key(signal_list, data, generator="_RSI_gen")
+    for cache in [ResultCache(tmp_path), ResultCache(tmp_path)]:
+        out = cache.memoize(key, compute, 2.0)
+        np.testing.assert_array_equal(out, np.full(3, 2.0))
+    assert calls == [2.0]
+    assert key in ResultCache(tmp_path)
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_result_key():
+    """Test if keys change with the function, the inputs and the parameters."""
+    key = result_key(signal_list, data, generator="_RSI_gen", tac=0.0005)
+    assert key == result_key(
+        signal_list,
+        data.copy(),
+        tac=0.0005,
+        generator="_RSI_gen",
+    )
+    assert key != result_key(signal_list, data * 2, generator="_RSI_gen", tac=0.0005)
+    assert key != result_key(signal_list, data, generator="_BB_gen", tac=0.0005)
+    assert key != result_key(signal_list, data, generator="_RSI_gen", tac=0.001)
+    assert key != result_key(fingerprint, data, generator="_RSI_gen", tac=0.0005)
+    assert key != result_key(
+        signal_list,
+        data.tz_convert("US/Eastern"),
+        generator="_RSI_gen",
+        tac=0.0005,
+    )
+
+
+def test_fingerprint():
+    """Test if equal values have equal fingerprints."""
+    signal = np.array([0, 1, 2], dtype=np.int8)
+    assert fingerprint(signal) == fingerprint(signal.copy())
+    assert fingerprint(signal) != fingerprint(signal.astype(np.int64))
+    assert fingerprint(data.Close) == fingerprint(data.Close.copy())
+    assert fingerprint(data.Close) != fingerprint(data.Close.iloc[1:])
+    assert fingerprint({"a": 1, "b": 2}) == fingerprint({"b": 2, "a": 1})
+
+
+def test_result_cache_lru_eviction(tmp_path):
+    """Test if the least recently used results are evicted beyond max_bytes."""
+    cache = ResultCache(tmp_path, max_bytes=10**9)
+    for number, key in enumerate(["a", "b", "c"]):
+        cache[key] = np.zeros(1000)
+        _touch(cache, key, number + 1)
+    cache["a"]
+    cache.max_bytes = 3 * cache._path("a").stat().st_size
+    cache["d"] = np.zeros(1000)
+
+    assert len(cache) == 3
+    assert "b" not in cache
+    assert all(key in cache for key in ["a", "c", "d"])
+    with pytest.raises(KeyError):
+        cache["b"]
+
+
+def test_result_cache_clear(tmp_path):
+    cache = ResultCache(tmp_path)
+    cache["a"] = [1, 2]
+    assert cache.nbytes() > 0
+    del cache["a"]
+    with pytest.raises(KeyError):
+        del cache["a"]
+    cache["b"] = [1, 2]
+    cache.clear()
+    assert len(cache) == 0
+
+
+# Test result cache error handling
+def test_result_cache_errors(tmp_path):
+    with pytest.raises(TypeError):
+        ResultCache(tmp_path, max_bytes=1.5)
+    with pytest.raises(ValueError):
+        ResultCache(tmp_path, max_bytes=-1)
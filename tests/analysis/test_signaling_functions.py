@@ -1,4 +1,5 @@
 """"Test for the signaling functions."""
+import numpy as np
 import pandas as pd
 import pytest
 from tradingstrattester.analysis.signaling_functions import (
@@ -6,6 +7,7 @@ from tradingstrattester.analysis.signaling_functions import (
     _crossover_signal_gen,
     _handle_errors_bb,
     _handle_errors_macd_gen,
+    _handle_errors_random_mode,
     _handle_errors_rsi,
     _macd_signal_gen,
     _random_signal_gen,
@@ -182,6 +184,44 @@ def test_strategy_signal_generator_outcomes(
     assert _macd_signal_gen(macd_1, 2, 1, 2, 0) == macd_2
 
 
+# Test signal_list array output
+@pytest.mark.parametrize("generator", STRATEGIES)
+def test_signal_list_as_array(generator):
+    """Test if signal_list() returns the same signals as np.int8 array."""
+    df = pd.DataFrame(
+        [[0, 0, 0, 2], [2, 0, 0, 1], [0, 0, 0, 3], [3, 0, 0, 0]],
+        range(4),
+        columns=columns,
+    )
+    out = signal_list(df, generator, as_array=True)
+    assert out.dtype == np.int8
+    assert out.tolist() == signal_list(df, generator)
+
+
+def test_signal_list_generator_kwargs_and_indicators():
+    """Test if signal_list() passes parameters and reuses memoized indicators."""
+    df = pd.DataFrame(
+        [[0, 0, 0, c] for c in [2, 1, 0, 1, 2, 3, 2]],
+        range(7),
+        columns=columns,
+    )
+    indicators = {}
+    assert signal_list(df, "_BB_gen", window=2, num_std_dev=0.5) == (
+        _bollinger_bands_signal_gen(df, window=2, num_std_dev=0.5)
+    )
+    assert signal_list(df, "_RSI_gen", indicators=indicators, period=3) == (
+        _rsi_signal_gen(df, period=3)
+    )
+    assert ("rsi", 3) in indicators
+    assert signal_list(
+        df,
+        "_RSI_gen",
+        indicators=indicators,
+        period=3,
+        rsi_threshold_high=60,
+    ) == _rsi_signal_gen(df, rsi_threshold_high=60, period=3)
+
+
 # Test_random_signal_gen outcomes
 def test_random_signal_gen_outcome():
     """Test if _random_signal_gen() outcomes are as expected."""
@@ -191,6 +231,26 @@ def test_random_signal_gen_outcome():
     assert _random_signal_gen(df, 0, 0, 1) == [2]
 
 
+def test_random_signal_gen_compat_mode():
+    """Test if the compat mode reproduces the per-index seeded signals."""
+    df = pd.DataFrame(1, index=range(50), columns=["Open", "High", "Low", "Close"])
+    expected = [
+        np.random.default_rng(i).choice([0, 1, 2], p=[0.7, 0.15, 0.15])
+        for i in range(len(df))
+    ]
+    assert _random_signal_gen(df) == expected
+    assert signal_list(df, "_random_gen") == expected
+
+
+def test_random_signal_gen_batched_mode():
+    """Test if the batched mode is reproducible and selectable in signal_list()."""
+    df = pd.DataFrame(1, index=range(50), columns=["Open", "High", "Low", "Close"])
+    out = signal_list(df, "_random_gen", as_array=True, random_mode="batched")
+    assert out.dtype == np.int8
+    assert out.tolist() == _random_signal_gen(df, random_mode="batched")
+    assert _random_signal_gen(df, 0, 0, 1, random_mode="batched") == [2] * len(df)
+
+
 # Test signaling functions error handling
 def test_probability_errors_in_random_signal_gen():
     """Test if probability error handling for _random_signal_gen() works."""
@@ -203,6 +263,14 @@ def test_probability_errors_in_random_signal_gen():
         _random_signal_gen(df, 0.5, 0.5, 0.5)
 
 
+def test_random_mode_error_handling():
+    """Test random_mode error handling."""
+    with pytest.raises(ValueError):
+        _handle_errors_random_mode("typo")
+    with pytest.raises(TypeError):
+        _handle_errors_random_mode(1)
+
+
 def test_rsi_error_handling():
     """Test rsi_signal_gen error handling."""
     with pytest.raises(ValueError):
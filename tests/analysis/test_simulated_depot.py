@@ -1,10 +1,20 @@
 """"Test for the simulating depot functions."""
 
+import numpy as np
 import pandas as pd
 import pytest
 from tradingstrattester.analysis.simulated_depot import (
+    DepotResult,
     __handle_errors_in_sim_depot_config_vars,
+    _depot_step,
+    _handle_errors_engine,
     _handle_errors_in_input_variables,
+    _handle_errors_n_workers,
+    _handle_errors_vol_window,
+    _initialize_variables,
+    _rolling_std,
+    _simulate_kernel,
+    _simulate_python,
     _trade_units,
     simulated_depot,
 )
@@ -93,6 +103,35 @@ def test_initial_depot_cash_in_simulated_depot():
         assert depot["value_dict"][id.split(".")[0]][0] == 100
 
 
+@pytest.mark.parametrize("engine", ["kernel", "python"])
+def test_parallel_simulated_depot_equals_serial(engine):
+    """Test if simulating the assets on a process pool gives the same depot."""
+    signal = {}
+    for id in _ID:
+        signal[f"signal_{id}"] = [0, 1, 2, 1, 0, 2]
+    test_dict = {STRATEGIES[0]: signal}
+    depots = [
+        simulated_depot(
+            test_dict,
+            STRATEGIES[0],
+            _ID,
+            INITIAL_DEPOT_CASH,
+            START_STOCK_PRCT,
+            UNIT_STRAT,
+            UNIT_VAR,
+            TAC,
+            engine=engine,
+            n_workers=n_workers,
+        )
+        for n_workers in [1, 2]
+    ]
+    for id in _ID:
+        np.testing.assert_array_equal(
+            depots[0].balances[id.split(".")[0]],
+            depots[1].balances[id.split(".")[0]],
+        )
+
+
 # Test unit trading strategy outcomes
 data = pd.DataFrame(
     [[1, 0, 0, 1], [1, 0, 0, 1]],
@@ -107,6 +146,145 @@ def test_unit_trading_strats_outcome():
     assert _trade_units(1, data, [1, 1], "volatility_unit_trades", 1) == 1
 
 
+def test_depot_step():
+    """Test the buy, sell and no signal rules of a single time step."""
+    assert _depot_step(1, 10.0, 100.0, 1.0, 110.0, 0, 2.0, 0.0, 1.0) == (
+        80.0,
+        3.0,
+        110.0,
+    )
+    assert _depot_step(2, 10.0, 100.0, 1.0, 110.0, 0, 2.0, 0.0, 1.0) == (
+        100.0,
+        1.0,
+        110.0,
+    )
+    assert _depot_step(2, 10.0, 100.0, 8.0, 140.0, 1, 0.5, 0.0, 1.0) == (
+        170.0,
+        1.0,
+        180.0,
+    )
+    assert _depot_step(2, 10.0, 100.0, 4.0, 140.0, 1, 0.5, 0.0, 1.0) == (
+        100.0,
+        4.0,
+        140.0,
+    )
+    assert _depot_step(1, 10.0, 100.0, 1.0, 110.0, 2, 0.5, 0.0, 0.5) == (
+        80.0,
+        3.0,
+        110.0,
+    )
+    assert _depot_step(0, 10.0, 100.0, 1.0, 110.0, 0, 2.0, 0.0, 1.0) == (
+        100.0,
+        1.0,
+        110.0,
+    )
+
+
+# Test simulation kernel outcomes
+unit_strats = [
+    ("fixed_trade_units", 1),
+    ("percentage_to_value_trades", 0.05),
+    ("volatility_unit_trades", 0.05),
+]
+
+
+@pytest.mark.parametrize(("unit_strat", "unit_var"), unit_strats)
+def test_simulate_kernel_equals_python_engine(unit_strat, unit_var):
+    """Test if the simulation kernel matches the per time step implementation."""
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 1, 200))
+    data = pd.DataFrame(
+        {"Open": close, "High": close, "Low": close, "Close": close},
+    )
+    signal = rng.choice([0, 1, 2], size=len(data), p=[0.6, 0.2, 0.2])
+
+    depot = DepotResult()
+    for name, simulate in [("python", _simulate_python), ("kernel", _simulate_kernel)]:
+        cash, units, value = depot.allocate(name, len(signal))
+        _initialize_variables(data, 1000, 0.25, units, cash, value)
+        simulate(signal, data, unit_strat, unit_var, TAC, units, cash, value)
+    np.testing.assert_allclose(depot.balances["kernel"], depot.balances["python"])
+
+
+def test_depot_result_mapping_interface():
+    """Test if DepotResult exposes the cash, unit and value dictionaries."""
+    depot = DepotResult()
+    cash, units, value = depot.allocate("60m_DB", 3)
+    cash[:] = [1, 2, 3]
+    value[2] = 10
+    assert list(depot) == ["cash_dict", "unit_dict", "value_dict"]
+    assert depot["cash_dict"]["60m_DB"].tolist() == [1, 2, 3]
+    assert depot["unit_dict"]["60m_DB"].tolist() == [0, 0, 0]
+    assert depot["value_dict"]["60m_DB"][-1] == 10
+    assert depot.balances["60m_DB"].shape == (3, 3)
+
+
+def test_depot_result_unknown_key():
+    """Test if unknown keys behave like missing keys of a dictionary."""
+    depot = DepotResult()
+    depot.allocate("60m_DB", 3)
+    assert "cash_dict" in depot
+    assert "foo" not in depot
+    assert depot.get("foo") is None
+    with pytest.raises(KeyError):
+        depot["foo"]
+
+
+def test_rolling_std_matches_np_std():
+    """Test if _rolling_std() equals np.std() of every past window."""
+    close = np.random.default_rng(0).normal(100, 1, 300)
+    out = _rolling_std(close, 50, chunk_size=100)
+    assert np.isnan(out[:50]).all()
+    for i in range(50, len(close)):
+        assert out[i] == np.std(close[i - 50 : i])
+
+
+def test_trade_units_with_rolling_std():
+    """Test if precomputed volatility gives the same trade units."""
+    close = np.random.default_rng(1).normal(100, 1, 100)
+    data = pd.DataFrame({"Close": close})
+    value = np.full(len(close), 10_000.0)
+    rolling_std = _rolling_std(close, 10)
+    for i in range(1, len(close)):
+        assert _trade_units(
+            i,
+            data,
+            value,
+            "volatility_unit_trades",
+            0.05,
+            10,
+        ) == _trade_units(
+            i,
+            data,
+            value,
+            "volatility_unit_trades",
+            0.05,
+            10,
+            rolling_std,
+        )
+
+
+def test_handle_errors_vol_window():
+    with pytest.raises(ValueError):
+        _handle_errors_vol_window(0)
+    with pytest.raises(TypeError):
+        _handle_errors_vol_window(5.5)
+
+
+def test_handle_errors_n_workers():
+    with pytest.raises(ValueError):
+        _handle_errors_n_workers(0)
+    with pytest.raises(TypeError):
+        _handle_errors_n_workers("2")
+
+
+def test_handle_errors_engine():
+    with pytest.raises(ValueError):
+        _handle_errors_engine("numba")
+    with pytest.raises(TypeError):
+        _handle_errors_engine(1)
+
+
 # Test signal_dict and strategy error handling
 def test_handle_error_in_input_variables():
     with pytest.raises(TypeError):
@@ -0,0 +1,153 @@
+""""Test for the simulating portfolio functions."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from tradingstrattester.analysis.simulated_depot import _simulate_asset
+from tradingstrattester.analysis.simulated_portfolio import (
+    _handle_errors_portfolio_id,
+    _simulate_portfolio,
+    simulated_portfolio,
+)
+from tradingstrattester.config import (
+    ASSETS,
+    FREQUENCIES,
+    START_STOCK_PRCT,
+    STRATEGIES,
+    TAC,
+    UNIT_STRAT,
+    UNIT_VAR,
+)
+
+rng = np.random.default_rng(0)
+close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 500)))
+signal = rng.choice([0, 1, 2], size=len(close), p=[0.6, 0.2, 0.2]).astype(np.int8)
+
+
+# Test simulated_portfolio outcomes
+def test_initial_value_in_simulated_portfolio():
+    """Test if the start value of simulated_portfolio() is equal to the initial cash."""
+    _id = [f"{FREQUENCIES[0]}_{asset}.pkl" for asset in ASSETS]
+    test_dict = {STRATEGIES[0]: {f"signal_{id}": [0, 1, 2] for id in _id}}
+    portfolio = simulated_portfolio(
+        test_dict,
+        STRATEGIES[0],
+        _id,
+        100_000,
+        START_STOCK_PRCT,
+        UNIT_STRAT,
+        UNIT_VAR,
+        TAC,
+    )
+    assert portfolio["value"].iloc[0] == pytest.approx(100_000)
+    assert list(portfolio["units"].columns) == [id.split(".")[0] for id in _id]
+
+
+@pytest.mark.parametrize(
+    ("unit_strat", "unit_var"),
+    [
+        ("fixed_trade_units", 1),
+        ("percentage_to_value_trades", 0.05),
+        ("volatility_unit_trades", 0.5),
+    ],
+)
+def test_single_asset_portfolio_equals_depot(unit_strat, unit_var):
+    """Test if a portfolio of one asset has the balances of its depot."""
+    cash, units, value = np.zeros((3, len(close)))
+    _simulate_asset(
+        signal,
+        pd.DataFrame({"Close": close}),
+        cash,
+        units,
+        value,
+        10_000,
+        0.25,
+        unit_strat,
+        unit_var,
+        0.0005,
+        "kernel",
+        20,
+    )
+    out = _simulate_portfolio(
+        close[:, None],
+        signal[:, None],
+        10_000,
+        0.25,
+        unit_strat,
+        unit_var,
+        0.0005,
+        20,
+    )
+    np.testing.assert_array_equal(out[0], cash)
+    np.testing.assert_array_equal(out[1][:, 0], units)
+    np.testing.assert_array_equal(out[2], value)
+
+
+def test_simultaneous_buys_in_column_order():
+    """Test if buys are executed in column order until the shared cash runs out."""
+    prices = np.full((2, 3), 10.0)
+    cash, units, _ = _simulate_portfolio(
+        prices,
+        np.array([[0, 0, 0], [1, 1, 1]], dtype=np.int8),
+        100,
+        0.3,
+        "fixed_trade_units",
+        1,
+        0,
+    )
+    # Every asset gets one unit initially, which leaves cash for 7 more units
+    np.testing.assert_array_equal(units[1], [2, 2, 2])
+    assert cash[1] == 40
+
+    cash, units, _ = _simulate_portfolio(
+        np.array([[10.0, 10.0, 50.0], [10.0, 90.0, 10.0]]),
+        np.array([[0, 0, 0], [0, 1, 1]], dtype=np.int8),
+        100,
+        0.5,
+        "fixed_trade_units",
+        1,
+        0,
+    )
+    # The second asset is too expensive, so the third is skipped as well
+    np.testing.assert_array_equal(units[1], units[0])
+
+
+def test_sells_before_buys():
+    """Test if cash from sells at a time step is available for buys."""
+    cash, units, _ = _simulate_portfolio(
+        np.array([[10.0, 10.0], [10.0, 10.0]]),
+        np.array([[0, 0], [1, 2]], dtype=np.int8),
+        20,
+        1,
+        "fixed_trade_units",
+        1,
+        0,
+    )
+    np.testing.assert_array_equal(units[1], [2, 0])
+    assert cash[1] == 0
+
+
+def test_missing_prices_do_not_trade():
+    """Test if an asset without a price does not trade and keeps its last price."""
+    prices = np.array([[10.0, 10.0], [12.0, np.nan], [12.0, 20.0]])
+    cash, units, value = _simulate_portfolio(
+        prices,
+        np.array([[0, 0], [0, 2], [0, 0]], dtype=np.int8),
+        100,
+        0.2,
+        "fixed_trade_units",
+        1,
+        0,
+    )
+    np.testing.assert_array_equal(units[:, 1], [1, 1, 1])
+    np.testing.assert_array_equal(value, [100, 102, 112])
+
+
+# Test simulated_portfolio error handling
+def test_handle_errors_portfolio_id():
+    with pytest.raises(TypeError):
+        _handle_errors_portfolio_id("1d_DB.pkl")
+    with pytest.raises(ValueError):
+        _handle_errors_portfolio_id([])
+    with pytest.raises(ValueError):
+        _handle_errors_portfolio_id(["1d_DB.pkl", "60m_DB.pkl"])
@@ -0,0 +1,92 @@
+""""Test for the streaming depot."""
+import numpy as np
+import pandas as pd
+import pytest
+from tradingstrattester.analysis.simulated_depot import _simulate_asset
+from tradingstrattester.analysis.streaming_depot import StreamingDepot
+from tradingstrattester.analysis.streaming_signals import StreamingRSI
+
+rng = np.random.default_rng(0)
+close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 1000)))
+data = pd.DataFrame({"Close": close})
+signal = rng.choice([0, 1, 2], size=len(data), p=[0.6, 0.2, 0.2]).astype(np.int8)
+
+unit_strat_var = [
+    ("fixed_trade_units", 1),
+    ("percentage_to_value_trades", 0.05),
+    ("volatility_unit_trades", 0.5),
+]
+
+
+def _batch_balances(signal, unit_strat, unit_var):
+    cash, units, value = np.zeros((3, len(signal)))
+    _simulate_asset(
+        signal,
+        data,
+        cash,
+        units,
+        value,
+        10_000,
+        0.25,
+        unit_strat,
+        unit_var,
+        0.0005,
+        "kernel",
+        20,
+    )
+    return cash, units, value
+
+
+# Test streaming depot outcomes
+@pytest.mark.parametrize(("unit_strat", "unit_var"), unit_strat_var)
+def test_streaming_depot_matches_simulated_depot(unit_strat, unit_var):
+    """Test if a stream of events returns the balances of the batch simulation."""
+    depot = StreamingDepot(10_000, 0.25, unit_strat, unit_var, 0.0005, vol_window=20)
+    states = [
+        depot.update("60m_DB", bar, sig)
+        for bar, sig in zip(data.to_dict("records"), signal, strict=True)
+    ]
+    cash, units, value = _batch_balances(signal, unit_strat, unit_var)
+
+    np.testing.assert_array_equal([state["cash"] for state in states], cash)
+    np.testing.assert_array_equal([state["units"] for state in states], units)
+    np.testing.assert_array_equal([state["value"] for state in states], value)
+    assert states[-1]["step"] == len(data) - 1
+
+
+def test_streaming_depot_returns_new_states():
+    """Test if returned states are not changed by later events."""
+    depot = StreamingDepot(10_000, 0.25, "fixed_trade_units", 1, 0.0005)
+    states = [
+        depot.update("60m_DB", bar, sig)
+        for bar, sig in zip(data.to_dict("records")[:4], signal[:4], strict=True)
+    ]
+    assert [state["step"] for state in states] == [0, 1, 2, 3]
+    states[-1]["cash"] = -1.0
+    assert depot.states["60m_DB"]["cash"] != -1.0
+
+
+def test_streaming_depot_after_streaming_signals():
+    """Test if the depot can be chained after a streaming signal generator and keeps
+    the assets apart.
+    """
+    depot = StreamingDepot(10_000, 0.25, "percentage_to_value_trades", 0.05, 0.0005)
+    rsi = StreamingRSI()
+    signals = []
+    for bar in data.to_dict("records"):
+        signals.append(rsi.update(bar))
+        depot.update("60m_DB", bar, signals[-1])
+        depot.update("1d_DB", {"Close": 100.0}, 0)
+
+    _, _, value = _batch_balances(signals, "percentage_to_value_trades", 0.05)
+    balances = depot.balances()
+    assert balances["value_dict"]["60m_DB"] == value[-1]
+    assert balances["value_dict"]["1d_DB"] == 10_000
+
+
+# Test streaming depot error handling
+def test_streaming_depot_errors():
+    with pytest.raises(ValueError):
+        StreamingDepot(10_000, 0.25, "typo", 0.05, 0.0005)
+    with pytest.raises(TypeError):
+        StreamingDepot(10_000, 0.25, "fixed_trade_units", 1, 0.0005, vol_window=1.5)
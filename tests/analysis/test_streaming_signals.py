@@ -0,0 +1,73 @@
+""""Test for the streaming signal generators."""
+import numpy as np
+import pandas as pd
+import pytest
+from tradingstrattester.analysis.signaling_functions import _macd, signal_list
+from tradingstrattester.analysis.streaming_signals import (
+    StreamingMACD,
+    streaming_signal_generator,
+)
+
+rng = np.random.default_rng(0)
+close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 2000)))
+open_price = close * np.exp(rng.normal(0, 0.005, 2000))
+data = pd.DataFrame(
+    {
+        "Open": open_price,
+        "High": np.maximum(open_price, close),
+        "Low": np.minimum(open_price, close),
+        "Close": close,
+    },
+)
+# A constant stretch and missing prices as edge cases of the rolling windows
+data.loc[500:560, "Close"] = data.Close[500]
+data.loc[900:902, "Close"] = np.nan
+
+generator_kwargs = [
+    ("_crossover_gen", {}),
+    ("_RSI_gen", {}),
+    ("_RSI_gen", {"rsi_threshold_low": 40, "rsi_threshold_high": 60, "period": 5}),
+    ("_BB_gen", {}),
+    ("_BB_gen", {"window": 5, "num_std_dev": 0.5}),
+    ("_MACD_gen", {}),
+    ("_MACD_gen", {"fast_period": 3, "slow_period": 7, "signal_period": 4}),
+]
+
+
+def _replay(stream, data):
+    return np.array([stream.update(bar) for bar in data.to_dict("records")])
+
+
+# Test streaming signal generator outcomes
+@pytest.mark.parametrize(("generator", "kwargs"), generator_kwargs)
+def test_streaming_replay_matches_signal_list(generator, kwargs):
+    """Test if replaying the data bar by bar returns the signals of signal_list()."""
+    stream_kwargs = dict(kwargs)
+    if generator == "_MACD_gen":
+        stream_kwargs["macd_std"] = _macd(
+            data.Close,
+            kwargs.get("fast_period", 12),
+            kwargs.get("slow_period", 26),
+            kwargs.get("signal_period", 9),
+        )[2]
+
+    stream = streaming_signal_generator(generator, **stream_kwargs)
+    expected = signal_list(data, generator, as_array=True, **kwargs)
+    np.testing.assert_array_equal(_replay(stream, data), expected)
+
+
+def test_streaming_macd_without_macd_std():
+    """Test if the MACD generator works with the standard deviation up to each bar."""
+    signal = _replay(StreamingMACD(), data)
+    assert set(np.unique(signal)) <= {0, 1, 2}
+    assert (signal[:25] == 0).all()
+
+
+# Test streaming signal generator error handling
+def test_streaming_signal_generator_errors():
+    with pytest.raises(ValueError):
+        streaming_signal_generator("_random_gen")
+    with pytest.raises(ValueError):
+        streaming_signal_generator("_RSI_gen", rsi_threshold_low=80)
+    with pytest.raises(ValueError):
+        streaming_signal_generator("_BB_gen", num_std_dev=-1)
@@ -0,0 +1,196 @@
+""""Test for the alignment and resampling functions."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+from tradingstrattester.data_management.alignment import (
+    _handle_errors_align_prices,
+    _handle_errors_coarser_frequency,
+    _handle_errors_resample_prices,
+    align_prices,
+    derive_prices,
+    resample_prices,
+    split_frequencies,
+)
+from tradingstrattester.data_management.price_store import write_prices
+
+# Two trading days of hourly bars in New York
+index = pd.date_range("2024-01-05 09:30", periods=7, freq="h", tz="America/New_York")
+index = index.append(index + pd.Timedelta(days=3))
+hourly = pd.DataFrame(
+    {
+        "Open": np.arange(14, dtype=float),
+        "High": np.arange(14, dtype=float) + 2,
+        "Low": np.arange(14, dtype=float) - 1,
+        "Close": np.arange(14, dtype=float) + 0.5,
+        "Volume": np.ones(14, dtype=np.int64),
+    },
+    index=index.rename("Datetime"),
+)
+
+
+def _daily(dates, tz, close):
+    return pd.DataFrame(
+        {"Close": close},
+        index=pd.DatetimeIndex(dates, name="Date").tz_localize(tz),
+    )
+
+
+# Test resampling outcomes
+def test_resample_prices_to_daily_bars():
+    """Test if hourly bars are aggregated to one OHLCV bar per local day."""
+    out = resample_prices(hourly, "1d")
+    expected = pd.DataFrame(
+        {
+            "Open": [0.0, 7.0],
+            "High": [8.0, 15.0],
+            "Low": [-1.0, 6.0],
+            "Close": [6.5, 13.5],
+            "Volume": [7, 7],
+        },
+        index=pd.DatetimeIndex(
+            ["2024-01-05", "2024-01-08"],
+            name="Datetime",
+        ).tz_localize("America/New_York"),
+    )
+    pd.testing.assert_frame_equal(out, expected, check_freq=False)
+
+
+def test_resample_prices_to_weekly_bars():
+    """Test if weekly bars start on Monday like the bars of yfinance."""
+    out = resample_prices(hourly, "1wk")
+    assert list(out.index.dayofweek) == [0, 0]
+    assert list(out.Volume) == [7, 7]
+
+
+def test_derive_prices_from_price_store(tmp_path):
+    """Test if coarser bars are derived from the stored bars."""
+    write_prices(hourly, "60m_DB.pkl", tmp_path)
+    pd.testing.assert_frame_equal(
+        derive_prices("60m_DB.pkl", "1d", tmp_path),
+        resample_prices(hourly, "1d"),
+    )
+
+
+def test_split_frequencies():
+    assert split_frequencies(["60m", "1d", "1wk"], ["1wk"]) == (["60m", "1d"], "60m")
+    assert split_frequencies(["1d", "1wk"], []) == (["1d", "1wk"], "1d")
+
+
+# Test alignment outcomes
+def test_align_prices_union_and_intersection(tmp_path):
+    """Test if daily bars of exchanges in different time zones are aligned on their
+    dates.
+    """
+    write_prices(
+        _daily(["2024-01-01", "2024-01-02"], "Europe/London", [1.0, 2.0]),
+        "1d_EURUSD=X.pkl",
+        tmp_path,
+    )
+    write_prices(
+        _daily(["2024-01-02", "2024-01-03"], "America/New_York", [3.0, 4.0]),
+        "1d_DB.pkl",
+        tmp_path,
+    )
+    _id = ["1d_EURUSD=X.pkl", "1d_DB.pkl"]
+
+    union = align_prices(_id, root=tmp_path, cache=tmp_path / "aligned")
+    expected = pd.DataFrame(
+        {"1d_EURUSD=X": [1.0, 2.0, np.nan], "1d_DB": [np.nan, 3.0, 4.0]},
+        index=pd.DatetimeIndex(["2024-01-01", "2024-01-02", "2024-01-03"]),
+    )
+    pd.testing.assert_frame_equal(union, expected, check_names=False)
+
+    intersection = align_prices(
+        _id,
+        how="intersection",
+        root=tmp_path,
+        cache=tmp_path / "aligned",
+    )
+    pd.testing.assert_frame_equal(intersection, expected.iloc[[1]], check_names=False)
+
+
+def test_align_prices_cache(tmp_path):
+    """Test if the aligned matrix is read from the cache and rebuilt after an asset was
+    written again.
+    """
+    write_prices(_daily(["2024-01-01"], None, [1.0]), "1d_DB.pkl", tmp_path)
+    first = align_prices(["1d_DB.pkl"], root=tmp_path, cache=tmp_path / "aligned")
+    cached = align_prices(["1d_DB.pkl"], root=tmp_path, cache=tmp_path / "aligned")
+    assert not cached["1d_DB"].to_numpy().flags.writeable
+    pd.testing.assert_frame_equal(first, cached)
+
+    write_prices(_daily(["2024-01-01"], None, [5.0]), "1d_DB.pkl", tmp_path)
+    rebuilt = align_prices(["1d_DB.pkl"], root=tmp_path, cache=tmp_path / "aligned")
+    assert rebuilt["1d_DB"].iloc[0] == 5.0
+
+
+def test_align_prices_concurrent(tmp_path):
+    """Test if concurrent calls read complete matrices and keep one cached version."""
+    write_prices(_daily(["2024-01-01"], None, [1.0]), "1d_DB.pkl", tmp_path)
+    cache = tmp_path / "aligned"
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        out = list(
+            executor.map(
+                lambda _: align_prices(["1d_DB.pkl"], root=tmp_path, cache=cache),
+                range(32),
+            ),
+        )
+    assert all(aligned["1d_DB"].iloc[0] == 1.0 for aligned in out)
+
+    write_prices(_daily(["2024-01-01"], None, [5.0]), "1d_DB.pkl", tmp_path)
+    align_prices(["1d_DB.pkl"], root=tmp_path, cache=cache)
+    (entry,) = cache.iterdir()
+    assert len(list(entry.iterdir())) == 1
+
+
+def test_align_prices_intraday_in_utc(tmp_path):
+    """Test if intraday bars of different time zones are aligned on the same instant."""
+    london = hourly.tz_convert("Europe/London")
+    write_prices(hourly, "60m_DB.pkl", tmp_path)
+    write_prices(london, "60m_EURUSD=X.pkl", tmp_path)
+    out = align_prices(
+        ["60m_DB.pkl", "60m_EURUSD=X.pkl"],
+        how="intersection",
+        root=tmp_path,
+        cache=tmp_path / "aligned",
+    )
+    assert len(out) == len(hourly)
+
+
+# Test alignment error handling
+@pytest.mark.parametrize(
+    ("_id", "column", "how", "expected_error"),
+    [
+        ("1d_DB.pkl", "Close", "union", TypeError),
+        ([], "Close", "union", ValueError),
+        (["1d_DB.pkl", "60m_KO.pkl"], "Close", "union", ValueError),
+        (["1d_DB.pkl"], 1, "union", TypeError),
+        (["1d_DB.pkl"], "Close", "outer", ValueError),
+    ],
+)
+def test_handle_errors_align_prices(_id, column, how, expected_error):
+    with pytest.raises(expected_error):
+        _handle_errors_align_prices(_id, column, how)
+
+
+def test_handle_errors_resample_prices():
+    with pytest.raises(TypeError):
+        _handle_errors_resample_prices(hourly.Close, "1d")
+    with pytest.raises(TypeError):
+        _handle_errors_resample_prices(hourly.reset_index(drop=True), "1d")
+    with pytest.raises(ValueError):
+        _handle_errors_resample_prices(hourly, "1y")
+
+
+def test_handle_errors_coarser_frequency():
+    with pytest.raises(ValueError):
+        _handle_errors_coarser_frequency("1d", "60m")
+    with pytest.raises(ValueError):
+        _handle_errors_coarser_frequency("1d", "1d")
+    with pytest.raises(ValueError):
+        split_frequencies(["1d"], ["1d"])
+    with pytest.raises(ValueError):
+        split_frequencies(["1d", "1wk"], ["1mo"])
@@ -2,14 +2,37 @@
 
 from datetime import date, timedelta
 
+import numpy as np
 import pandas as pd
 import pytest
 from tradingstrattester.config import ASSETS
 from tradingstrattester.data_management.data_functions import (
     _define_dates,
+    _handle_errors_bulk_data_download,
     _handle_errors_data_download,
+    _handle_errors_fetcher,
+    _missing_ranges,
+    _split_batch,
+    bulk_data_download,
+    cached_data_download,
     data_download,
 )
+from tradingstrattester.data_management.price_store import read_coverage
+
+
+def _fetcher_stub(calls):
+    """Offline replacement for Yahoo Finance returning one row per day."""
+
+    def fetcher(symbol, start_date, end_date, frequency):
+        calls.append((start_date, end_date))
+        if symbol == "INVALID":
+            return pd.DataFrame()
+        index = pd.date_range(start_date, end_date, freq="D", inclusive="left")
+        index = pd.DatetimeIndex(index, freq=None, name="Date")
+        close = np.asarray(index.day, dtype=float)
+        return pd.DataFrame({"Close": close, "Volume": close * 10}, index=index)
+
+    return fetcher
 
 
 # Test data_download
@@ -25,6 +48,306 @@ def test_is_pd_DataFrame_data_download(assets):
     assert isinstance(data_download(assets, "60m"), pd.core.frame.DataFrame)
 
 
+def test_data_download_with_fetcher():
+    """Test if data_download() uses a given fetcher instead of Yahoo Finance."""
+    calls = []
+    out = data_download("DB", "1d", "2024-01-01", "2024-01-11", _fetcher_stub(calls))
+    assert calls == [("2024-01-01", "2024-01-11")]
+    assert len(out) == 10
+
+
+# Test cached_data_download
+def test_cached_data_download_fetches_only_gaps(tmp_path):
+    """Test if only date ranges missing in the cache are fetched."""
+    calls = []
+    fetcher = _fetcher_stub(calls)
+    first = cached_data_download(
+        "DB",
+        "1d",
+        "2024-01-10",
+        "2024-01-20",
+        tmp_path,
+        fetcher,
+    )
+    again = cached_data_download(
+        "DB",
+        "1d",
+        "2024-01-12",
+        "2024-01-18",
+        tmp_path,
+        fetcher,
+    )
+    wider = cached_data_download(
+        "DB",
+        "1d",
+        "2024-01-01",
+        "2024-01-31",
+        tmp_path,
+        fetcher,
+    )
+
+    assert calls == [
+        ("2024-01-10", "2024-01-20"),
+        ("2024-01-01", "2024-01-10"),
+        ("2024-01-20", "2024-01-31"),
+    ]
+    pd.testing.assert_frame_equal(again, first.iloc[2:8])
+    pd.testing.assert_frame_equal(
+        wider,
+        fetcher("DB", "2024-01-01", "2024-01-31", "1d"),
+    )
+
+
+def test_cached_data_download_respects_max_days(tmp_path):
+    """Test if the requested range is limited to the lookback of the frequency."""
+    calls = []
+    with pytest.warns(UserWarning):
+        expected = _define_dates("60m", "2000-01-01")
+        cached_data_download(
+            "DB",
+            "60m",
+            "2000-01-01",
+            None,
+            tmp_path,
+            _fetcher_stub(calls),
+        )
+    assert calls == [expected]
+
+
+def test_cached_data_download_failed_fetch(tmp_path):
+    """Test if dates without fetched rows are not recorded as cached."""
+    calls = []
+    fetcher = _fetcher_stub(calls)
+    cached_data_download("DB", "1d", "2024-01-01", "2024-01-11", tmp_path, fetcher)
+
+    def failed_fetcher(symbol, start_date, end_date, frequency):
+        return fetcher(symbol, start_date, "2024-01-15", frequency)
+
+    out = cached_data_download(
+        "DB",
+        "1d",
+        "2024-01-01",
+        "2024-02-01",
+        tmp_path,
+        failed_fetcher,
+    )
+    assert len(out) == 14
+    assert read_coverage("1d_DB.pkl", tmp_path) == [("2024-01-01", "2024-01-15")]
+
+    cached_data_download(
+        "DB",
+        "1d",
+        "2024-01-01",
+        "2024-02-01",
+        tmp_path,
+        lambda *args: pd.DataFrame(),
+    )
+    assert read_coverage("1d_DB.pkl", tmp_path) == [("2024-01-01", "2024-01-15")]
+
+    out = cached_data_download(
+        "DB",
+        "1d",
+        "2024-01-01",
+        "2024-02-01",
+        tmp_path,
+        fetcher,
+    )
+    assert calls[-1] == ("2024-01-15", "2024-02-01")
+    assert len(out) == 31
+
+
+def test_cached_data_download_invalid_symbol(tmp_path):
+    """Test if an invalid symbol raises and is not recorded as cached."""
+    calls = []
+    for _ in range(2):
+        with pytest.raises(TypeError):
+            cached_data_download(
+                "INVALID",
+                "1d",
+                "2024-01-01",
+                "2024-01-05",
+                tmp_path,
+                _fetcher_stub(calls),
+            )
+    assert len(calls) == 2
+
+
+def test__missing_ranges():
+    coverage = [("2024-01-05", "2024-01-10"), ("2024-01-15", "2024-01-20")]
+    assert _missing_ranges(coverage, "2024-01-01", "2024-01-31") == [
+        ("2024-01-01", "2024-01-05"),
+        ("2024-01-10", "2024-01-15"),
+        ("2024-01-20", "2024-01-31"),
+    ]
+    assert _missing_ranges(coverage, "2024-01-06", "2024-01-09") == []
+
+
+def test__handle_errors_fetcher():
+    with pytest.raises(TypeError):
+        _handle_errors_fetcher("yfinance")
+
+
+# Test bulk_data_download
+def _batch_fetcher_stub(calls, failures=0):
+    """Offline replacement for batched Yahoo Finance requests, which raises the
+    given number of times before it succeeds.
+    """
+    fetcher = _fetcher_stub([])
+
+    def batch_fetcher(symbols, start_date, end_date, frequency):
+        calls.append((tuple(symbols), start_date, end_date, frequency))
+        if len(calls) <= failures:
+            raise ConnectionError
+        return pd.concat(
+            {
+                symbol: fetcher(symbol, start_date, end_date, frequency)
+                for symbol in symbols
+            },
+            axis=1,
+        )
+
+    return batch_fetcher
+
+
+def test_bulk_data_download_batches_and_caches(tmp_path):
+    """Test if symbols are fetched in batches and cached data is not fetched again."""
+    calls = []
+    kwargs = {
+        "start_date": "2024-01-01",
+        "end_date": "2024-01-11",
+        "root": tmp_path,
+        "batch_size": 2,
+        "fetcher": _batch_fetcher_stub(calls),
+    }
+    out = bulk_data_download(["DB", "KO", "CL=F"], ["1d", "1wk"], **kwargs)
+    assert sorted(calls) == [
+        (("CL=F",), "2024-01-01", "2024-01-11", "1d"),
+        (("CL=F",), "2024-01-01", "2024-01-11", "1wk"),
+        (("DB", "KO"), "2024-01-01", "2024-01-11", "1d"),
+        (("DB", "KO"), "2024-01-01", "2024-01-11", "1wk"),
+    ]
+    assert list(out) == [
+        "1d_DB.pkl",
+        "1d_KO.pkl",
+        "1d_CL=F.pkl",
+        "1wk_DB.pkl",
+        "1wk_KO.pkl",
+        "1wk_CL=F.pkl",
+    ]
+    expected = _fetcher_stub([])("KO", "2024-01-01", "2024-01-11", "1d")
+    pd.testing.assert_frame_equal(out["1d_KO.pkl"], expected)
+
+    again = bulk_data_download(["DB", "KO", "CL=F"], ["1d", "1wk"], **kwargs)
+    assert len(calls) == 4
+    pd.testing.assert_frame_equal(again["1d_KO.pkl"], expected)
+
+
+def test_bulk_data_download_retries(tmp_path):
+    """Test if failed requests are retried and raise after the last retry."""
+    calls = []
+    out = bulk_data_download(
+        ["DB"],
+        ["1d"],
+        "2024-01-01",
+        "2024-01-05",
+        tmp_path,
+        retries=2,
+        backoff=0,
+        fetcher=_batch_fetcher_stub(calls, failures=2),
+    )
+    assert len(calls) == 3
+    assert len(out["1d_DB.pkl"]) == 4
+
+    with pytest.raises(ConnectionError):
+        bulk_data_download(
+            ["KO"],
+            ["1d"],
+            "2024-01-01",
+            "2024-01-05",
+            tmp_path,
+            retries=1,
+            backoff=0,
+            fetcher=_batch_fetcher_stub([], failures=2),
+        )
+
+
+def test_bulk_data_download_retries_empty_symbols(tmp_path):
+    """Test if symbols without data are retried, as failed downloads of Yahoo Finance
+    return no data instead of raising.
+    """
+    calls = []
+    batch_fetcher = _batch_fetcher_stub(calls)
+
+    def fetcher(symbols, start_date, end_date, frequency):
+        data = batch_fetcher(symbols, start_date, end_date, frequency)
+        if len(calls) == 1:
+            data.loc[:, "KO"] = float("nan")
+        return data
+
+    with pytest.raises(TypeError):
+        bulk_data_download(
+            ["DB", "KO", "INVALID"],
+            ["1d"],
+            "2024-01-01",
+            "2024-01-05",
+            tmp_path,
+            retries=2,
+            backoff=0,
+            fetcher=fetcher,
+        )
+    assert [call[0] for call in calls] == [
+        ("DB", "KO", "INVALID"),
+        ("KO", "INVALID"),
+        ("INVALID",),
+    ]
+    assert read_coverage("1d_KO.pkl", tmp_path) == [("2024-01-01", "2024-01-05")]
+    assert read_coverage("1d_INVALID.pkl", tmp_path) == []
+
+
+def test__split_batch():
+    data = _fetcher_stub([])("DB", "2024-01-01", "2024-01-05", "1d")
+    batch = pd.concat({"DB": data}, axis=1)
+    assert _split_batch(batch, ["DB", "INVALID"])["INVALID"].empty
+    pd.testing.assert_frame_equal(_split_batch(batch, ["DB"])["DB"], data)
+    pd.testing.assert_frame_equal(_split_batch(data, ["DB"])["DB"], data)
+
+
+@pytest.mark.parametrize(
+    ("assets", "frequencies", "batch_size", "max_workers", "retries", "backoff"),
+    [
+        ([], ["1d"], 1, 1, 0, 0),
+        (["DB"], ["1d"], 0, 1, 0, 0),
+        (["DB"], ["1d"], 1, 0, 0, 0),
+        (["DB"], ["1d"], 1, 1, -1, 0),
+        (["DB"], ["1d"], 1, 1, 0, -1),
+    ],
+)
+def test__handle_errors_bulk_data_download_value_error(
+    assets,
+    frequencies,
+    batch_size,
+    max_workers,
+    retries,
+    backoff,
+):
+    with pytest.raises(ValueError):
+        _handle_errors_bulk_data_download(
+            assets,
+            frequencies,
+            batch_size,
+            max_workers,
+            retries,
+            backoff,
+        )
+
+
+def test__handle_errors_bulk_data_download_type_error():
+    with pytest.raises(TypeError):
+        _handle_errors_bulk_data_download("DB", ["1d"], 1, 1, 0, 0)
+    with pytest.raises(TypeError):
+        _handle_errors_bulk_data_download(["DB"], ["1d"], 1.5, 1, 0, 0)
+
+
 # Test _define_dates
 valid_value_start = [
     "2023-01-01",
@@ -0,0 +1,145 @@
+""""Test for the price store functions."""
+
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+from tradingstrattester.data_management import price_store
+from tradingstrattester.data_management.price_store import (
+    _appended_npy_header,
+    _handle_errors_price_data,
+    _handle_errors_price_id,
+    append_prices,
+    price_store_part,
+    price_store_path,
+    read_price_view,
+    read_prices,
+    stored_prices_equal,
+    write_prices,
+)
+
+data = pd.DataFrame(
+    np.arange(40, dtype=float).reshape(10, 4),
+    index=pd.DatetimeIndex(
+        pd.date_range("2024-01-01", periods=10, freq="h"),
+        freq=None,
+        name="Datetime",
+    ),
+    columns=["Open", "High", "Low", "Close"],
+)
+
+
+# Test price store outcomes
+def test_write_and_read_prices(tmp_path):
+    """Test if written data is read unchanged."""
+    write_prices(data, "60m_EURUSD=X.pkl", tmp_path)
+    pd.testing.assert_frame_equal(read_prices("60m_EURUSD=X.pkl", root=tmp_path), data)
+
+
+def test_read_prices_column_projection(tmp_path):
+    """Test if only the selected columns and the index are read."""
+    write_prices(data, "1d_DB.pkl", tmp_path)
+    out = read_prices("1d_DB.pkl", columns=["Close"], root=tmp_path)
+    pd.testing.assert_frame_equal(out, data[["Close"]])
+
+
+def test_append_prices(tmp_path):
+    """Test if only new rows are appended as new part files."""
+    write_prices(data.iloc[:6], "1d_DB.pkl", tmp_path)
+    assert append_prices(data.iloc[4:], "1d_DB.pkl", tmp_path) == price_store_part(
+        "1d_DB.pkl",
+        1,
+        tmp_path,
+    )
+    assert append_prices(data, "1d_DB.pkl", tmp_path) is None
+    pd.testing.assert_frame_equal(read_prices("1d_DB.pkl", root=tmp_path), data)
+
+
+def test_append_prices_extends_arrays(tmp_path, monkeypatch):
+    """Test if appended rows extend the memory-mapped arrays without reading the
+    stored data.
+    """
+    write_prices(data.iloc[:6], "1d_DB.pkl", tmp_path)
+    monkeypatch.setattr(price_store, "read_prices", None)
+    for end in [7, 10]:
+        append_prices(data.iloc[:end], "1d_DB.pkl", tmp_path)
+        pd.testing.assert_frame_equal(
+            read_price_view("1d_DB.pkl", root=tmp_path),
+            data.iloc[:end],
+        )
+
+
+def test_appended_npy_header(tmp_path):
+    """Test if arrays are only extended in place for values of the stored type."""
+    path = tmp_path / "values.npy"
+    np.save(path, np.arange(3.0))
+    header = io.BytesIO(_appended_npy_header(path, np.arange(2.0)))
+    np.lib.format.read_magic(header)
+    assert np.lib.format.read_array_header_1_0(header)[0] == (5,)
+    assert header.tell() == path.stat().st_size - 3 * 8
+    assert _appended_npy_header(path, np.arange(2, dtype=np.float32)) is None
+
+
+def test_write_prices_replaces_parts(tmp_path):
+    """Test if write_prices() replaces appended data."""
+    write_prices(data.iloc[:6], "1d_DB.pkl", tmp_path)
+    append_prices(data, "1d_DB.pkl", tmp_path)
+    write_prices(data.iloc[:3], "1d_DB.pkl", tmp_path)
+    assert len(list(price_store_path("1d_DB.pkl", tmp_path).glob("*.parquet"))) == 1
+    pd.testing.assert_frame_equal(read_prices("1d_DB.pkl", root=tmp_path), data[:3])
+
+
+def test_stored_prices_equal(tmp_path):
+    """Test if only data equal to the stored data is detected as unchanged."""
+    assert not stored_prices_equal(data, "1d_DB.pkl", tmp_path)
+    write_prices(data, "1d_DB.pkl", tmp_path)
+    assert stored_prices_equal(data.copy(), "1d_DB.pkl", tmp_path)
+    assert not stored_prices_equal(data.iloc[:6], "1d_DB.pkl", tmp_path)
+    assert not stored_prices_equal(data[["Close"]], "1d_DB.pkl", tmp_path)
+    assert not stored_prices_equal(data + 1, "1d_DB.pkl", tmp_path)
+
+
+def test_read_price_view(tmp_path):
+    """Test if the memory-mapped view equals the written and appended data."""
+    tz_data = data.tz_localize("Europe/Berlin")
+    write_prices(tz_data.iloc[:6], "60m_DB.pkl", tmp_path)
+    append_prices(tz_data, "60m_DB.pkl", tmp_path)
+    out = read_price_view("60m_DB.pkl", root=tmp_path)
+    pd.testing.assert_frame_equal(out, tz_data, check_freq=False)
+    pd.testing.assert_frame_equal(
+        read_price_view("60m_DB.pkl", columns=["Close"], root=tmp_path),
+        tz_data[["Close"]],
+        check_freq=False,
+    )
+
+
+def test_read_price_view_is_read_only(tmp_path):
+    """Test if the columns of the view are read-only memory maps."""
+    write_prices(data, "1d_DB.pkl", tmp_path)
+    close = read_price_view("1d_DB.pkl", ["Close"], tmp_path).Close.to_numpy()
+    assert not close.flags.writeable
+    assert np.shares_memory(close, close.base)
+
+
+def test_read_prices_missing_asset(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        read_prices("1d_DB.pkl", root=tmp_path)
+    with pytest.raises(FileNotFoundError):
+        read_price_view("1d_DB.pkl", root=tmp_path)
+
+
+def test_read_price_view_missing_column(tmp_path):
+    write_prices(data, "1d_DB.pkl", tmp_path)
+    with pytest.raises(ValueError):
+        read_price_view("1d_DB.pkl", columns=["Volume"], root=tmp_path)
+
+
+# Test price store error handling
+def test_handle_errors_price_store():
+    with pytest.raises(ValueError):
+        _handle_errors_price_id("DB.pkl")
+        _handle_errors_price_data(pd.DataFrame())
+    with pytest.raises(TypeError):
+        _handle_errors_price_id(1)
+        _handle_errors_price_data(data.to_numpy())
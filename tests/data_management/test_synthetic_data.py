@@ -0,0 +1,85 @@
+""""Test for the synthetic data functions."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from tradingstrattester.analysis.signaling_functions import signal_list
+from tradingstrattester.data_management.synthetic_data import (
+    _trading_calendar,
+    synthetic_data_download,
+    synthetic_prices,
+)
+
+models = ["gbm", "jump_diffusion", "regime_switching"]
+columns = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+
+
+# Test synthetic data outcomes
+@pytest.mark.parametrize("model", models)
+def test_synthetic_prices_shape(model):
+    """Test if the bars have the columns of data_download() and consistent prices."""
+    data = synthetic_prices(5_000, "60m", model=model)
+    assert list(data.columns) == columns
+    assert len(data) == 5_000
+    assert data.index.is_monotonic_increasing
+    assert data.index.name == "Datetime"
+    assert str(data.index.tz) == "America/New_York"
+    assert (data.High >= data[["Open", "Close"]].max(axis=1)).all()
+    assert (data.Low <= data[["Open", "Close"]].min(axis=1)).all()
+    assert (data.Volume > 0).all()
+    assert set(np.unique(signal_list(data, "_RSI_gen", as_array=True))) <= {0, 1, 2}
+
+
+def test_synthetic_prices_volatility():
+    """Test if the annualized volatility of GBM returns matches sigma."""
+    data = synthetic_prices(100_000, "1d", sigma=0.3, start_date="1800-01-01")
+    volatility = np.log(data.Close).diff().std() * np.sqrt(252)
+    assert volatility == pytest.approx(0.3, rel=0.02)
+
+
+def test_synthetic_data_download_reproducible():
+    """Test if the data is reproducible for a seed and differs between assets."""
+    first = synthetic_data_download("DB", "1d", "2020-01-01", "2021-01-01")
+    second = synthetic_data_download("DB", "1d", "2020-01-01", "2021-01-01")
+    other = synthetic_data_download("KO", "1d", "2020-01-01", "2021-01-01")
+    pd.testing.assert_frame_equal(first, second)
+    assert not np.allclose(first.Close, other.Close)
+    assert first.index.name == "Date"
+    assert first.index.dayofweek.max() < 5
+
+
+def test_synthetic_data_download_intraday_session():
+    """Test if intraday bars lie in the trading session."""
+    data = synthetic_data_download("DB", "60m", "2024-03-08", "2024-03-13", seed=1)
+    assert len(data) == 3 * 7
+    assert data.index[0] == pd.Timestamp("2024-03-08 09:30", tz="America/New_York")
+    # The bars follow the daylight saving time change of March 10
+    assert data.index[7] == pd.Timestamp("2024-03-11 09:30", tz="America/New_York")
+    assert data.index[-1] == pd.Timestamp("2024-03-12 15:30", tz="America/New_York")
+
+
+@pytest.mark.parametrize(
+    ("frequency", "rule"),
+    [("1d", "B"), ("5d", "5B"), ("1wk", "W-MON"), ("1mo", "MS"), ("3mo", "QS")],
+)
+def test_trading_calendar_matches_pandas(frequency, rule):
+    for start_date in ["2018-01-01", "2019-02-16", "2020-03-31"]:
+        expected = pd.date_range(start_date, "2024-03-01", freq=rule, inclusive="left")
+        out = _trading_calendar(frequency, start_date, end_date="2024-03-01")
+        np.testing.assert_array_equal(out, expected)
+
+
+# Test synthetic data error handling
+def test_synthetic_data_errors():
+    with pytest.raises(ValueError):
+        synthetic_prices(100, model="heston")
+    with pytest.raises(ValueError):
+        synthetic_prices(0)
+    with pytest.raises(TypeError):
+        synthetic_prices(10.5)
+    with pytest.raises(ValueError):
+        synthetic_prices(100, frequency="1y")
+    with pytest.raises(TypeError):
+        synthetic_prices(100, mu=0.1, volatility=0.2)
+    with pytest.raises(ValueError):
+        synthetic_data_download("DB", "1d", "2021-01-01", None)